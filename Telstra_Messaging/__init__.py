@@ -29,6 +29,11 @@ from Telstra_Messaging.exceptions import ApiTypeError
 from Telstra_Messaging.exceptions import ApiValueError
 from Telstra_Messaging.exceptions import ApiKeyError
 from Telstra_Messaging.exceptions import ApiException
+from Telstra_Messaging.exceptions import CircuitOpenException
+from Telstra_Messaging.exceptions import QuotaExhaustedException
+from Telstra_Messaging.circuit_breaker import CircuitBreakerRegistry
+from Telstra_Messaging.retry import RetryPolicy
+from Telstra_Messaging.oauth import TokenManager
 # import models into sdk package
 from Telstra_Messaging.models.delete_number_request import DeleteNumberRequest
 from Telstra_Messaging.models.get_mms_response import GetMmsResponse
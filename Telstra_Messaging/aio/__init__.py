@@ -0,0 +1,22 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+    Telstra Messaging API
+
+    asyncio client stack. Requires Python 3.5+ and aiohttp
+    (`pip install Telstra_Messaging[asyncio]`).
+"""
+
+
+from __future__ import absolute_import
+
+# import apis into aio package
+from Telstra_Messaging.aio.api.authentication_api import AuthenticationApi
+from Telstra_Messaging.aio.api.messaging_api import MessagingApi
+from Telstra_Messaging.aio.api.provisioning_api import ProvisioningApi
+
+# import AsyncApiClient
+from Telstra_Messaging.aio.api_client import AsyncApiClient
+from Telstra_Messaging.aio.oauth import AsyncTokenManager
@@ -0,0 +1,8 @@
+from __future__ import absolute_import
+
+# flake8: noqa
+
+# import apis into aio api package
+from Telstra_Messaging.aio.api.authentication_api import AuthenticationApi
+from Telstra_Messaging.aio.api.messaging_api import MessagingApi
+from Telstra_Messaging.aio.api.provisioning_api import ProvisioningApi
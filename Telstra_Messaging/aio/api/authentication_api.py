@@ -0,0 +1,27 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from Telstra_Messaging.aio.api_client import AsyncApiClient
+from Telstra_Messaging.api import authentication_api
+
+
+class AuthenticationApi(authentication_api.AuthenticationApi):
+    """asyncio variant of :class:`Telstra_Messaging.AuthenticationApi`.
+
+    Operations take the same arguments as the blocking API but return a
+    coroutine that resolves to the same models.
+    """
+
+    def __init__(self, api_client=None):
+        if api_client is None:
+            api_client = AsyncApiClient()
+        self.api_client = api_client
@@ -0,0 +1,226 @@
+# coding: utf-8
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+
+import aiohttp
+
+from Telstra_Messaging.api_client import ApiClient
+from Telstra_Messaging.aio import rest
+from Telstra_Messaging.exceptions import ApiException, ApiValueError
+
+# connection level failures that a RetryPolicy may replay
+CONNECTION_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+
+class AsyncApiClient(ApiClient):
+    """asyncio variant of :class:`Telstra_Messaging.ApiClient`.
+
+    Requests are built and responses deserialized exactly as in `ApiClient`,
+    but I/O is performed with aiohttp on the running event loop, so many
+    requests can be in flight from a single thread. `call_api` returns a
+    coroutine; the `async_req` argument is accepted and ignored.
+
+    The client owns an `aiohttp.ClientSession`; close it with `await
+    client.close()` or use the client as an async context manager.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    def __init__(self, configuration=None, header_name=None,
+                 header_value=None, cookie=None):
+        super(AsyncApiClient, self).__init__(configuration, header_name,
+                                             header_value, cookie)
+
+    def _create_rest_client(self, configuration, transport=None):
+        return rest.RESTClientObject(configuration)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        await self.rest_client.close()
+
+    async def warm_up(self, connections=None,
+                      resource_path='/messages/sms/healthcheck'):
+        """Opens keep-alive connections to `configuration.host` before
+        traffic arrives.
+
+        `connections` requests are sent to `resource_path` (the
+        unauthenticated SMS health check by default) concurrently, so that
+        the session opens a connection for each of them and keeps them
+        alive.
+
+        :param connections: number of connections to keep open, defaults to
+            `configuration.connection_pool_maxsize`, capped at the
+            connection limit of the session.
+        :param resource_path: path of the warming requests.
+        :return: number of connections opened, not counting the ones that
+            were already open.
+        """
+        rest_client = self.rest_client
+        if connections is None:
+            connections = self.configuration.connection_pool_maxsize or 1
+        connections = min(connections, rest_client.maxsize)
+        url = self.configuration.host + resource_path
+        opened = rest_client.connections_opened
+        results = await asyncio.gather(*[
+            self.request('GET', url, headers=dict(self.default_headers))
+            for _ in range(connections)], return_exceptions=True)
+        for result in results:
+            # any response proves its connection is up
+            if (isinstance(result, Exception) and
+                    not isinstance(result, ApiException)):
+                raise result
+        return rest_client.connections_opened - opened
+
+    async def _call_api(
+            self, resource_path, method, path_params=None,
+            query_params=None, header_params=None, body=None, post_params=None,
+            files=None, response_type=None, auth_settings=None,
+            _return_http_data_only=None, collection_formats=None,
+            _preload_content=True, _request_timeout=None, _host=None,
+            _response_mode=None, _headers=None):
+
+        if self._uses_token(auth_settings):
+            await self.token_manager.get_token()
+
+        url, query_params, header_params, post_params, body = \
+            self._prepare_request(
+                resource_path, method, path_params, query_params,
+                header_params, body, post_params, files, auth_settings,
+                collection_formats, _host, _headers)
+
+        # perform request and return response, the replay is built from
+        # the headers as they were before the first attempt
+        try:
+            response_data = await self._perform_request(
+                resource_path, method, url, query_params=query_params,
+                headers=dict(header_params), post_params=post_params,
+                body=body, _preload_content=_preload_content,
+                _request_timeout=_request_timeout)
+        except ApiException as e:
+            if not self._is_token_rejection(e, auth_settings):
+                raise
+            token = await self.token_manager.refresh(
+                self._access_token_of(header_params))
+            header_params = dict(header_params,
+                                 Authorization=token.authorization)
+            response_data = await self._perform_request(
+                resource_path, method, url, query_params=query_params,
+                headers=header_params, post_params=post_params, body=body,
+                _preload_content=_preload_content,
+                _request_timeout=_request_timeout)
+
+        return self._handle_response(response_data, response_type,
+                                     _return_http_data_only,
+                                     _preload_content, _response_mode)
+
+    async def _perform_request(self, resource_path, method, url,
+                               query_params=None, headers=None,
+                               post_params=None, body=None,
+                               _preload_content=True, _request_timeout=None):
+        """Makes the HTTP request, replaying it under
+        `configuration.retry_policy` if one is set."""
+        policy = self.configuration.retry_policy
+        if policy is None:
+            return (await self._guarded_request(
+                resource_path, method, url, query_params=query_params,
+                headers=headers, post_params=post_params, body=body,
+                _preload_content=_preload_content,
+                _request_timeout=_request_timeout))
+
+        retry = policy.start(method, resource_path, headers)
+        while True:
+            try:
+                return (await self._guarded_request(
+                    resource_path, method, url, query_params=query_params,
+                    headers=dict(headers) if headers else headers,
+                    post_params=post_params, body=body,
+                    _preload_content=_preload_content,
+                    _request_timeout=_request_timeout))
+            except CONNECTION_ERRORS as e:
+                delay = retry.next_delay(e, connection_error=True)
+                if delay is None:
+                    raise
+            except Exception as e:
+                delay = retry.next_delay(e)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+
+    async def _guarded_request(self, resource_path, method, url, **kwargs):
+        """Makes a single HTTP request through the circuit breaker of the
+        operation if `configuration.circuit_breakers` is set."""
+        breakers = self.configuration.circuit_breakers
+        if breakers is None:
+            return (await self.request(method, url, **kwargs))
+
+        breaker = breakers.before_request(method, resource_path)
+        try:
+            response = await self.request(method, url, **kwargs)
+        except CONNECTION_ERRORS:
+            breaker.record_failure()
+            raise
+        except Exception as e:
+            breakers.after_request(breaker, e)
+            raise
+        breakers.after_request(breaker)
+        return response
+
+    def call_api(self, resource_path, method,
+                 path_params=None, query_params=None, header_params=None,
+                 body=None, post_params=None, files=None,
+                 response_type=None, auth_settings=None, async_req=None,
+                 _return_http_data_only=None, collection_formats=None,
+                 _preload_content=True, _request_timeout=None, _host=None,
+                 _response_mode=None, _headers=None):
+        """Makes the HTTP request and returns a coroutine.
+
+        Takes the same arguments as `ApiClient.call_api`. Awaiting the
+        returned coroutine yields the deserialized data (or the
+        `(data, status, headers)` tuple).
+
+        :param async_req bool: ignored, every request is asynchronous.
+        """
+        return self._call_api(resource_path, method,
+                              path_params, query_params, header_params,
+                              body, post_params, files,
+                              response_type, auth_settings,
+                              _return_http_data_only, collection_formats,
+                              _preload_content, _request_timeout, _host,
+                              _response_mode, _headers)
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      post_params=None, body=None, _preload_content=True,
+                      _request_timeout=None):
+        """Makes the HTTP request using the aiohttp RESTClient."""
+        if method not in ('GET', 'HEAD', 'OPTIONS', 'POST', 'PUT', 'PATCH',
+                          'DELETE'):
+            raise ApiValueError(
+                "http method must be `GET`, `HEAD`, `OPTIONS`,"
+                " `POST`, `PATCH`, `PUT` or `DELETE`."
+            )
+        return (await self.rest_client.request(
+            method, url,
+            query_params=query_params,
+            headers=headers,
+            post_params=post_params,
+            body=body,
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout))
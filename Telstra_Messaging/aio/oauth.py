@@ -0,0 +1,115 @@
+# coding: utf-8
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+import asyncio
+
+from Telstra_Messaging.aio.api.authentication_api import AuthenticationApi
+from Telstra_Messaging.aio.api_client import AsyncApiClient
+from Telstra_Messaging.exceptions import ApiTypeError
+from Telstra_Messaging.oauth import Token, TokenManager, logger
+
+
+class AsyncTokenManager(TokenManager):
+    """asyncio variant of :class:`Telstra_Messaging.oauth.TokenManager`,
+    for `AsyncApiClient`.
+
+    `get_token` and `refresh` are coroutines. A refresh runs as a task on
+    the event loop of the clients; the tasks needing a token while it runs
+    await that task instead of requesting tokens of their own.
+    """
+
+    def __init__(self, client_id, client_secret, scope='NSMS',
+                 refresh_margin=300.0, min_validity=30.0, retry_interval=5.0,
+                 cache=None):
+        super(AsyncTokenManager, self).__init__(
+            client_id, client_secret, scope, refresh_margin, min_validity,
+            retry_interval, cache)
+        self._task = None
+
+    def _check_client(self, api_client):
+        if not isinstance(api_client, AsyncApiClient):
+            raise ApiTypeError(
+                "AsyncTokenManager can only authenticate an AsyncApiClient, "
+                "use Telstra_Messaging.TokenManager instead")
+
+    async def get_token(self):
+        """Returns a valid Token, waiting for a refresh only if the current
+        token is missing or about to expire."""
+        token = self._token
+        if self.needs_refresh(token, self.min_validity):
+            return (await self._refresh(token))
+        if (self.needs_refresh(token) and self._task is None and
+                self.clock() >= self._next_attempt):
+            self._start_refresh().add_done_callback(self._background_done)
+        return token
+
+    async def refresh(self, access_token=None):
+        """Replaces the token, see `TokenManager.refresh`."""
+        token = self._token
+        if (access_token is not None and token is not None and
+                token.access_token != access_token):
+            return token
+        return (await self._refresh(token))
+
+    async def _refresh(self, observed):
+        token = self._token
+        if token is not observed and token is not None:
+            return token
+        task = self._task
+        if task is None:
+            task = self._start_refresh()
+        # a cancelled waiter must not cancel the refresh of the others
+        return (await asyncio.shield(task))
+
+    def _start_refresh(self):
+        self._task = asyncio.ensure_future(
+            self._fetch_and_set(self._token))
+        return self._task
+
+    async def _fetch_and_set(self, observed):
+        try:
+            if self.cache is None:
+                token = await self._fetch()
+            else:
+                token = await self._request_cached(observed)
+            self._set(token)
+            return token
+        finally:
+            self._task = None
+
+    async def _request_cached(self, observed):
+        # the cache blocks while another process requests a token, so it is
+        # consulted from an executor thread, which has the token requested
+        # on the event loop if needed
+        loop = asyncio.get_event_loop()
+
+        def fetch():
+            return asyncio.run_coroutine_threadsafe(self._fetch(),
+                                                    loop).result()
+        return (await loop.run_in_executor(None, self._request, observed,
+                                           fetch))
+
+    def _background_done(self, task):
+        if task.cancelled() or task.exception() is None:
+            return
+        logger.warning("Background token refresh failed",
+                       exc_info=task.exception())
+        self._next_attempt = self.clock() + self.retry_interval
+
+    async def _fetch(self):
+        """Requests a token with `AuthenticationApi.auth_token`."""
+        if self.api_client is None:
+            raise ValueError("TokenManager is not attached to an ApiClient")
+        now = self.clock()
+        self.token_requests += 1
+        response = await AuthenticationApi(self.api_client).auth_token(
+            self.client_id, self.client_secret, 'client_credentials',
+            scope=self.scope, _response_mode='model')
+        return Token.from_response(response, now)
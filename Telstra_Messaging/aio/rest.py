@@ -0,0 +1,314 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+import logging
+import re
+import ssl
+
+import aiohttp
+import certifi
+from six.moves.urllib.parse import urlencode
+
+from Telstra_Messaging.exceptions import ApiException, ApiValueError
+from Telstra_Messaging import rest
+from Telstra_Messaging.rest import RequestCompression
+
+
+logger = logging.getLogger(__name__)
+
+
+class RESTResponse(rest.RESTResponse):
+
+    def __init__(self, resp, data):
+        self.aiohttp_response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.raw_data = data
+        self._data = None
+
+    def getheaders(self):
+        """Returns a CIMultiDictProxy of the response headers."""
+        return self.aiohttp_response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.aiohttp_response.headers.get(name, default)
+
+
+class RESTClientObject(object):
+    """asyncio counterpart of :class:`Telstra_Messaging.rest.RESTClientObject`.
+
+    All requests share one `aiohttp.ClientSession`, which is created on the
+    first request so that it is bound to the running event loop.
+    """
+
+    def __init__(self, configuration, pools_size=4, maxsize=None):
+        # maxsize is the number of requests to host that are allowed in parallel  # noqa: E501
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 4
+        self.maxsize = maxsize
+
+        # ca_certs
+        if configuration.ssl_ca_cert:
+            ca_certs = configuration.ssl_ca_cert
+        else:
+            # if not set certificate file, use Mozilla's root certificates.
+            ca_certs = certifi.where()
+
+        self.ssl_context = ssl.create_default_context(cafile=ca_certs)
+        if configuration.cert_file:
+            self.ssl_context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file
+            )
+        if not configuration.verify_ssl:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+        elif configuration.assert_hostname is False:
+            self.ssl_context.check_hostname = False
+
+        self.proxy = configuration.proxy
+        self.proxy_headers = configuration.proxy_headers
+
+        self.configuration = configuration
+        self.compression = RequestCompression(configuration)
+        self.pool_manager = None
+        self.connections_opened = 0
+        """Connections established by the session since it was created"""
+
+    @property
+    def compression_stats(self):
+        """CompressionStats of the requests sent by this client."""
+        return self.compression.stats
+
+    def _session(self):
+        if self.pool_manager is None or self.pool_manager.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.maxsize,
+                ssl=self.ssl_context
+            )
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_create_end.append(
+                self._connection_created)
+            self.pool_manager = aiohttp.ClientSession(
+                connector=connector, trace_configs=[trace_config])
+        return self.pool_manager
+
+    async def _connection_created(self, session, context, params):
+        self.connections_opened += 1
+
+    async def close(self):
+        """Closes the underlying `aiohttp.ClientSession`."""
+        if self.pool_manager is not None:
+            await self.pool_manager.close()
+            self.pool_manager = None
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, post_params=None, _preload_content=True,
+                      _request_timeout=None):
+        """Execute request
+
+        :param method: http request method
+        :param url: http request url
+        :param query_params: query parameters in the url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _preload_content: if False, the aiohttp.ClientResponse object
+                                 will be returned without reading/decoding
+                                 response data. Default is True.
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
+                          'PATCH', 'OPTIONS']
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        # the caller may send the same headers again, e.g. when replaying
+        headers = dict(headers or {})
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif (isinstance(_request_timeout, tuple) and
+                  len(_request_timeout) == 2):
+                timeout = aiohttp.ClientTimeout(
+                    sock_connect=_request_timeout[0],
+                    sock_read=_request_timeout[1])
+
+        if 'Content-Type' not in headers:
+            headers['Content-Type'] = 'application/json'
+
+        args = {
+            "method": method,
+            "url": url,
+            "headers": headers
+        }
+        if timeout is not None:
+            args["timeout"] = timeout
+
+        if self.proxy:
+            args["proxy"] = self.proxy
+            if self.proxy_headers:
+                args["proxy_headers"] = self.proxy_headers
+
+        if query_params:
+            args["url"] += '?' + urlencode(query_params)
+
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if re.search('json', headers['Content-Type'], re.IGNORECASE):
+                if isinstance(body, bytes):
+                    # already encoded, e.g. by Telstra_Messaging.broadcast
+                    args["data"] = body
+                elif body is not None:
+                    args["data"] = self.configuration.json_codec.dumps(body)
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
+                args["data"] = aiohttp.FormData(post_params)
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # must del headers['Content-Type'], or the correct
+                # Content-Type which generated by aiohttp will be
+                # overwritten.
+                del headers['Content-Type']
+                data = aiohttp.FormData()
+                for param in post_params:
+                    k, v = param
+                    if isinstance(v, tuple) and len(v) == 3:
+                        data.add_field(k,
+                                       value=v[1],
+                                       filename=v[0],
+                                       content_type=v[2])
+                    else:
+                        data.add_field(k, v)
+                args["data"] = data
+            # Pass a `bytes` parameter directly in the body to support
+            # other content types than Json when `body` argument is provided
+            # in serialized form
+            elif isinstance(body, (str, bytes)):
+                args["data"] = body
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        if isinstance(args.get("data"), (str, bytes)):
+            args["data"], args["headers"] = self.compression.prepare(
+                args["data"], headers)
+        else:
+            _, args["headers"] = self.compression.prepare(None, headers)
+
+        try:
+            r = await self._session().request(**args)
+        except aiohttp.ClientSSLError as e:
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise ApiException(status=0, reason=msg)
+
+        self.compression.stats.record_response(r.headers)
+
+        if _preload_content:
+            data = await r.read()
+            r = RESTResponse(r, data)
+
+            # log response body
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("response body: %s", r.data)
+
+            if not 200 <= r.status <= 299:
+                raise ApiException(http_resp=r)
+        elif not 200 <= r.status <= 299:
+            raise ApiException(status=r.status, reason=r.reason)
+
+        return r
+
+    async def GET(self, url, headers=None, query_params=None,
+                  _preload_content=True, _request_timeout=None):
+        return (await self.request("GET", url,
+                                   headers=headers,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   query_params=query_params))
+
+    async def HEAD(self, url, headers=None, query_params=None,
+                   _preload_content=True, _request_timeout=None):
+        return (await self.request("HEAD", url,
+                                   headers=headers,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   query_params=query_params))
+
+    async def OPTIONS(self, url, headers=None, query_params=None,
+                      post_params=None, body=None, _preload_content=True,
+                      _request_timeout=None):
+        return (await self.request("OPTIONS", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
+
+    async def DELETE(self, url, headers=None, query_params=None, body=None,
+                     _preload_content=True, _request_timeout=None):
+        return (await self.request("DELETE", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
+
+    async def POST(self, url, headers=None, query_params=None,
+                   post_params=None, body=None, _preload_content=True,
+                   _request_timeout=None):
+        return (await self.request("POST", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
+
+    async def PUT(self, url, headers=None, query_params=None,
+                  post_params=None, body=None, _preload_content=True,
+                  _request_timeout=None):
+        return (await self.request("PUT", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
+
+    async def PATCH(self, url, headers=None, query_params=None,
+                    post_params=None, body=None, _preload_content=True,
+                    _request_timeout=None):
+        return (await self.request("PATCH", url,
+                                   headers=headers,
+                                   query_params=query_params,
+                                   post_params=post_params,
+                                   _preload_content=_preload_content,
+                                   _request_timeout=_request_timeout,
+                                   body=body))
@@ -57,6 +57,11 @@ class AuthenticationApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: OAuthResponse
                  If the method is called asynchronously,
                  returns the request thread.
@@ -87,6 +92,11 @@ class AuthenticationApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: tuple(OAuthResponse, status_code(int), headers(HTTPHeaderDict))
                  If the method is called asynchronously,
                  returns the request thread.
@@ -99,6 +109,8 @@ class AuthenticationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -166,4 +178,6 @@ class AuthenticationApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
@@ -54,6 +54,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: list[OutboundPollResponse]
                  If the method is called asynchronously,
                  returns the request thread.
@@ -81,6 +86,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: tuple(list[OutboundPollResponse], status_code(int), headers(HTTPHeaderDict))
                  If the method is called asynchronously,
                  returns the request thread.
@@ -93,6 +103,8 @@ class MessagingApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -142,6 +154,8 @@ class MessagingApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
 
     def get_sms_status(self, message_id, **kwargs):  # noqa: E501
@@ -162,6 +176,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: list[OutboundPollResponse]
                  If the method is called asynchronously,
                  returns the request thread.
@@ -189,6 +208,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: tuple(list[OutboundPollResponse], status_code(int), headers(HTTPHeaderDict))
                  If the method is called asynchronously,
                  returns the request thread.
@@ -201,6 +225,8 @@ class MessagingApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -250,6 +276,8 @@ class MessagingApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
 
     def mms_health_check(self, **kwargs):  # noqa: E501
@@ -269,6 +297,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: HealthCheckResponse
                  If the method is called asynchronously,
                  returns the request thread.
@@ -295,6 +328,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: tuple(HealthCheckResponse, status_code(int), headers(HTTPHeaderDict))
                  If the method is called asynchronously,
                  returns the request thread.
@@ -307,6 +345,8 @@ class MessagingApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -350,6 +390,8 @@ class MessagingApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
 
     def retrieve_mms_replies(self, **kwargs):  # noqa: E501
@@ -369,6 +411,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: GetMmsResponse
                  If the method is called asynchronously,
                  returns the request thread.
@@ -395,6 +442,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: tuple(GetMmsResponse, status_code(int), headers(HTTPHeaderDict))
                  If the method is called asynchronously,
                  returns the request thread.
@@ -407,6 +459,8 @@ class MessagingApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -450,6 +504,8 @@ class MessagingApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
 
     def retrieve_sms_replies(self, **kwargs):  # noqa: E501
@@ -469,6 +525,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: InboundPollResponse
                  If the method is called asynchronously,
                  returns the request thread.
@@ -495,6 +556,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: tuple(InboundPollResponse, status_code(int), headers(HTTPHeaderDict))
                  If the method is called asynchronously,
                  returns the request thread.
@@ -507,6 +573,8 @@ class MessagingApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -550,6 +618,8 @@ class MessagingApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
 
     def send_mms(self, body, **kwargs):  # noqa: E501
@@ -570,6 +640,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: MessageSentResponseMms
                  If the method is called asynchronously,
                  returns the request thread.
@@ -597,6 +672,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: tuple(MessageSentResponseMms, status_code(int), headers(HTTPHeaderDict))
                  If the method is called asynchronously,
                  returns the request thread.
@@ -609,6 +689,8 @@ class MessagingApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -662,6 +744,8 @@ class MessagingApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
 
     def send_multiple_sms(self, payload, **kwargs):  # noqa: E501
@@ -682,6 +766,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: MessageSentResponseSms
                  If the method is called asynchronously,
                  returns the request thread.
@@ -709,6 +798,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: tuple(MessageSentResponseSms, status_code(int), headers(HTTPHeaderDict))
                  If the method is called asynchronously,
                  returns the request thread.
@@ -721,6 +815,8 @@ class MessagingApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -774,6 +870,8 @@ class MessagingApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
 
     def send_sms(self, payload, **kwargs):  # noqa: E501
@@ -794,6 +892,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: MessageSentResponseSms
                  If the method is called asynchronously,
                  returns the request thread.
@@ -821,6 +924,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: tuple(MessageSentResponseSms, status_code(int), headers(HTTPHeaderDict))
                  If the method is called asynchronously,
                  returns the request thread.
@@ -833,6 +941,8 @@ class MessagingApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -886,6 +996,8 @@ class MessagingApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
 
     def sms_health_check(self, **kwargs):  # noqa: E501
@@ -905,6 +1017,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: HealthCheckResponse
                  If the method is called asynchronously,
                  returns the request thread.
@@ -931,6 +1048,11 @@ class MessagingApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: tuple(HealthCheckResponse, status_code(int), headers(HTTPHeaderDict))
                  If the method is called asynchronously,
                  returns the request thread.
@@ -943,6 +1065,8 @@ class MessagingApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -986,4 +1110,6 @@ class MessagingApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
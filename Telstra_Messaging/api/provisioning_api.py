@@ -54,6 +54,11 @@ class ProvisioningApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: ProvisionNumberResponse
                  If the method is called asynchronously,
                  returns the request thread.
@@ -81,6 +86,11 @@ class ProvisioningApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: tuple(ProvisionNumberResponse, status_code(int), headers(HTTPHeaderDict))
                  If the method is called asynchronously,
                  returns the request thread.
@@ -93,6 +103,8 @@ class ProvisioningApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -146,6 +158,8 @@ class ProvisioningApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
 
     def delete_subscription(self, body, **kwargs):  # noqa: E501
@@ -166,6 +180,11 @@ class ProvisioningApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: None
                  If the method is called asynchronously,
                  returns the request thread.
@@ -193,6 +212,11 @@ class ProvisioningApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: None
                  If the method is called asynchronously,
                  returns the request thread.
@@ -205,6 +229,8 @@ class ProvisioningApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -254,6 +280,8 @@ class ProvisioningApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
 
     def get_subscription(self, **kwargs):  # noqa: E501
@@ -273,6 +301,11 @@ class ProvisioningApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: GetSubscriptionResponse
                  If the method is called asynchronously,
                  returns the request thread.
@@ -299,6 +332,11 @@ class ProvisioningApi(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode` of
+                               the client, e.g. 'dict' to return plain
+                               dicts instead of models.
+        :param _headers: dict of headers sent with this request only,
+                         e.g. a per-call `Idempotency-Key`.
         :return: tuple(GetSubscriptionResponse, status_code(int), headers(HTTPHeaderDict))
                  If the method is called asynchronously,
                  returns the request thread.
@@ -311,6 +349,8 @@ class ProvisioningApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
+        all_params.append('_headers')
 
         for key, val in six.iteritems(local_var_params['kwargs']):
             if key not in all_params:
@@ -354,4 +394,6 @@ class ProvisioningApi(object):
             _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
             _preload_content=local_var_params.get('_preload_content', True),
             _request_timeout=local_var_params.get('_request_timeout'),
+            _response_mode=local_var_params.get('_response_mode'),
+            _headers=local_var_params.get('_headers'),
             collection_formats=collection_formats)
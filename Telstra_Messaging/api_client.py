@@ -11,8 +11,7 @@
 from __future__ import absolute_import
 
 import datetime
-from dateutil.parser import parse
-import json
+import itertools
 import mimetypes
 from multiprocessing.pool import ThreadPool
 import os
@@ -24,11 +23,46 @@ import six
 from six.moves.urllib.parse import quote
 
 from Telstra_Messaging.configuration import Configuration
-import Telstra_Messaging.models
+from Telstra_Messaging import deserializer
 from Telstra_Messaging import rest
+from Telstra_Messaging import serializer
 from Telstra_Messaging.exceptions import ApiValueError
 
 
+_versions = itertools.count(1)
+
+
+class DefaultHeaders(dict):
+    """Headers sent with every request of an ApiClient.
+
+    A dict whose `version` changes whenever it is modified, so that header
+    sets built from it can be cached until it changes.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(DefaultHeaders, self).__init__(*args, **kwargs)
+        self.version = next(_versions)
+
+    def _modified(method):
+        def modify(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            self.version = next(_versions)
+            return result
+        modify.__name__ = method.__name__
+        return modify
+
+    __setitem__ = _modified(dict.__setitem__)
+    __delitem__ = _modified(dict.__delitem__)
+    clear = _modified(dict.clear)
+    pop = _modified(dict.pop)
+    popitem = _modified(dict.popitem)
+    setdefault = _modified(dict.setdefault)
+    update = _modified(dict.update)
+    if hasattr(dict, '__ior__'):
+        __ior__ = _modified(dict.__ior__)
+    del _modified
+
+
 class ApiClient(object):
     """Generic API client for OpenAPI client library builds.
 
@@ -49,6 +83,8 @@ class ApiClient(object):
         to the API
     :param pool_threads: The number of threads to use for async requests
         to the API. More threads means more concurrent API requests.
+    :param transport: Transport used to send requests, see
+        `Telstra_Messaging.transport`. Defaults to urllib3.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
@@ -65,13 +101,16 @@ class ApiClient(object):
     _pool = None
 
     def __init__(self, configuration=None, header_name=None, header_value=None,
-                 cookie=None, pool_threads=1):
+                 cookie=None, pool_threads=1, transport=None):
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
         self.pool_threads = pool_threads
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = self._create_rest_client(configuration, transport)
+        # (operation headers, auth settings) -> (default headers version,
+        # cookie, access token, headers)
+        self._header_sets = {}
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -79,6 +118,13 @@ class ApiClient(object):
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.7/python'
         self.client_side_validation = configuration.client_side_validation
+        self.token_manager = None
+        """TokenManager providing the OAuth tokens of the requests, see
+        `Telstra_Messaging.oauth`. Set by `TokenManager.attach`."""
+
+    def _create_rest_client(self, configuration, transport=None):
+        """Creates the REST client used to perform HTTP requests."""
+        return rest.RESTClientObject(configuration, transport=transport)
 
     def __del__(self):
         if self._pool:
@@ -95,6 +141,15 @@ class ApiClient(object):
             self._pool = ThreadPool(self.pool_threads)
         return self._pool
 
+    @property
+    def default_headers(self):
+        """DefaultHeaders sent with every request"""
+        return self._default_headers
+
+    @default_headers.setter
+    def default_headers(self, headers):
+        self._default_headers = DefaultHeaders(headers)
+
     @property
     def user_agent(self):
         """User agent for this API client"""
@@ -107,24 +162,185 @@ class ApiClient(object):
     def set_default_header(self, header_name, header_value):
         self.default_headers[header_name] = header_value
 
+    def warm_up(self, connections=None,
+                resource_path='/messages/sms/healthcheck'):
+        """Opens keep-alive connections to `configuration.host` before
+        traffic arrives.
+
+        One request is sent to `resource_path` (the unauthenticated SMS
+        health check by default) so that the first connection completes a
+        full exchange and its TLS session can be resumed, then the transport
+        opens the remaining connections.
+
+        :param connections: number of connections to keep open, defaults to
+            `configuration.connection_pool_maxsize`.
+        :param resource_path: path of the request warming the first
+            connection.
+        :return: number of connections opened, not counting the ones that
+            were already open. Transports that do not report their
+            connections count the connection of the request.
+        """
+        if connections is None:
+            connections = self.configuration.connection_pool_maxsize or 1
+        url = self.configuration.host + resource_path
+        transport = self.rest_client.transport
+        established = getattr(transport, 'established', None)
+        before = established(url) if established is not None else 0
+        try:
+            self.request('GET', url, headers=dict(self.default_headers))
+        except rest.ApiException as e:
+            if not e.status:
+                # no response, e.g. the TLS handshake failed
+                return 0
+            # any response proves the connection is up
+
+        if established is None:
+            return 1
+        warm_up = getattr(transport, 'warm_up', None)
+        if warm_up is not None and connections > 1:
+            warm_up(url, connections)
+        return max(0, established(url) - before)
+
     def __call_api(
             self, resource_path, method, path_params=None,
             query_params=None, header_params=None, body=None, post_params=None,
             files=None, response_type=None, auth_settings=None,
             _return_http_data_only=None, collection_formats=None,
-            _preload_content=True, _request_timeout=None, _host=None):
+            _preload_content=True, _request_timeout=None, _host=None,
+            _response_mode=None, _headers=None):
+
+        if self._uses_token(auth_settings):
+            self.token_manager.get_token()
+
+        url, query_params, header_params, post_params, body = \
+            self._prepare_request(
+                resource_path, method, path_params, query_params,
+                header_params, body, post_params, files, auth_settings,
+                collection_formats, _host, _headers)
+
+        # perform request and return response, the replay is built from
+        # the headers as they were before the first attempt
+        try:
+            response_data = self._perform_request(
+                resource_path, method, url, query_params=query_params,
+                headers=dict(header_params), post_params=post_params,
+                body=body, _preload_content=_preload_content,
+                _request_timeout=_request_timeout)
+        except rest.ApiException as e:
+            if not self._is_token_rejection(e, auth_settings):
+                raise
+            # replay once with a new token, shared by the concurrent
+            # requests rejected with the same token
+            token = self.token_manager.refresh(
+                self._access_token_of(header_params))
+            header_params = dict(header_params,
+                                 Authorization=token.authorization)
+            response_data = self._perform_request(
+                resource_path, method, url, query_params=query_params,
+                headers=header_params, post_params=post_params, body=body,
+                _preload_content=_preload_content,
+                _request_timeout=_request_timeout)
+
+        return self._handle_response(response_data, response_type,
+                                     _return_http_data_only,
+                                     _preload_content, _response_mode)
+
+    def _uses_token(self, auth_settings):
+        """Returns True if requests with `auth_settings` need a token of the
+        token manager."""
+        return (self.token_manager is not None and auth_settings is not None
+                and 'auth' in auth_settings)
+
+    def _is_token_rejection(self, error, auth_settings):
+        """Returns True if `error` is the API rejecting the token of the
+        token manager."""
+        return (getattr(error, 'status', None) == 401 and
+                self._uses_token(auth_settings))
+
+    @staticmethod
+    def _access_token_of(headers):
+        """Returns the access token sent in the `Authorization` header."""
+        return (headers or {}).get('Authorization', '').partition(' ')[2]
+
+    def _perform_request(self, resource_path, method, url, query_params=None,
+                         headers=None, post_params=None, body=None,
+                         _preload_content=True, _request_timeout=None):
+        """Makes the HTTP request, replaying it under
+        `configuration.retry_policy` if one is set.
+
+        :param resource_path: path template of the operation, used to decide
+            whether the request may be replayed.
+        """
+        policy = self.configuration.retry_policy
+        if policy is None:
+            return self._guarded_request(
+                resource_path, method, url, query_params=query_params,
+                headers=headers, post_params=post_params, body=body,
+                _preload_content=_preload_content,
+                _request_timeout=_request_timeout)
+
+        retry = policy.start(method, resource_path, headers)
+        while True:
+            try:
+                return self._guarded_request(
+                    resource_path, method, url, query_params=query_params,
+                    headers=dict(headers) if headers else headers,
+                    post_params=post_params, body=body,
+                    _preload_content=_preload_content,
+                    _request_timeout=_request_timeout)
+            except Exception as e:
+                delay = retry.next_delay(e)
+                if delay is None:
+                    raise
+            policy.sleep(delay)
+
+    def _guarded_request(self, resource_path, method, url, **kwargs):
+        """Makes a single HTTP request through the circuit breaker of the
+        operation if `configuration.circuit_breakers` is set.
+
+        :raise CircuitOpenException: if the breaker is open.
+        """
+        breakers = self.configuration.circuit_breakers
+        if breakers is None:
+            return self.request(method, url, **kwargs)
 
+        breaker = breakers.before_request(method, resource_path)
+        try:
+            response = self.request(method, url, **kwargs)
+        except Exception as e:
+            breakers.after_request(breaker, e)
+            raise
+        breakers.after_request(breaker)
+        return response
+
+    def _prepare_request(self, resource_path, method, path_params=None,
+                         query_params=None, header_params=None, body=None,
+                         post_params=None, files=None, auth_settings=None,
+                         collection_formats=None, _host=None, _headers=None):
+        """Builds the url, parameters and body of a request.
+
+        Shared by the blocking and the asyncio clients so that both
+        serialize requests identically.
+
+        :param _headers: headers of this request only. They are added after
+            the cached header set so that per-call values, such as an
+            `Idempotency-Key`, do not grow the cache.
+
+        :return: tuple(url, query_params, header_params, post_params, body)
+        """
         config = self.configuration
 
         # header parameters
-        header_params = header_params or {}
-        header_params.update(self.default_headers)
-        if self.cookie:
-            header_params['Cookie'] = self.cookie
-        if header_params:
-            header_params = self.sanitize_for_serialization(header_params)
-            header_params = dict(self.parameters_to_tuples(header_params,
-                                                           collection_formats))
+        headers = self._header_set(header_params, auth_settings)
+        if headers is None:
+            header_params = header_params or {}
+            header_params.update(self.default_headers)
+            if self.cookie:
+                header_params['Cookie'] = self.cookie
+            if header_params:
+                header_params = self.sanitize_for_serialization(header_params)
+                header_params = dict(self.parameters_to_tuples(
+                    header_params, collection_formats))
 
         # path parameters
         if path_params:
@@ -153,7 +369,13 @@ class ApiClient(object):
             post_params.extend(self.files_parameters(files))
 
         # auth setting
-        self.update_params_for_auth(header_params, query_params, auth_settings)
+        if headers is None:
+            self.update_params_for_auth(header_params, query_params,
+                                        auth_settings)
+        else:
+            header_params = headers
+        if _headers:
+            header_params.update(self.sanitize_for_serialization(_headers))
 
         # body
         if body:
@@ -166,20 +388,60 @@ class ApiClient(object):
             # use server/host defined in path or operation instead
             url = _host + resource_path
 
-        # perform request and return response
-        response_data = self.request(
-            method, url, query_params=query_params, headers=header_params,
-            post_params=post_params, body=body,
-            _preload_content=_preload_content,
-            _request_timeout=_request_timeout)
+        return url, query_params, header_params, post_params, body
 
+    def _header_set(self, header_params, auth_settings):
+        """Returns the headers of a request with the operation headers
+        `header_params`, including the default headers, cookie and
+        authentication headers.
+
+        Header sets are built once per operation and cached until the
+        default headers, cookie or access token change.
+
+        :return: a new dict, or None if the headers cannot be cached
+            because a header value is not a string or authentication goes
+            in the query.
+        """
+        if header_params:
+            for value in six.itervalues(header_params):
+                if not isinstance(value, six.string_types):
+                    return None
+            key = (frozenset(six.iteritems(header_params)),
+                   tuple(auth_settings or ()))
+        else:
+            key = (None, tuple(auth_settings or ()))
+
+        version = self._default_headers.version
+        access_token = self.configuration.access_token
+        entry = self._header_sets.get(key)
+        if (entry is not None and entry[0] == version and
+                entry[1] == self.cookie and entry[2] == access_token):
+            return dict(entry[3])
+
+        headers = dict(header_params or {})
+        headers.update(self._default_headers)
+        if self.cookie:
+            headers['Cookie'] = self.cookie
+        headers = self.sanitize_for_serialization(headers)
+        querys = []
+        self.update_params_for_auth(headers, querys, auth_settings)
+        if querys:
+            return None
+        self._header_sets[key] = (version, self.cookie, access_token, headers)
+        return dict(headers)
+
+    def _handle_response(self, response_data, response_type,
+                         _return_http_data_only=None, _preload_content=True,
+                         _response_mode=None):
+        """Deserializes a response into the value returned by `call_api`."""
         self.last_response = response_data
 
         return_data = response_data
         if _preload_content:
             # deserialize response data
             if response_type:
-                return_data = self.deserialize(response_data, response_type)
+                return_data = self.deserialize(response_data, response_type,
+                                               _response_mode)
             else:
                 return_data = None
 
@@ -200,43 +462,21 @@ class ApiClient(object):
         If obj is dict, return the dict.
         If obj is OpenAPI model, return the properties dict.
 
+        Serializers are generated once per model class and cached, see
+        `Telstra_Messaging.serializer`.
+
         :param obj: The data to serialize.
         :return: The serialized form of data.
         """
-        if obj is None:
-            return None
-        elif isinstance(obj, self.PRIMITIVE_TYPES):
-            return obj
-        elif isinstance(obj, list):
-            return [self.sanitize_for_serialization(sub_obj)
-                    for sub_obj in obj]
-        elif isinstance(obj, tuple):
-            return tuple(self.sanitize_for_serialization(sub_obj)
-                         for sub_obj in obj)
-        elif isinstance(obj, (datetime.datetime, datetime.date)):
-            return obj.isoformat()
-
-        if isinstance(obj, dict):
-            obj_dict = obj
-        else:
-            # Convert model obj to dict except
-            # attributes `openapi_types`, `attribute_map`
-            # and attributes which value is not None.
-            # Convert attribute name to json key in
-            # model definition for request.
-            obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
-                        for attr, _ in six.iteritems(obj.openapi_types)
-                        if getattr(obj, attr) is not None}
-
-        return {key: self.sanitize_for_serialization(val)
-                for key, val in six.iteritems(obj_dict)}
-
-    def deserialize(self, response, response_type):
+        return serializer.serializers.serialize(obj)
+
+    def deserialize(self, response, response_type, response_mode=None):
         """Deserializes response into an object.
 
         :param response: RESTResponse object to be deserialized.
         :param response_type: class literal for
             deserialized object, or string of class name.
+        :param response_mode: overrides `configuration.response_mode`.
 
         :return: deserialized object.
         """
@@ -245,59 +485,67 @@ class ApiClient(object):
         if response_type == "file":
             return self.__deserialize_file(response)
 
-        # fetch data from response object
+        # fetch data from response object, parsing JSON straight from the
+        # received bytes so the decoded text is only built when needed
         try:
-            data = json.loads(response.data)
+            data = self.configuration.json_codec.loads(
+                self._response_body(response))
         except ValueError:
             data = response.data
 
-        return self.__deserialize(data, response_type)
+        return self.__deserialize(data, response_type, response_mode)
 
-    def __deserialize(self, data, klass):
+    def deserialize_payload(self, body, response_type, response_mode=None):
+        """Deserializes a notification (webhook) payload.
+
+        Telstra posts delivery receipts and replies to the `notifyURL` of a
+        message, e.g. `api_client.deserialize_payload(request_body,
+        'InboundPollResponse')`.
+
+        :param body: request body received on the notify url, as bytes or
+            text.
+        :param response_type: class literal for the payload, or string of
+            class name.
+        :param response_mode: overrides `configuration.response_mode`.
+        :return: deserialized object.
+        """
+        return self.__deserialize(self.configuration.json_codec.loads(body),
+                                  response_type, response_mode)
+
+    @staticmethod
+    def _response_body(response):
+        """Returns the undecoded body of a response."""
+        if hasattr(response, 'raw_data'):
+            return response.raw_data
+        return response.data
+
+    def __deserialize(self, data, klass, mode=None):
         """Deserializes dict, list, str into an object.
 
+        Decoders are compiled once per type and cached, see
+        `Telstra_Messaging.deserializer`.
+
         :param data: dict, list or str.
         :param klass: class literal, or string of class name.
+        :param mode: response mode, defaults to
+            `configuration.response_mode`.
 
         :return: object.
         """
         if data is None:
             return None
-
-        if type(klass) == str:
-            if klass.startswith('list['):
-                sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
-
-            if klass.startswith('dict('):
-                sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in six.iteritems(data)}
-
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
-            else:
-                klass = getattr(Telstra_Messaging.models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
-        elif klass == object:
-            return self.__deserialize_object(data)
-        elif klass == datetime.date:
-            return self.__deserialize_date(data)
-        elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
-        else:
-            return self.__deserialize_model(data, klass)
+        if mode is None:
+            mode = self.configuration.response_mode
+        return deserializer.plans.get(
+            klass, mode, self.configuration.typed_timestamps)(data)
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
                  body=None, post_params=None, files=None,
                  response_type=None, auth_settings=None, async_req=None,
                  _return_http_data_only=None, collection_formats=None,
-                 _preload_content=True, _request_timeout=None, _host=None):
+                 _preload_content=True, _request_timeout=None, _host=None,
+                 _response_mode=None, _headers=None):
         """Makes the HTTP request (synchronous) and returns deserialized data.
 
         To make an async_req request, set the async_req parameter.
@@ -327,6 +575,10 @@ class ApiClient(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_mode: overrides `configuration.response_mode`, e.g.
+                               'dict' to return plain dicts.
+        :param _headers: dict of headers sent with this request only, e.g.
+                         its own `Idempotency-Key`.
         :return:
             If async_req parameter is True,
             the request will be called asynchronously.
@@ -340,7 +592,8 @@ class ApiClient(object):
                                    body, post_params, files,
                                    response_type, auth_settings,
                                    _return_http_data_only, collection_formats,
-                                   _preload_content, _request_timeout, _host)
+                                   _preload_content, _request_timeout, _host,
+                                   _response_mode, _headers)
 
         return self.pool.apply_async(self.__call_api, (resource_path,
                                                        method, path_params,
@@ -353,7 +606,9 @@ class ApiClient(object):
                                                        collection_formats,
                                                        _preload_content,
                                                        _request_timeout,
-                                                       _host))
+                                                       _host,
+                                                       _response_mode,
+                                                       _headers))
 
     def request(self, method, url, query_params=None, headers=None,
                 post_params=None, body=None, _preload_content=True,
@@ -546,94 +801,6 @@ class ApiClient(object):
             path = os.path.join(os.path.dirname(path), filename)
 
         with open(path, "wb") as f:
-            f.write(response.data)
+            f.write(self._response_body(response))
 
         return path
-
-    def __deserialize_primitive(self, data, klass):
-        """Deserializes string to primitive type.
-
-        :param data: str.
-        :param klass: class literal.
-
-        :return: int, long, float, str, bool.
-        """
-        try:
-            return klass(data)
-        except UnicodeEncodeError:
-            return six.text_type(data)
-        except TypeError:
-            return data
-
-    def __deserialize_object(self, value):
-        """Return an original value.
-
-        :return: object.
-        """
-        return value
-
-    def __deserialize_date(self, string):
-        """Deserializes string to date.
-
-        :param string: str.
-        :return: date.
-        """
-        try:
-            return parse(string).date()
-        except ImportError:
-            return string
-        except ValueError:
-            raise rest.ApiException(
-                status=0,
-                reason="Failed to parse `{0}` as date object".format(string)
-            )
-
-    def __deserialize_datetime(self, string):
-        """Deserializes string to datetime.
-
-        The string should be in iso8601 datetime format.
-
-        :param string: str.
-        :return: datetime.
-        """
-        try:
-            return parse(string)
-        except ImportError:
-            return string
-        except ValueError:
-            raise rest.ApiException(
-                status=0,
-                reason=(
-                    "Failed to parse `{0}` as datetime object"
-                    .format(string)
-                )
-            )
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-
-        if not klass.openapi_types and not hasattr(klass,
-                                                   'get_real_child_model'):
-            return data
-
-        kwargs = {}
-        if (data is not None and
-                klass.openapi_types is not None and
-                isinstance(data, (list, dict))):
-            for attr, attr_type in six.iteritems(klass.openapi_types):
-                if klass.attribute_map[attr] in data:
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self.__deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        if hasattr(instance, 'get_real_child_model'):
-            klass_name = instance.get_real_child_model(data)
-            if klass_name:
-                instance = self.__deserialize(data, klass_name)
-        return instance
@@ -0,0 +1,119 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+from Telstra_Messaging.exceptions import ApiValueError
+
+MAX_MULTI_RECIPIENTS = 10
+"""Messages accepted by one `send_multiple_sms` call"""
+
+
+class SmsBroadcast(object):
+    """Sends the same SMS to many recipients.
+
+    The message is serialized and encoded once; each request body is built
+    by splicing the encoded recipient into the encoded invariant part,
+    instead of sanitizing and encoding a model per recipient. Requests
+    still go through `MessagingApi`, so authentication, retries and
+    circuit breakers apply as usual.
+
+    :param api: MessagingApi to send with.
+    :param message: SendSMSRequest, or its JSON dict, of which every field
+        but `to` is sent to each recipient. Its `to` is ignored and may be
+        empty.
+    :param receipt_off: `receiptOff` of the `send_multiple_sms` messages.
+    """
+
+    def __init__(self, api, message, receipt_off=None):
+        self.api = api
+        codec = api.api_client.configuration.json_codec
+        self._dumps = codec.dumps
+
+        fields = dict(api.api_client.sanitize_for_serialization(message))
+        fields.pop('to', None)
+        self.fields = fields
+        """The JSON fields sent to every recipient"""
+
+        self._sms_tail = _object_tail(codec.dumps(fields))
+
+        entry = {'body': fields.get('body')}
+        if receipt_off is not None:
+            entry['receiptOff'] = receipt_off
+        self._entry_tail = _object_tail(codec.dumps(entry))
+        if fields.get('notifyURL') is not None:
+            self._multi_tail = b'],' + codec.dumps(
+                {'notifyURL': fields['notifyURL']})[1:]
+        else:
+            self._multi_tail = b']}'
+
+    def sms_body(self, to):
+        """Returns the encoded `send_sms` body for recipient `to`."""
+        return b'{"to":' + self._dumps(to) + self._sms_tail
+
+    def multi_body(self, recipients):
+        """Returns the encoded `send_multiple_sms` body for `recipients`."""
+        dumps = self._dumps
+        tail = self._entry_tail
+        return (b'{"smsMulti":[' +
+                b','.join([b'{"to":' + dumps(to) + tail
+                           for to in recipients]) +
+                self._multi_tail)
+
+    def send(self, recipients, **kwargs):
+        """Sends one `send_sms` request per recipient.
+
+        :param recipients: iterable of phone numbers.
+        :param kwargs: passed to `MessagingApi.send_sms`.
+        :return: iterator of (recipient, MessageSentResponseSms) pairs.
+        """
+        for to in recipients:
+            yield to, self.api.send_sms(self.sms_body(to), **kwargs)
+
+    def send_multiple(self, recipients, chunk_size=MAX_MULTI_RECIPIENTS,
+                      **kwargs):
+        """Sends `send_multiple_sms` requests of up to `chunk_size`
+        recipients each.
+
+        Only the `body` and `notifyURL` of the message apply, the other
+        fields of a SendSMSRequest are not supported by the operation.
+
+        :param recipients: iterable of phone numbers.
+        :param kwargs: passed to `MessagingApi.send_multiple_sms`.
+        :return: iterator of (recipients chunk, MessageSentResponseSms)
+            pairs.
+        """
+        unsupported = set(self.fields) - {'body', 'notifyURL'}
+        if unsupported:
+            raise ApiValueError(
+                "send_multiple_sms does not support `%s`" %
+                '`, `'.join(sorted(unsupported)))
+
+        chunk = []
+        for to in recipients:
+            chunk.append(to)
+            if len(chunk) == chunk_size:
+                yield chunk, self.api.send_multiple_sms(
+                    self.multi_body(chunk), **kwargs)
+                chunk = []
+        if chunk:
+            yield chunk, self.api.send_multiple_sms(
+                self.multi_body(chunk), **kwargs)
+
+
+def _object_tail(encoded):
+    """Returns the encoded JSON object `encoded` without its opening
+    brace, prefixed with a comma unless the object is empty."""
+    encoded = encoded.strip()
+    if encoded == b'{}':
+        return b'}'
+    return b',' + encoded[1:]
@@ -0,0 +1,263 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import collections
+from multiprocessing.pool import ThreadPool
+
+from Telstra_Messaging.broadcast import MAX_MULTI_RECIPIENTS
+from Telstra_Messaging.exceptions import ApiValueError
+from Telstra_Messaging.models.message_multi import MessageMulti
+from Telstra_Messaging.retry import monotonic
+
+
+class SmsResult(object):
+    """Outcome of one message of a BulkSmsDispatcher.
+
+    :param request: the (to, body[, options]) item it was sent for.
+    :param message: the Message returned for it, None if the request
+        failed or the API returned no message for the recipient.
+    :param error: the exception its `send_multiple_sms` request failed
+        with, or the ApiValueError of a malformed item, None if it
+        succeeded.
+    """
+
+    __slots__ = ('request', 'message', 'error')
+
+    def __init__(self, request, message=None, error=None):
+        self.request = request
+        self.message = message
+        self.error = error
+
+    @property
+    def ok(self):
+        """True if the API accepted the message."""
+        return self.error is None and self.message is not None
+
+    def __repr__(self):
+        return 'SmsResult(%r, message=%r, error=%r)' % (
+            self.request, self.message, self.error)
+
+
+class DispatchStats(object):
+    """Progress of a BulkSmsDispatcher."""
+
+    def __init__(self, clock=monotonic):
+        self.clock = clock
+        self.requests = 0
+        """`send_multiple_sms` calls completed"""
+        self.sent = 0
+        """Messages accepted by the API"""
+        self.failed = 0
+        """Malformed messages, and messages of failed requests or missing
+        from their response"""
+        self.started = None
+        self.finished = None
+
+    @property
+    def elapsed(self):
+        """Seconds since the dispatch started."""
+        if self.started is None:
+            return 0.0
+        end = self.finished if self.finished is not None else self.clock()
+        return end - self.started
+
+    def messages_per_second(self):
+        """Throughput of accepted messages."""
+        elapsed = self.elapsed
+        return self.sent / elapsed if elapsed else 0.0
+
+    def __repr__(self):
+        return ('DispatchStats(sent=%d, failed=%d, requests=%d, '
+                '%.1f messages/s)' % (self.sent, self.failed, self.requests,
+                                      self.messages_per_second()))
+
+
+class BulkSmsDispatcher(object):
+    """Sends large numbers of SMS with `send_multiple_sms`.
+
+    Messages are read from an iterable of `(to, body)` or
+    `(to, body, options)` items, where options is a dict of MessageMulti
+    attributes such as `{'receipt_off': True}`. They are packed into
+    requests of up to `batch_size` messages, encoded once with
+    `configuration.json_codec` without building models, and up to
+    `max_in_flight` requests are sent concurrently from a thread pool.
+
+    Input is read only as fast as requests complete, and results are
+    yielded in input order as soon as their request and the ones before it
+    are done, so that campaigns of any size run in constant memory.
+
+    :param api: MessagingApi, or CredentialPool, to send with.
+    :param max_in_flight: requests sent concurrently.
+    :param batch_size: messages per request, at most
+        `broadcast.MAX_MULTI_RECIPIENTS`.
+    """
+
+    def __init__(self, api, max_in_flight=8,
+                 batch_size=MAX_MULTI_RECIPIENTS):
+        if not 1 <= batch_size <= MAX_MULTI_RECIPIENTS:
+            raise ApiValueError(
+                "batch_size must be between 1 and %d" % MAX_MULTI_RECIPIENTS)
+        if max_in_flight < 1:
+            raise ApiValueError("max_in_flight must be at least 1")
+        self.api = api
+        self.max_in_flight = max_in_flight
+        self.batch_size = batch_size
+        self.stats = DispatchStats()
+        """DispatchStats of the last, or current, `dispatch`"""
+        self._dumps = api.api_client.configuration.json_codec.dumps
+
+    def dispatch(self, messages, notify_url=None, **kwargs):
+        """Sends `messages`.
+
+        :param messages: iterable of `(to, body)` or `(to, body, options)`.
+        :param notify_url: `notifyURL` of every request.
+        :param kwargs: passed to `send_multiple_sms`, e.g.
+            `_request_timeout`.
+        :return: iterator of one SmsResult per message, in input order.
+            Failed requests and malformed messages do not stop the
+            dispatch; they are reported with their error, and malformed
+            messages are not sent.
+        """
+        kwargs.setdefault('_response_mode', 'model')
+        stats = self.stats = DispatchStats(self.stats.clock)
+        stats.started = stats.clock()
+        pool = ThreadPool(self.max_in_flight)
+        pending = collections.deque()
+        try:
+            for batch in self._batches(messages):
+                if len(pending) >= self.max_in_flight:
+                    for result in self._results(pending.popleft()):
+                        yield result
+                pending.append(self._submit(pool, batch, notify_url,
+                                            kwargs))
+            while pending:
+                for result in self._results(pending.popleft()):
+                    yield result
+        finally:
+            stats.finished = stats.clock()
+            pool.terminate()
+
+    def _batches(self, messages):
+        batch = []
+        for item in messages:
+            batch.append(item)
+            if len(batch) == self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _submit(self, pool, batch, notify_url, kwargs):
+        """Sends the well-formed messages of `batch` from `pool`.
+
+        Messages are encoded in the dispatching thread so that malformed
+        ones are reported without affecting the requests in flight.
+
+        :return: tuple(batch, errors, AsyncResult), errors holding the
+            ApiValueError of each malformed item and None for the others;
+            the AsyncResult is None if no item is well-formed.
+        """
+        entries = []
+        errors = []
+        for item in batch:
+            try:
+                entries.append(_entry(item))
+            except ApiValueError as e:
+                errors.append(e)
+            else:
+                errors.append(None)
+        if not entries:
+            return batch, errors, None
+        document = {'smsMulti': entries}
+        if notify_url is not None:
+            document['notifyURL'] = notify_url
+        return batch, errors, pool.apply_async(
+            self.api.send_multiple_sms, (self._dumps(document),), kwargs)
+
+    def _results(self, entry):
+        batch, errors, async_result = entry
+        stats = self.stats
+        sent = [item for item, error in zip(batch, errors) if error is None]
+        messages = iter(())
+        if async_result is not None:
+            stats.requests += 1
+            try:
+                response = async_result.get()
+            except Exception as e:
+                errors = [error or e for error in errors]
+            else:
+                messages = iter(_match(sent, _messages(response)))
+
+        results = []
+        for item, error in zip(batch, errors):
+            if error is None:
+                results.append(SmsResult(item, next(messages)))
+            else:
+                results.append(SmsResult(item, error=error))
+        accepted = sum(1 for result in results if result.message is not None)
+        stats.sent += accepted
+        stats.failed += len(batch) - accepted
+        return results
+
+
+def _entry(item):
+    """Returns the `smsMulti` entry of a (to, body[, options]) item.
+
+    :raise ApiValueError: if `item` is malformed.
+    """
+    try:
+        if len(item) == 2:
+            (to, body), options = item, {}
+        else:
+            to, body, options = item
+    except (TypeError, ValueError):
+        raise ApiValueError("Invalid message %r, expected (to, body) or "
+                            "(to, body, options)" % (item,))
+    if not isinstance(options, dict):
+        raise ApiValueError("Invalid message options %r" % (options,))
+    entry = {'to': to, 'body': body}
+    for attr, value in options.items():
+        try:
+            entry[MessageMulti.attribute_map[attr]] = value
+        except KeyError:
+            raise ApiValueError("Got an unexpected message option '%s'" %
+                                attr)
+    return entry
+
+
+def _messages(response):
+    if isinstance(response, dict):
+        return response.get('messages') or []
+    return getattr(response, 'messages', None) or []
+
+
+def _to(message):
+    if isinstance(message, dict):
+        return message.get('to')
+    return message.to
+
+
+def _match(batch, messages):
+    """Returns the message of each item of `batch`.
+
+    The API returns one message per recipient in request order; should the
+    counts differ, messages are matched by recipient instead.
+    """
+    if len(messages) == len(batch):
+        return messages
+    by_to = collections.defaultdict(collections.deque)
+    for message in messages:
+        by_to[_to(message)].append(message)
+    return [by_to[item[0]].popleft() if by_to.get(item[0]) else None
+            for item in batch]
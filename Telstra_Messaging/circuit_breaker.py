@@ -0,0 +1,239 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import logging
+import threading
+
+import urllib3
+
+from Telstra_Messaging.exceptions import ApiException, CircuitOpenException
+from Telstra_Messaging.retry import monotonic
+
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+SMS_OPERATIONS = (
+    ('GET', '/messages/sms'),
+    ('POST', '/messages/sms'),
+    ('POST', '/messages/sms/multi'),
+    ('GET', '/messages/sms/{messageId}/status'),
+)
+"""Operations covered by `MessagingApi.sms_health_check`"""
+
+MMS_OPERATIONS = (
+    ('GET', '/messages/mms'),
+    ('POST', '/messages/mms'),
+    ('GET', '/messages/mms/{messageid}/status'),
+)
+"""Operations covered by `MessagingApi.mms_health_check`"""
+
+
+class CircuitBreaker(object):
+    """Circuit breaker of a single operation.
+
+    The breaker opens after `failure_threshold` consecutive failures. While
+    open, requests are refused until `recovery_timeout` seconds have passed;
+    the breaker then turns half open and lets `half_open_max_calls` probe
+    requests through. A successful probe closes it, a failed one opens it
+    again.
+    """
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0,
+                 half_open_max_calls=1, clock=monotonic):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self._state = CLOSED
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """`closed`, `open` or `half_open`"""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self):
+        if (self._state == OPEN and
+                self.clock() - self.opened_at >= self.recovery_timeout):
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def retry_after(self):
+        """Seconds until the breaker lets a request through, 0 if it
+        currently does."""
+        with self._lock:
+            if self._current_state() != OPEN:
+                return 0.0
+            return max(0.0, self.opened_at + self.recovery_timeout -
+                       self.clock())
+
+    def allow_request(self):
+        """Returns True if a request may be sent now.
+
+        In the half open state every allowed request is counted as a probe.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._state = CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if (self._state == HALF_OPEN or
+                    self.failures >= self.failure_threshold):
+                self._open()
+
+    def open(self):
+        """Forces the breaker open, e.g. after a failed health check."""
+        with self._lock:
+            self._open()
+
+    def _open(self):
+        self._state = OPEN
+        self.opened_at = self.clock()
+
+
+class CircuitBreakerRegistry(object):
+    """Circuit breakers keyed by operation, `(method, resource_path)` as
+    passed to `ApiClient.call_api`, e.g. `('POST', '/messages/sms')`.
+
+    Set it on `Configuration.circuit_breakers` so that ApiClients fail fast
+    with `CircuitOpenException` instead of sending requests to an operation
+    that keeps failing. The state is queryable so that schedulers can shed
+    or defer load:
+
+    >>> breakers.state('POST', '/messages/sms')
+    'open'
+    >>> breakers.retry_after('POST', '/messages/sms')
+    12.5
+
+    Server errors (5xx), errors without a status (0 or None) and connection
+    errors count as failures; any other response proves the operation is
+    reachable.
+
+    :param failure_threshold: consecutive failures that open a breaker.
+    :param recovery_timeout: seconds a breaker stays open before probing.
+    :param half_open_max_calls: probe requests allowed while half open.
+    """
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0,
+                 half_open_max_calls=1):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.clock = monotonic
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, method, resource_path):
+        """Returns the CircuitBreaker of an operation, creating it."""
+        key = (method, resource_path)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = CircuitBreaker(self.failure_threshold,
+                                             self.recovery_timeout,
+                                             self.half_open_max_calls,
+                                             self.clock)
+                    self._breakers[key] = breaker
+        return breaker
+
+    def state(self, method, resource_path):
+        """Returns `closed`, `open` or `half_open` for an operation."""
+        breaker = self._breakers.get((method, resource_path))
+        if breaker is None:
+            return CLOSED
+        return breaker.state
+
+    def retry_after(self, method, resource_path):
+        """Returns the seconds until an operation accepts requests again."""
+        breaker = self._breakers.get((method, resource_path))
+        if breaker is None:
+            return 0.0
+        return breaker.retry_after()
+
+    def snapshot(self):
+        """Returns a dict of operation -> state for every known breaker."""
+        return {key: breaker.state
+                for key, breaker in list(self._breakers.items())}
+
+    def is_failure(self, error):
+        """Returns True if `error` indicates the operation is unhealthy."""
+        if isinstance(error, ApiException):
+            if not error.status:
+                # no response: a transport error wrapped in an ApiException
+                return True
+            return error.status >= 500
+        return isinstance(error, (urllib3.exceptions.HTTPError,
+                                  EnvironmentError))
+
+    def before_request(self, method, resource_path):
+        """Returns the breaker of an operation, raising
+        `CircuitOpenException` if it does not allow a request now."""
+        breaker = self.get(method, resource_path)
+        if not breaker.allow_request():
+            raise CircuitOpenException(method, resource_path,
+                                       breaker.retry_after())
+        return breaker
+
+    def after_request(self, breaker, error=None):
+        """Records the outcome of a request allowed by `before_request`."""
+        if error is not None and self.is_failure(error):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    def seed_from_health_check(self, messaging_api):
+        """Opens the SMS and MMS breakers whose health check reports the
+        service as down or cannot be reached.
+
+        :param messaging_api: MessagingApi used to call `sms_health_check`
+            and `mms_health_check`.
+        :return: dict of `sms`/`mms` -> True if healthy.
+        """
+        checks = (('sms', messaging_api.sms_health_check, SMS_OPERATIONS),
+                  ('mms', messaging_api.mms_health_check, MMS_OPERATIONS))
+        healthy = {}
+        for name, health_check, operations in checks:
+            try:
+                status = health_check().status
+            except (ApiException, urllib3.exceptions.HTTPError) as e:
+                logger.warning("%s health check failed: %s", name, e)
+                status = None
+            healthy[name] = (status or '').lower() == 'up'
+            if not healthy[name]:
+                for method, resource_path in operations:
+                    self.get(method, resource_path).open()
+        return healthy
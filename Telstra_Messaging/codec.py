@@ -0,0 +1,90 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import json
+
+import six
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec(object):
+    """Encodes and decodes JSON documents.
+
+    `Configuration.json_codec` is used for request bodies, responses,
+    notification (webhook) payloads and persisted client state, so a
+    faster backend can be plugged in by implementing `dumps` and `loads`.
+    """
+
+    name = None
+
+    def dumps(self, obj):
+        """Returns the JSON document of `obj` as UTF-8 bytes.
+
+        :param obj: JSON serializable object made of dicts, lists and
+            scalars, see `ApiClient.sanitize_for_serialization`.
+        """
+        raise NotImplementedError()
+
+    def loads(self, data):
+        """Parses a JSON document.
+
+        :param data: document as bytes or text.
+        :raise ValueError: if `data` is not valid JSON.
+        """
+        raise NotImplementedError()
+
+    def __repr__(self):
+        return '<%s>' % type(self).__name__
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JsonCodec using the standard library `json` module."""
+
+    name = 'json'
+
+    def dumps(self, obj):
+        return json.dumps(obj).encode('utf8')
+
+    def loads(self, data):
+        if six.PY3 and isinstance(data, (bytes, bytearray)):
+            # json only detects the encoding of bytes from Python 3.6
+            data = data.decode('utf8')
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JsonCodec using orjson, `pip install Telstra_Messaging[orjson]`."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def dumps(self, obj):
+        return orjson.dumps(obj)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+def default_codec():
+    """Returns the fastest available JsonCodec."""
+    if orjson is not None:
+        return OrjsonCodec()
+    return StdlibJsonCodec()
@@ -0,0 +1,144 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import pprint
+import threading
+
+import six
+
+import Telstra_Messaging.models
+from Telstra_Messaging.model_utils import field_values, hash_model
+
+
+class CompactModel(object):
+    """Base class of the compact model family.
+
+    Compact models have the public attributes, `openapi_types`,
+    `attribute_map` and `to_dict()` output of the generated model they
+    mirror, but store their fields in `__slots__` instead of an instance
+    dictionary and carry no configuration, discriminator or property
+    setters. Values are not validated.
+    """
+
+    __slots__ = ()
+
+    openapi_types = {}
+    attribute_map = {}
+    model = None
+    """The generated model class this class mirrors"""
+
+    def __init__(self, **kwargs):
+        for attr in self.openapi_types:
+            setattr(self, attr, kwargs.pop(attr, None))
+        if kwargs:
+            raise TypeError("%s got unexpected keyword arguments %s" %
+                            (type(self).__name__, ', '.join(sorted(kwargs))))
+
+    def to_dict(self):
+        """Returns the model properties as a dict"""
+        result = {}
+
+        for attr in self.openapi_types:
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = list(map(
+                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
+                    value
+                ))
+            elif hasattr(value, "to_dict"):
+                result[attr] = value.to_dict()
+            elif isinstance(value, dict):
+                result[attr] = dict(map(
+                    lambda item: (item[0], item[1].to_dict())
+                    if hasattr(item[1], "to_dict") else item,
+                    value.items()
+                ))
+            else:
+                result[attr] = value
+
+        return result
+
+    def to_model(self):
+        """Returns an instance of the generated model with the same values.
+        """
+        kwargs = {}
+        for attr in self.openapi_types:
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                value = [x.to_model() if isinstance(x, CompactModel) else x
+                         for x in value]
+            elif isinstance(value, CompactModel):
+                value = value.to_model()
+            kwargs[attr] = value
+        return self.model(**kwargs)
+
+    def to_str(self):
+        """Returns the string representation of the model"""
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self):
+        """For `print` and `pprint`"""
+        return self.to_str()
+
+    def __eq__(self, other):
+        """Returns true if both objects are equal"""
+        if not isinstance(other, type(self)):
+            return False
+
+        return field_values(self) == field_values(other)
+
+    def __ne__(self, other):
+        """Returns true if both objects are not equal"""
+        return not self == other
+
+    def __hash__(self):
+        """Returns a hash of the model properties"""
+        return hash_model(self)
+
+
+_classes = {}
+_lock = threading.Lock()
+
+
+def compact_class(klass):
+    """Returns the compact counterpart of the generated model `klass`.
+
+    :param klass: model class, or string of model class name.
+    """
+    if isinstance(klass, six.string_types):
+        klass = getattr(Telstra_Messaging.models, klass)
+    try:
+        return _classes[klass]
+    except KeyError:
+        pass
+
+    with _lock:
+        if klass not in _classes:
+            _classes[klass] = type(klass.__name__, (CompactModel,), {
+                '__slots__': tuple(klass.openapi_types),
+                '__doc__': "Compact counterpart of `%s.%s`." % (
+                    klass.__module__, klass.__name__),
+                '__module__': __name__,
+                'openapi_types': klass.openapi_types,
+                'attribute_map': klass.attribute_map,
+                'model': klass,
+            })
+        return _classes[klass]
+
+
+# compact.Message, compact.OutboundPollResponse, ...
+for _name, _klass in list(vars(Telstra_Messaging.models).items()):
+    if isinstance(_klass, type) and hasattr(_klass, 'openapi_types'):
+        globals()[_name] = compact_class(_klass)
+del _name, _klass
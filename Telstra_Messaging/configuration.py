@@ -20,6 +20,8 @@ import urllib3
 import six
 from six.moves import http_client as httplib
 
+from Telstra_Messaging.codec import default_codec
+
 
 class Configuration(object):
     """NOTE: This class is auto generated by OpenAPI Generator
@@ -34,6 +36,8 @@ class Configuration(object):
     :param password: Password for HTTP basic authentication
     """
 
+    _default = None
+
     def __init__(self, host="https://tapi.telstra.com/v2",
                  api_key=None, api_key_prefix=None,
                  username="", password=""):
@@ -114,6 +118,51 @@ class Configuration(object):
            requests to the same host, which is often the case here.
            cpu_count * 5 is used as default value to increase performance.
         """
+        self.connection_pool_num_pools = 4
+        """Number of urllib3 connection pools (one per host) kept by the
+           pool manager.
+        """
+        self.connection_pool_block = False
+        """Block when all `connection_pool_maxsize` connections of a pool
+           are in use instead of opening extra, unpooled connections.
+        """
+        self.connection_pool_idle_timeout = None
+        """Close the pooled connections after this many seconds without a
+           request. None keeps them open.
+        """
+        self.tls_session_reuse = False
+        """Resume the TLS session of the previous connection when opening
+           new pooled connections, skipping full handshakes.
+        """
+        self.share_connection_pool = False
+        """Share the urllib3 pool manager with every ApiClient in the
+           process using the same connection settings, see
+           `Telstra_Messaging.transport.PoolRegistry`.
+        """
+
+        self.http2 = False
+        """Multiplex requests over HTTP/2 connections instead of opening one
+           urllib3 connection per in-flight request. Requires the optional
+           httpx[http2] dependency, falls back to urllib3 when it is missing.
+        """
+        self.http2_prior_knowledge = False
+        """Speak HTTP/2 without negotiation (h2c over plain `http://` hosts,
+           e.g. a local stub server). Only used when `http2` is enabled.
+        """
+
+        self.request_compression = False
+        """Gzip request bodies of at least `request_compression_threshold`
+           bytes and send them with `Content-Encoding: gzip`.
+        """
+        self.request_compression_threshold = 1024
+        """Smallest request body, in bytes, that is compressed
+        """
+        self.request_compression_level = 6
+        """zlib compression level of request bodies, 1 (fastest) to 9
+        """
+        self.response_compression = True
+        """Send `Accept-Encoding: gzip` so responses may be compressed
+        """
 
         self.proxy = None
         """Proxy URL
@@ -127,9 +176,56 @@ class Configuration(object):
         self.retries = None
         """Adding retries to override urllib3 default value 3
         """
+        self.retry_policy = None
+        """RetryPolicy replaying throttled or failed idempotent API calls,
+           see `Telstra_Messaging.retry.RetryPolicy`. None disables it.
+        """
+        self.circuit_breakers = None
+        """CircuitBreakerRegistry failing fast on operations that keep
+           failing, see `Telstra_Messaging.circuit_breaker`. None disables it.
+        """
+        self.json_codec = default_codec()
+        """JsonCodec encoding request bodies and decoding responses, see
+           `Telstra_Messaging.codec`. Defaults to orjson when installed.
+        """
+        self.response_mode = 'model'
+        """How responses are deserialized: 'model' builds the generated
+           model classes, 'compact' the memory efficient `__slots__` based
+           classes of `Telstra_Messaging.compact`, 'lazy' generated
+           models that decode each field when it is first read and 'dict'
+           the `to_dict()` output of the models without building them.
+           Can be overridden per call with `_response_mode`.
+        """
+        self.typed_timestamps = False
+        """Deserialize the timestamps that the API declares as strings,
+           such as `OutboundPollResponse.sent_timestamp`, as datetimes.
+           See `Telstra_Messaging.timestamps`.
+        """
         # Disable client side validation
         self.client_side_validation = True
 
+    @classmethod
+    def set_default(cls, default):
+        """Sets the configuration of models created without one.
+
+        :param default: object of Configuration
+        """
+        cls._default = default
+
+    @classmethod
+    def get_default(cls):
+        """Returns the configuration of models created without one.
+
+        A single instance, created on first use, is shared by all such
+        models (including deserialized ones) instead of each of them
+        building its own. Treat it as read-only or replace it with
+        `set_default`.
+        """
+        default = cls._default
+        if default is None:
+            default = cls._default = cls()
+        return default
+
     @property
     def logger_file(self):
         """The logger file.
@@ -0,0 +1,301 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import copy
+import threading
+
+import six
+
+from Telstra_Messaging.api.messaging_api import MessagingApi
+from Telstra_Messaging.api_client import ApiClient
+from Telstra_Messaging.configuration import Configuration
+from Telstra_Messaging.exceptions import (
+    ApiTypeError, ApiValueError, CircuitOpenException,
+    QuotaExhaustedException)
+from Telstra_Messaging.oauth import TokenManager
+from Telstra_Messaging.retry import monotonic
+
+LEAST_LOADED = 'least_loaded'
+"""Send with the credential with the fewest requests in flight per unit
+of weight"""
+ROUND_ROBIN = 'round_robin'
+"""Send with the credentials in turn, in proportion to their weights"""
+STRATEGIES = (LEAST_LOADED, ROUND_ROBIN)
+
+
+class Credential(object):
+    """An application credential of a CredentialPool and its usage.
+
+    :param client_id: `Client key` of the application.
+    :param client_secret: `Client secret` of the application.
+    :param weight: share of the traffic sent with this credential,
+        relative to the other credentials of the pool.
+    :param quota: messages the credential may send per quota period of the
+        pool, None for no limit.
+    """
+
+    def __init__(self, client_id, client_secret, weight=1, quota=None):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.weight = weight
+        self.quota = quota
+        self.api_client = None
+        """ApiClient authenticated with this credential"""
+        self.api = None
+        """MessagingApi of `api_client`"""
+        self.in_flight = 0
+        """Requests being sent"""
+        self.used = 0
+        """Messages sent, or being sent, in the current quota period"""
+        self.sent = 0
+        """Messages sent since the pool was created"""
+        self.errors = 0
+        """Failed requests since the pool was created"""
+        self.period_start = None
+        self._current_weight = 0
+
+    def remaining(self):
+        """Returns the messages left in the current quota period, None if
+        the credential has no quota."""
+        if self.quota is None:
+            return None
+        return max(0, self.quota - self.used)
+
+    def __repr__(self):
+        return 'Credential(%r, weight=%r, quota=%r)' % (
+            self.client_id, self.weight, self.quota)
+
+
+class CredentialPool(object):
+    """Sends messages with several application credentials.
+
+    Quotas and throughput limits apply per application, so the pool
+    creates an ApiClient, authenticated by its own TokenManager, per
+    credential and dispatches each `send_sms` and `send_multiple_sms`
+    call to one of them. The clients share their connections.
+
+    Credentials are chosen with `strategy`, see `STRATEGIES`, among those
+    with quota left. The messages of a request count against the quota of
+    its credential from when it is sent; they are given back only if the
+    API cannot have accepted them, when the request fails before it is sent
+    or is rejected with a 4xx status. When no credential has quota left,
+    requests raise `QuotaExhaustedException` without contacting the API.
+
+    The pool has the `send_sms`, `send_multiple_sms` and `api_client` of a
+    MessagingApi, so it can be used in its place, e.g. by `SmsBroadcast`.
+
+    :param credentials: Credential objects, or (client_id, client_secret)
+        pairs.
+    :param configuration: Configuration the clients are created from, each
+        client gets a copy holding its own access token.
+    :param strategy: `LEAST_LOADED` or `ROUND_ROBIN`.
+    :param quota_period: seconds after which the quotas reset, None if
+        they never do.
+    :param token_cache: TokenCache of the token managers.
+    :param transport: Transport shared by the clients, defaults to the
+        transport of the first client.
+    """
+
+    def __init__(self, credentials, configuration=None,
+                 strategy=LEAST_LOADED, quota_period=None, token_cache=None,
+                 transport=None):
+        if strategy not in STRATEGIES:
+            raise ApiValueError("Invalid strategy `{0}`, must be one of "
+                                "{1}".format(strategy, STRATEGIES))
+        if configuration is None:
+            configuration = Configuration()
+        self.strategy = strategy
+        self.quota_period = quota_period
+        self.clock = monotonic
+        self.credentials = []
+        for credential in credentials:
+            if not isinstance(credential, Credential):
+                credential = Credential(*credential)
+            api_client = ApiClient(copy.copy(configuration),
+                                   transport=transport)
+            transport = api_client.rest_client.transport
+            TokenManager(credential.client_id, credential.client_secret,
+                         cache=token_cache).attach(api_client)
+            credential.api_client = api_client
+            credential.api = MessagingApi(api_client)
+            credential.period_start = self.clock()
+            self.credentials.append(credential)
+        if not self.credentials:
+            raise ApiValueError("CredentialPool needs at least one "
+                                "credential")
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @property
+    def api_client(self):
+        """ApiClient of the first credential, for serialization."""
+        return self.credentials[0].api_client
+
+    def send_sms(self, payload, **kwargs):
+        """`MessagingApi.send_sms` with one of the credentials."""
+        return self._dispatch('send_sms', payload,
+                              self._recipients(payload, 'to'), kwargs)
+
+    def send_multiple_sms(self, payload, **kwargs):
+        """`MessagingApi.send_multiple_sms` with one of the credentials."""
+        return self._dispatch('send_multiple_sms', payload,
+                              self._recipients(payload, 'smsMulti'), kwargs)
+
+    def acquire(self, messages=1):
+        """Chooses the credential of a request of `messages` messages and
+        counts the request as in flight.
+
+        Every acquired credential must be given back with `release`.
+
+        :raise QuotaExhaustedException: if no credential has `messages`
+            messages of quota left.
+        """
+        with self._lock:
+            now = self.clock()
+            available = []
+            for credential in self.credentials:
+                if (self.quota_period is not None and
+                        now - credential.period_start >= self.quota_period):
+                    credential.period_start = now
+                    credential.used = 0
+                remaining = credential.remaining()
+                if remaining is None or remaining >= messages:
+                    available.append(credential)
+            if not available:
+                raise QuotaExhaustedException(self._retry_after(now))
+
+            if self.strategy == ROUND_ROBIN:
+                credential = self._round_robin(available)
+            else:
+                credential = self._least_loaded(available)
+            credential.in_flight += 1
+            credential.used += messages
+            return credential
+
+    def release(self, credential, messages=1, error=None):
+        """Ends a request of `credential`, as returned by `acquire`.
+
+        :param error: the exception the request failed with, if it did. The
+            messages are then given back to the quota if the request was
+            not sent or was rejected with a 4xx status. Timeouts, connection
+            and server errors keep them: the API may have accepted them.
+        """
+        with self._lock:
+            credential.in_flight -= 1
+            if error is None:
+                credential.sent += messages
+            else:
+                credential.errors += 1
+                if _not_accepted(error):
+                    credential.used = max(0, credential.used - messages)
+
+    def stats(self):
+        """Returns the usage of every credential, as a list of dicts."""
+        with self._lock:
+            return [{'client_id': credential.client_id,
+                     'in_flight': credential.in_flight,
+                     'used': credential.used,
+                     'remaining': credential.remaining(),
+                     'sent': credential.sent,
+                     'errors': credential.errors}
+                    for credential in self.credentials]
+
+    def _dispatch(self, operation, payload, messages, kwargs):
+        if kwargs.get('async_req'):
+            raise ApiValueError("CredentialPool does not support async_req")
+        credential = self.acquire(messages)
+        try:
+            result = getattr(credential.api, operation)(payload, **kwargs)
+        except Exception as e:
+            self.release(credential, messages, e)
+            raise
+        self.release(credential, messages)
+        return result
+
+    def _recipients(self, payload, field):
+        """Returns the number of messages of a `send_sms` (`field` 'to') or
+        `send_multiple_sms` (`field` 'smsMulti') request body.
+
+        Pre-encoded bodies, such as those of `SmsBroadcast`, are decoded so
+        that they are counted like models and dicts.
+        """
+        if isinstance(payload, (bytes, six.text_type)):
+            try:
+                payload = self.api_client.configuration.json_codec.loads(
+                    payload)
+            except ValueError:
+                return 1
+        if isinstance(payload, dict):
+            value = payload.get(field)
+        else:
+            value = getattr(payload, 'to' if field == 'to' else 'sms_multi',
+                            None)
+        if field == 'to':
+            return _numbers(value)
+        if not isinstance(value, list):
+            return 1
+        return max(1, sum(_numbers(message.get('to')
+                                   if isinstance(message, dict)
+                                   else getattr(message, 'to', None))
+                          for message in value))
+
+    def _least_loaded(self, available):
+        # rotate the starting point so that ties are spread evenly
+        start = self._next % len(available)
+        self._next += 1
+        best = None
+        for credential in available[start:] + available[:start]:
+            load = float(credential.in_flight) / credential.weight
+            if best is None or load < best[0]:
+                best = (load, credential)
+        return best[1]
+
+    def _round_robin(self, available):
+        # smooth weighted round robin, as in nginx
+        total = 0
+        best = None
+        for credential in available:
+            credential._current_weight += credential.weight
+            total += credential.weight
+            if (best is None or
+                    credential._current_weight > best._current_weight):
+                best = credential
+        best._current_weight -= total
+        return best
+
+    def _retry_after(self, now):
+        if self.quota_period is None:
+            return None
+        return max(0.0, min(credential.period_start + self.quota_period
+                            for credential in self.credentials) - now)
+
+
+def _numbers(to):
+    """Returns the number of recipients of a `to` field."""
+    if isinstance(to, six.string_types):
+        return to.count(',') + 1
+    if isinstance(to, list):
+        return max(1, len(to))
+    return 1
+
+
+def _not_accepted(error):
+    """Returns True if the request that failed with `error` cannot have been
+    accepted by the API."""
+    if isinstance(error, (ApiTypeError, ApiValueError,
+                          CircuitOpenException)):
+        # raised before the request is sent
+        return True
+    status = getattr(error, 'status', None)
+    return status is not None and 400 <= status < 500
@@ -0,0 +1,328 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import datetime
+import re
+import threading
+
+from dateutil.parser import parse
+import six
+
+import Telstra_Messaging.models
+from Telstra_Messaging import compact
+from Telstra_Messaging import lazy
+from Telstra_Messaging import timestamps
+from Telstra_Messaging.exceptions import ApiException
+
+
+MODEL = 'model'
+"""Response mode building the generated model classes"""
+COMPACT = 'compact'
+"""Response mode building `Telstra_Messaging.compact` models"""
+LAZY = 'lazy'
+"""Response mode building models that decode fields on first access"""
+DICT = 'dict'
+"""Response mode returning the `to_dict()` output of models without
+building them"""
+RESPONSE_MODES = (MODEL, COMPACT, LAZY, DICT)
+
+
+PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
+NATIVE_TYPES_MAPPING = {
+    'int': int,
+    'long': int if six.PY3 else long,  # noqa: F821
+    'float': float,
+    'str': str,
+    'bool': bool,
+    'date': datetime.date,
+    'datetime': datetime.datetime,
+    'object': object,
+}
+
+_LIST_TYPE = re.compile(r'list\[(.*)\]')
+_DICT_TYPE = re.compile(r'dict\(([^,]*), (.*)\)')
+
+
+class PlanCache(object):
+    """Compiles response types into cached decoders.
+
+    A decoder turns parsed JSON (dicts, lists and scalars) into the objects
+    described by a type string such as `'list[OutboundPollResponse]'` or by
+    a class literal. The type is parsed and its models are looked up once,
+    so decoding an element is a loop over precomputed
+    `(json key, attribute, decoder)` triples.
+
+    Decoders are compiled per response mode, see `RESPONSE_MODES`.
+    """
+
+    def __init__(self):
+        self._plans = {}
+        # decoders being compiled, published to _plans once complete
+        self._pending = {}
+        self._depth = 0
+        self._lock = threading.RLock()
+
+    def get(self, klass, mode=MODEL, typed_timestamps=False):
+        """Returns the decoder of `klass`, compiling it on first use.
+
+        :param klass: class literal, or string of class name.
+        :param mode: response mode, one of `RESPONSE_MODES`.
+        :param typed_timestamps: decode the string attributes listed in
+            `timestamps.TIMESTAMP_FIELDS` as datetimes.
+        :return: callable taking parsed JSON and returning the object.
+        """
+        key = (klass, mode, typed_timestamps)
+        try:
+            return self._plans[key]
+        except KeyError:
+            pass
+
+        if mode not in RESPONSE_MODES:
+            raise ValueError("Invalid response mode `{0}`, must be one of "
+                             "{1}".format(mode, RESPONSE_MODES))
+        with self._lock:
+            plan = self._plans.get(key) or self._pending.get(key)
+            if plan is not None:
+                return plan
+            self._depth += 1
+            try:
+                self._compile(klass, key)
+                plan = self._pending[key]
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    if plan is not None:
+                        self._plans.update(self._pending)
+                    self._pending.clear()
+            return plan
+
+    def decode(self, data, klass, mode=MODEL, typed_timestamps=False):
+        """Deserializes dict, list, str into an object of type `klass`."""
+        return self.get(klass, mode, typed_timestamps)(data)
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+
+    def __len__(self):
+        return len(self._plans)
+
+    def _compile(self, klass, plan_key):
+        _, mode, typed_timestamps = plan_key
+        if type(klass) == str:
+            if klass.startswith('list['):
+                item = self.get(_LIST_TYPE.match(klass).group(1), mode,
+                                typed_timestamps)
+
+                def decode(data):
+                    if data is None:
+                        return None
+                    return [item(value) for value in data]
+                self._pending[plan_key] = decode
+                return
+
+            if klass.startswith('dict('):
+                item = self.get(_DICT_TYPE.match(klass).group(2), mode,
+                                typed_timestamps)
+
+                def decode(data):
+                    if data is None:
+                        return None
+                    return {key: item(value)
+                            for key, value in six.iteritems(data)}
+                self._pending[plan_key] = decode
+                return
+
+            # convert str to class
+            if klass in NATIVE_TYPES_MAPPING:
+                cls = NATIVE_TYPES_MAPPING[klass]
+            else:
+                cls = getattr(Telstra_Messaging.models, klass)
+            self._pending[plan_key] = self.get(cls, mode, typed_timestamps)
+            return
+
+        if klass in PRIMITIVE_TYPES:
+            self._pending[plan_key] = _primitive_decoder(klass)
+        elif klass == object:
+            self._pending[plan_key] = _decode_object
+        elif klass == datetime.date:
+            self._pending[plan_key] = _decode_date
+        elif klass == datetime.datetime:
+            self._pending[plan_key] = _decode_datetime
+        else:
+            self._compile_model(klass, plan_key)
+
+    def _fields(self, klass, plan_key):
+        """Returns the (attribute, json key, decoder) triples of a model."""
+        _, mode, typed_timestamps = plan_key
+        timestamp_fields = ()
+        if typed_timestamps:
+            timestamp_fields = timestamps.TIMESTAMP_FIELDS.get(
+                klass.__name__, ())
+        return [(attr, klass.attribute_map[attr],
+                 self.get('datetime' if attr in timestamp_fields
+                          else attr_type, mode, typed_timestamps))
+                for attr, attr_type in six.iteritems(klass.openapi_types)]
+
+    def _compile_model(self, klass, plan_key):
+        _, mode, typed_timestamps = plan_key
+        polymorphic = hasattr(klass, 'get_real_child_model')
+        if not klass.openapi_types and not polymorphic:
+            self._pending[plan_key] = _decode_object
+            return
+
+        if mode == COMPACT and not polymorphic:
+            self._compile_compact_model(klass, plan_key)
+            return
+        if mode == LAZY and not polymorphic:
+            self._compile_lazy_model(klass, plan_key)
+            return
+        if mode == DICT and not polymorphic:
+            self._compile_dict_model(klass, plan_key)
+            return
+
+        model = klass
+        if mode == COMPACT:
+            model = compact.compact_class(klass)
+
+        fields = []
+
+        def decode(data):
+            if data is None:
+                return None
+            kwargs = {}
+            if isinstance(data, dict):
+                for attr, key, field in fields:
+                    if key in data:
+                        kwargs[attr] = field(data[key])
+            instance = model(**kwargs)
+
+            if polymorphic:
+                klass_name = klass.get_real_child_model(instance, data)
+                if klass_name:
+                    instance = self.decode(data, klass_name, mode,
+                                           typed_timestamps)
+            return instance
+
+        # registered before its fields so that recursive models resolve
+        self._pending[plan_key] = decode
+        fields.extend(self._fields(klass, plan_key))
+
+    def _compile_compact_model(self, klass, plan_key):
+        model = compact.compact_class(klass)
+        new = model.__new__
+        fields = []
+
+        # every slot is assigned through its descriptor, skipping __init__
+        def decode(data):
+            if data is None:
+                return None
+            instance = new(model)
+            if isinstance(data, dict):
+                for slot, key, field in fields:
+                    value = data.get(key)
+                    slot(instance, None if value is None else field(value))
+            else:
+                for slot, key, field in fields:
+                    slot(instance, None)
+            return instance
+
+        self._pending[plan_key] = decode
+        fields.extend((getattr(model, attr).__set__, key, field)
+                      for attr, key, field in self._fields(klass, plan_key))
+
+    def _compile_lazy_model(self, klass, plan_key):
+        fields = {}
+        lazy_klass = lazy.lazy_class(klass, fields)
+        attributes = [(attr, klass.attribute_map[attr])
+                      for attr in klass.openapi_types]
+        new = lazy.new
+        empty = {}
+
+        def decode(data):
+            if data is None:
+                return None
+            if not isinstance(data, dict):
+                data = empty
+            return new(lazy_klass, data, attributes)
+
+        self._pending[plan_key] = decode
+        fields.update(('_' + attr, (key, field))
+                      for attr, key, field in self._fields(klass, plan_key))
+
+    def _compile_dict_model(self, klass, plan_key):
+        fields = []
+        empty = {}
+
+        def decode(data):
+            if data is None:
+                return None
+            if not isinstance(data, dict):
+                data = empty
+            return {attr: field(data.get(key)) for attr, key, field in fields}
+
+        self._pending[plan_key] = decode
+        fields.extend(self._fields(klass, plan_key))
+
+
+def _primitive_decoder(klass):
+    def decode(data):
+        if data is None or type(data) is klass:
+            return data
+        try:
+            return klass(data)
+        except UnicodeEncodeError:
+            return six.text_type(data)
+        except TypeError:
+            return data
+    return decode
+
+
+def _decode_object(data):
+    return data
+
+
+def _decode_date(string):
+    if string is None:
+        return None
+    try:
+        return parse(string).date()
+    except ImportError:
+        return string
+    except ValueError:
+        raise ApiException(
+            status=0,
+            reason="Failed to parse `{0}` as date object".format(string)
+        )
+
+
+def _decode_datetime(string):
+    if string is None:
+        return None
+    try:
+        return timestamps.cache.parse(string)
+    except ImportError:
+        return string
+    except ValueError:
+        raise ApiException(
+            status=0,
+            reason=(
+                "Failed to parse `{0}` as datetime object"
+                .format(string)
+            )
+        )
+
+
+plans = PlanCache()
+"""Process-wide decoder cache used by ApiClient.deserialize"""
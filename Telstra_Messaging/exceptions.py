@@ -109,6 +109,32 @@ class ApiException(OpenApiException):
         return error_message
 
 
+class CircuitOpenException(ApiException):
+    """Raised without contacting the API while the circuit breaker of the
+    operation is open."""
+
+    def __init__(self, method, resource_path, retry_after=None):
+        super(CircuitOpenException, self).__init__(
+            status=0,
+            reason="Circuit breaker for {0} {1} is open".format(
+                method, resource_path))
+        self.method = method
+        self.resource_path = resource_path
+        self.retry_after = retry_after
+        """seconds until the breaker lets a probe request through"""
+
+
+class QuotaExhaustedException(ApiException):
+    """Raised without contacting the API when every credential of a
+    CredentialPool has used its message quota."""
+
+    def __init__(self, retry_after=None):
+        super(QuotaExhaustedException, self).__init__(
+            status=0, reason="Message quota of every credential is used")
+        self.retry_after = retry_after
+        """seconds until a quota period ends, None if quotas do not reset"""
+
+
 def render_path(path_to_item):
     """Returns a string representation of a path"""
     result = ""
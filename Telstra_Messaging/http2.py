@@ -0,0 +1,114 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import logging
+import ssl
+
+import certifi
+import urllib3
+
+from Telstra_Messaging.transport import Transport, TransportResponse
+
+try:
+    import httpx
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def is_available():
+    """Returns True if the optional HTTP/2 dependencies are installed."""
+    return httpx is not None
+
+
+class HTTP2Transport(Transport):
+    """Transport multiplexing requests over a few HTTP/2 connections.
+
+    Concurrent requests from several threads share a connection instead of
+    each holding their own socket. Servers that do not negotiate `h2` over
+    TLS are spoken to over HTTP/1.1.
+
+    :param configuration: .Configuration object for this client
+    :param maxsize: maximum number of connections kept per host.
+    """
+
+    def __init__(self, configuration, maxsize=None):
+        if maxsize is None:
+            maxsize = configuration.connection_pool_maxsize or 4
+
+        if configuration.verify_ssl:
+            if configuration.ssl_ca_cert:
+                ca_certs = configuration.ssl_ca_cert
+            else:
+                ca_certs = certifi.where()
+            verify = ssl.create_default_context(cafile=ca_certs)
+            if configuration.assert_hostname is False:
+                verify.check_hostname = False
+        else:
+            verify = False
+
+        cert = None
+        if configuration.cert_file:
+            cert = (configuration.cert_file, configuration.key_file)
+
+        proxy = None
+        if configuration.proxy:
+            proxy = httpx.Proxy(configuration.proxy,
+                                headers=configuration.proxy_headers)
+
+        self.client = httpx.Client(
+            http1=not configuration.http2_prior_knowledge,
+            http2=True,
+            verify=verify,
+            cert=cert,
+            proxy=proxy,
+            timeout=None,
+            limits=httpx.Limits(max_connections=maxsize,
+                                max_keepalive_connections=maxsize),
+        )
+
+    def close(self):
+        self.client.close()
+
+    def request(self, method, url, headers=None, body=None, timeout=None,
+                preload_content=True):
+        if timeout is None:
+            timeout = httpx.Timeout(None)
+        elif isinstance(timeout, tuple):
+            timeout = httpx.Timeout(None, connect=timeout[0],
+                                    read=timeout[1])
+        else:
+            timeout = httpx.Timeout(timeout)
+
+        try:
+            r = self.client.request(method, url, content=body,
+                                    headers=headers, timeout=timeout)
+        except httpx.TimeoutException as e:
+            raise urllib3.exceptions.TimeoutError(str(e))
+        except httpx.ConnectError as e:
+            if isinstance(e.__context__, ssl.SSLError):
+                raise urllib3.exceptions.SSLError(str(e))
+            raise urllib3.exceptions.NewConnectionError(None, str(e))
+        except httpx.TransportError as e:
+            raise urllib3.exceptions.ProtocolError(str(e))
+
+        logger.debug("%s %s %s %d", r.http_version, method, url,
+                     r.status_code)
+        response = TransportResponse(r.status_code, r.reason_phrase,
+                                     r.headers.multi_items(), r.content)
+        response.http_version = r.http_version
+        return response
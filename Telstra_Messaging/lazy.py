@@ -0,0 +1,91 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+from Telstra_Messaging.configuration import Configuration
+
+
+class LazyModel(object):
+    """Mixin deferring the deserialization of model fields until accessed.
+
+    Lazy models are subclasses of the generated models wrapping the parsed
+    JSON document. A field is converted, and nested models are built, the
+    first time its attribute is read; the result is kept like any value
+    set through the model's setter. Missing required fields are reported
+    when the model is created, as with eager deserialization, while errors
+    in nested models surface when the field holding them is first read.
+    """
+
+    __slots__ = ()
+
+    _lazy_fields = {}
+    """private attribute name -> (json key, decoder)"""
+
+    def __getattr__(self, name):
+        # only called for attributes that are not set yet, i.e. the
+        # private `_<attribute>` of fields that were not decoded yet
+        try:
+            key, decode = type(self)._lazy_fields[name]
+        except KeyError:
+            raise AttributeError("'%s' object has no attribute '%s'" %
+                                 (type(self).__name__, name))
+        value = decode(self.__dict__['_lazy_data'][key])
+        self.__dict__[name] = value
+        return value
+
+    def materialize(self):
+        """Decodes every remaining field and releases the JSON document."""
+        for name in type(self)._lazy_fields:
+            getattr(self, name)
+        self.__dict__.pop('_lazy_data', None)
+        return self
+
+    def __reduce_ex__(self, protocol):
+        # copies and pickles are plain, fully decoded models
+        self.materialize()
+        model = type(self).__bases__[1]
+        return _new_model, (model,), dict(self.__dict__)
+
+
+def _new_model(model):
+    return model.__new__(model)
+
+
+def lazy_class(klass, fields):
+    """Returns a lazy subclass of the generated model `klass`.
+
+    :param klass: model class.
+    :param fields: dict of private attribute name to (json key, decoder).
+    """
+    return type(klass.__name__, (LazyModel, klass), {
+        '__doc__': klass.__doc__,
+        '__module__': klass.__module__,
+        '_lazy_fields': fields,
+    })
+
+
+def new(lazy_klass, data, attributes):
+    """Creates an instance of `lazy_klass` wrapping the JSON object `data`.
+
+    :param attributes: (attribute, json key) pairs of every field. Fields
+        missing from `data` are set to None through their setter, so that
+        required fields are validated as by the model's constructor.
+    """
+    instance = lazy_klass.__new__(lazy_klass)
+    instance.local_vars_configuration = Configuration.get_default()
+    instance.discriminator = None
+    instance._lazy_data = data
+    for attr, key in attributes:
+        if data.get(key) is None:
+            setattr(instance, attr, None)
+    return instance
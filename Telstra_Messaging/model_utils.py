@@ -0,0 +1,68 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import operator
+
+import six
+
+_getters = {}
+
+
+def field_values(model):
+    """Returns the values of the properties of `model` as a tuple, in
+    `openapi_types` order.
+
+    Models compare equal when these are equal, which compares nested
+    models field by field instead of rebuilding their `to_dict()`.
+    """
+    try:
+        getter = _getters[type(model)]
+    except KeyError:
+        getter = _getters.setdefault(type(model),
+                                     _values_getter(model.openapi_types))
+    return getter(model)
+
+
+def hash_model(model):
+    """Returns a hash of the properties of `model`, consistent with
+    comparing `field_values`.
+
+    Lists and dicts are hashed by content, so a model must not be changed
+    while it is a member of a set or a key of a dict.
+    """
+    values = field_values(model)
+    try:
+        return hash(values)
+    except TypeError:
+        # lists or dicts among the values
+        return hash(tuple(_freeze(value) for value in values))
+
+
+def _values_getter(openapi_types):
+    attrs = list(openapi_types)
+    if not attrs:
+        return lambda model: ()
+    if len(attrs) == 1:
+        attr = attrs[0]
+        return lambda model: (getattr(model, attr),)
+    return operator.attrgetter(*attrs)
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item))
+                         for key, item in six.iteritems(value))
+    return value
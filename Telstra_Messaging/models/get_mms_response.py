@@ -16,6 +16,7 @@ import re  # noqa: F401
 import six
 
 from Telstra_Messaging.configuration import Configuration
+from Telstra_Messaging.model_utils import field_values, hash_model
 
 
 class GetMmsResponse(object):
@@ -57,7 +58,7 @@ class GetMmsResponse(object):
     def __init__(self, status=None, destination_address=None, sender_address=None, subject=None, message_id=None, api_msg_id=None, sent_timestamp=None, mms_content=None, local_vars_configuration=None):  # noqa: E501
         """GetMmsResponse - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
-            local_vars_configuration = Configuration()
+            local_vars_configuration = Configuration.get_default()
         self.local_vars_configuration = local_vars_configuration
 
         self._status = None
@@ -313,11 +314,15 @@ class GetMmsResponse(object):
         if not isinstance(other, GetMmsResponse):
             return False
 
-        return self.to_dict() == other.to_dict()
+        return field_values(self) == field_values(other)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
         if not isinstance(other, GetMmsResponse):
             return True
 
-        return self.to_dict() != other.to_dict()
+        return field_values(self) != field_values(other)
+
+    def __hash__(self):
+        """Returns a hash of the model properties"""
+        return hash_model(self)
@@ -16,6 +16,7 @@ import re  # noqa: F401
 import six
 
 from Telstra_Messaging.configuration import Configuration
+from Telstra_Messaging.model_utils import field_values, hash_model
 
 
 class GetSubscriptionResponse(object):
@@ -47,7 +48,7 @@ class GetSubscriptionResponse(object):
     def __init__(self, active_days=None, notify_url=None, destination_address=None, local_vars_configuration=None):  # noqa: E501
         """GetSubscriptionResponse - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
-            local_vars_configuration = Configuration()
+            local_vars_configuration = Configuration.get_default()
         self.local_vars_configuration = local_vars_configuration
 
         self._active_days = None
@@ -168,11 +169,15 @@ class GetSubscriptionResponse(object):
         if not isinstance(other, GetSubscriptionResponse):
             return False
 
-        return self.to_dict() == other.to_dict()
+        return field_values(self) == field_values(other)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
         if not isinstance(other, GetSubscriptionResponse):
             return True
 
-        return self.to_dict() != other.to_dict()
+        return field_values(self) != field_values(other)
+
+    def __hash__(self):
+        """Returns a hash of the model properties"""
+        return hash_model(self)
@@ -16,6 +16,7 @@ import re  # noqa: F401
 import six
 
 from Telstra_Messaging.configuration import Configuration
+from Telstra_Messaging.model_utils import field_values, hash_model
 
 
 class InboundPollResponse(object):
@@ -53,7 +54,7 @@ class InboundPollResponse(object):
     def __init__(self, status=None, destination_address=None, sender_address=None, message=None, message_id=None, sent_timestamp=None, local_vars_configuration=None):  # noqa: E501
         """InboundPollResponse - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
-            local_vars_configuration = Configuration()
+            local_vars_configuration = Configuration.get_default()
         self.local_vars_configuration = local_vars_configuration
 
         self._status = None
@@ -252,11 +253,15 @@ class InboundPollResponse(object):
         if not isinstance(other, InboundPollResponse):
             return False
 
-        return self.to_dict() == other.to_dict()
+        return field_values(self) == field_values(other)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
         if not isinstance(other, InboundPollResponse):
             return True
 
-        return self.to_dict() != other.to_dict()
+        return field_values(self) != field_values(other)
+
+    def __hash__(self):
+        """Returns a hash of the model properties"""
+        return hash_model(self)
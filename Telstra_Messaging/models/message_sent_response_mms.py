@@ -16,6 +16,7 @@ import re  # noqa: F401
 import six
 
 from Telstra_Messaging.configuration import Configuration
+from Telstra_Messaging.model_utils import field_values, hash_model
 
 
 class MessageSentResponseMms(object):
@@ -51,7 +52,7 @@ class MessageSentResponseMms(object):
     def __init__(self, messages=None, mms_media_kb=None, country=None, message_type=None, number_segments=None, local_vars_configuration=None):  # noqa: E501
         """MessageSentResponseMms - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
-            local_vars_configuration = Configuration()
+            local_vars_configuration = Configuration.get_default()
         self.local_vars_configuration = local_vars_configuration
 
         self._messages = None
@@ -227,11 +228,15 @@ class MessageSentResponseMms(object):
         if not isinstance(other, MessageSentResponseMms):
             return False
 
-        return self.to_dict() == other.to_dict()
+        return field_values(self) == field_values(other)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
         if not isinstance(other, MessageSentResponseMms):
             return True
 
-        return self.to_dict() != other.to_dict()
+        return field_values(self) != field_values(other)
+
+    def __hash__(self):
+        """Returns a hash of the model properties"""
+        return hash_model(self)
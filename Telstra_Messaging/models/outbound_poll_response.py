@@ -16,6 +16,7 @@ import re  # noqa: F401
 import six
 
 from Telstra_Messaging.configuration import Configuration
+from Telstra_Messaging.model_utils import field_values, hash_model
 
 
 class OutboundPollResponse(object):
@@ -49,7 +50,7 @@ class OutboundPollResponse(object):
     def __init__(self, to=None, sent_timestamp=None, received_timestamp=None, delivery_status=None, local_vars_configuration=None):  # noqa: E501
         """OutboundPollResponse - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
-            local_vars_configuration = Configuration()
+            local_vars_configuration = Configuration.get_default()
         self.local_vars_configuration = local_vars_configuration
 
         self._to = None
@@ -194,11 +195,15 @@ class OutboundPollResponse(object):
         if not isinstance(other, OutboundPollResponse):
             return False
 
-        return self.to_dict() == other.to_dict()
+        return field_values(self) == field_values(other)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
         if not isinstance(other, OutboundPollResponse):
             return True
 
-        return self.to_dict() != other.to_dict()
+        return field_values(self) != field_values(other)
+
+    def __hash__(self):
+        """Returns a hash of the model properties"""
+        return hash_model(self)
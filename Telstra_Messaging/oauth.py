@@ -0,0 +1,241 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import logging
+import sys
+import threading
+import time
+
+from Telstra_Messaging.api.authentication_api import AuthenticationApi
+from Telstra_Messaging.exceptions import ApiTypeError
+
+logger = logging.getLogger(__name__)
+
+
+class Token(object):
+    """An OAuth access token and the time it expires at.
+
+    Tokens are immutable, so the token of a `TokenManager` and the header
+    built from it are always swapped together.
+
+    :param access_token: the access token.
+    :param expires_at: expiry, in seconds since the epoch.
+    """
+
+    __slots__ = ('access_token', 'expires_at', 'authorization')
+
+    def __init__(self, access_token, expires_at):
+        self.access_token = access_token
+        self.expires_at = expires_at
+        self.authorization = 'Bearer ' + access_token
+        """Value of the `Authorization` header"""
+
+    @classmethod
+    def from_response(cls, response, now):
+        """Creates a token from the OAuthResponse of `auth_token`.
+
+        :param now: time the token was requested at.
+        """
+        return cls(response.access_token,
+                   now + int(float(response.expires_in)))
+
+    def __repr__(self):
+        return 'Token(expires_at=%r)' % (self.expires_at,)
+
+
+class TokenManager(object):
+    """Keeps the OAuth access token of ApiClients valid.
+
+    Attach the manager to an ApiClient with `attach`; the client then asks
+    the manager for a token before each request of an operation using the
+    `auth` scheme, and the manager obtains tokens with
+    `AuthenticationApi.auth_token` through that client.
+
+    A token is refreshed in a background thread by the first request made
+    less than `refresh_margin` seconds before it expires, while requests
+    keep using the current token. Requests only wait when there is no token
+    or it expires within `min_validity` seconds. Refreshes are single
+    flight: whichever thread starts one, the other threads wait for and
+    share its result instead of requesting tokens of their own.
+
+    The token is published with one assignment of an immutable `Token`, and
+    `configuration.access_token` of the attached clients is updated with
+    it, so that a request never sees half of a refresh.
+
+    :param client_id: `Client key` of the application.
+    :param client_secret: `Client secret` of the application.
+    :param scope: scope of the requested tokens.
+    :param refresh_margin: seconds before expiry from which the token is
+        refreshed in the background.
+    :param min_validity: seconds before expiry from which requests wait
+        for a new token.
+    :param retry_interval: seconds between background refreshes after one
+        failed.
+    :param cache: TokenCache shared with other managers of the same
+        credentials, e.g. a `token_cache.FileTokenCache` shared by the
+        worker processes of a machine. A token is only requested when the
+        cached one is missing, about to expire or the one being replaced.
+    """
+
+    def __init__(self, client_id, client_secret, scope='NSMS',
+                 refresh_margin=300.0, min_validity=30.0, retry_interval=5.0,
+                 cache=None):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.scope = scope
+        self.refresh_margin = refresh_margin
+        self.min_validity = min_validity
+        self.retry_interval = retry_interval
+        self.cache = cache
+        self.clock = time.time
+        self.api_client = None
+        """ApiClient used to request tokens, the first attached one"""
+        self.token_requests = 0
+        """Number of `auth_token` calls made"""
+        self._token = None
+        self._clients = []
+        self._lock = threading.Lock()
+        # guards _background and _next_attempt, _lock is held while a
+        # token is requested
+        self._background_lock = threading.Lock()
+        self._background = None
+        self._next_attempt = 0.0
+
+    @property
+    def cache_key(self):
+        """Key of the tokens of this manager in its cache."""
+        return '%s %s' % (self.client_id, self.scope)
+
+    @property
+    def token(self):
+        """The current Token, None before the first refresh."""
+        return self._token
+
+    def attach(self, api_client):
+        """Makes `api_client` authenticate its requests with the tokens of
+        this manager.
+
+        :return: api_client.
+        :raise ApiTypeError: if `api_client` is an AsyncApiClient, which
+            needs an `aio.AsyncTokenManager`.
+        """
+        self._check_client(api_client)
+        api_client.token_manager = self
+        if self.api_client is None:
+            self.api_client = api_client
+        self._clients.append(api_client)
+        token = self._token
+        if token is not None:
+            api_client.configuration.access_token = token.access_token
+        return api_client
+
+    def _check_client(self, api_client):
+        # the asyncio client can only be an instance if its module is loaded
+        aio = sys.modules.get('Telstra_Messaging.aio.api_client')
+        if aio is not None and isinstance(api_client, aio.AsyncApiClient):
+            raise ApiTypeError(
+                "TokenManager cannot authenticate an AsyncApiClient, use "
+                "Telstra_Messaging.aio.AsyncTokenManager instead")
+
+    def needs_refresh(self, token, min_validity=None):
+        """Returns True if `token` is missing or expires within
+        `min_validity` (defaults to `refresh_margin`) seconds."""
+        if min_validity is None:
+            min_validity = self.refresh_margin
+        return (token is None or
+                self.clock() >= token.expires_at - min_validity)
+
+    def get_token(self):
+        """Returns a valid Token, waiting for a refresh only if the current
+        token is missing or about to expire."""
+        token = self._token
+        if self.needs_refresh(token, self.min_validity):
+            return self._refresh(token)
+        if self.needs_refresh(token):
+            self._refresh_in_background(token)
+        return token
+
+    def refresh(self, access_token=None):
+        """Replaces the token, e.g. after it was revoked.
+
+        :param access_token: the access token found to be invalid. If the
+            current token is already a different one, it is returned
+            without requesting a new one, so that concurrent callers
+            reporting the same token share one refresh.
+        :return: the new Token.
+        """
+        token = self._token
+        if (access_token is not None and token is not None and
+                token.access_token != access_token):
+            return token
+        return self._refresh(token)
+
+    def _refresh(self, observed):
+        """Requests a token unless the token was replaced since `observed`
+        was read; single flight."""
+        with self._lock:
+            token = self._token
+            if token is not observed and token is not None:
+                return token
+            token = self._request(observed)
+            self._set(token)
+            return token
+
+    def _request(self, observed, fetch=None):
+        """Returns a new token, from the cache if it has a usable one."""
+        fetch = fetch or self._fetch
+        if self.cache is None:
+            return fetch()
+        stale = observed.access_token if observed is not None else None
+        return self.cache.get_or_request(
+            self.cache_key,
+            lambda token: (token.access_token != stale and
+                           not self.needs_refresh(token)),
+            fetch)
+
+    def _refresh_in_background(self, observed):
+        with self._background_lock:
+            if (self._background is not None or
+                    self.clock() < self._next_attempt):
+                return
+            thread = self._background = threading.Thread(
+                target=self._background_refresh, args=(observed,),
+                name='Telstra_Messaging-token-refresh')
+        thread.daemon = True
+        thread.start()
+
+    def _background_refresh(self, observed):
+        try:
+            self._refresh(observed)
+        except Exception:
+            logger.warning("Background token refresh failed", exc_info=True)
+            self._next_attempt = self.clock() + self.retry_interval
+        finally:
+            self._background = None
+
+    def _fetch(self):
+        """Requests a token with `AuthenticationApi.auth_token`."""
+        if self.api_client is None:
+            raise ValueError("TokenManager is not attached to an ApiClient")
+        now = self.clock()
+        self.token_requests += 1
+        response = AuthenticationApi(self.api_client).auth_token(
+            self.client_id, self.client_secret, 'client_credentials',
+            scope=self.scope, _response_mode='model')
+        return Token.from_response(response, now)
+
+    def _set(self, token):
+        self._token = token
+        for api_client in self._clients:
+            api_client.configuration.access_token = token.access_token
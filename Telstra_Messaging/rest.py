@@ -13,18 +13,19 @@
 from __future__ import absolute_import
 
 import io
-import json
 import logging
 import re
-import ssl
+import threading
+import zlib
 
-import certifi
 # python 2 and python 3 compatibility library
 import six
 from six.moves.urllib.parse import urlencode
 import urllib3
 
+from Telstra_Messaging import http2
 from Telstra_Messaging.exceptions import ApiException, ApiValueError
+from Telstra_Messaging.transport import Urllib3Transport
 
 
 logger = logging.getLogger(__name__)
@@ -36,7 +37,30 @@ class RESTResponse(io.IOBase):
         self.urllib3_response = resp
         self.status = resp.status
         self.reason = resp.reason
-        self.data = resp.data
+        self.raw_data = resp.data
+        """The response body as received, bytes on Python 3"""
+        self._data = None
+
+    @property
+    def data(self):
+        """The response body as text.
+
+        Decoded from `raw_data` on first access only, JSON responses are
+        parsed straight from `raw_data`.
+        """
+        if self._data is None:
+            data = self.raw_data
+            # In the python 3, the response.data is bytes.
+            # we need to decode it to string.
+            if six.PY3 and isinstance(data, bytes):
+                data = data.decode('utf8')
+            self._data = data
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self.raw_data = value
 
     def getheaders(self):
         """Returns a dictionary of the response headers."""
@@ -47,64 +71,122 @@ class RESTResponse(io.IOBase):
         return self.urllib3_response.getheader(name, default)
 
 
+class CompressionStats(object):
+    """Byte counters of request body compression.
+
+    `request_bytes` counts every request body before compression and
+    `request_bytes_sent` after it, so their difference is the upstream
+    bandwidth saved.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.requests_compressed = 0
+        self.request_bytes = 0
+        self.request_bytes_sent = 0
+        self.responses_compressed = 0
+        self._lock = threading.Lock()
+
+    @property
+    def request_bytes_saved(self):
+        return self.request_bytes - self.request_bytes_sent
+
+    def record_request(self, size, sent):
+        with self._lock:
+            self.requests += 1
+            self.request_bytes += size
+            self.request_bytes_sent += sent
+            if sent != size:
+                self.requests_compressed += 1
+
+    def record_response(self, headers):
+        encoding = headers.get('Content-Encoding') if headers else None
+        if encoding and 'gzip' in encoding.lower():
+            with self._lock:
+                self.responses_compressed += 1
+
+
+class RequestCompression(object):
+    """Gzips request bodies according to a Configuration.
+
+    Bodies of at least `configuration.request_compression_threshold` bytes
+    are compressed when `configuration.request_compression` is set, and
+    `Accept-Encoding: gzip` is requested when
+    `configuration.response_compression` is set. Transports hand back
+    decoded bodies.
+    """
+
+    def __init__(self, configuration):
+        self.configuration = configuration
+        self.stats = CompressionStats()
+
+    def prepare(self, body, headers):
+        """Returns the body to send and the headers to send it with.
+
+        :param body: request body as bytes, or None.
+        :param headers: http request headers, left unchanged.
+        :return: tuple(body, headers)
+        """
+        config = self.configuration
+        headers = dict(headers)
+        if (config.response_compression and
+                'Accept-Encoding' not in headers):
+            headers['Accept-Encoding'] = 'gzip'
+
+        if body is None:
+            return body, headers
+        if isinstance(body, six.text_type):
+            body = body.encode('utf8')
+
+        size = len(body)
+        if (config.request_compression and
+                size >= config.request_compression_threshold and
+                'Content-Encoding' not in headers):
+            compressor = zlib.compressobj(config.request_compression_level,
+                                          zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            body = compressor.compress(body) + compressor.flush()
+            headers['Content-Encoding'] = 'gzip'
+        self.stats.record_request(size, len(body))
+        return body, headers
+
+
 class RESTClientObject(object):
 
-    def __init__(self, configuration, pools_size=4, maxsize=None):
-        # urllib3.PoolManager will pass all kw parameters to connectionpool
-        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
-        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
-        # maxsize is the number of requests to host that are allowed in parallel  # noqa: E501
-        # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
-
-        # cert_reqs
-        if configuration.verify_ssl:
-            cert_reqs = ssl.CERT_REQUIRED
-        else:
-            cert_reqs = ssl.CERT_NONE
-
-        # ca_certs
-        if configuration.ssl_ca_cert:
-            ca_certs = configuration.ssl_ca_cert
-        else:
-            # if not set certificate file, use Mozilla's root certificates.
-            ca_certs = certifi.where()
-
-        addition_pool_args = {}
-        if configuration.assert_hostname is not None:
-            addition_pool_args['assert_hostname'] = configuration.assert_hostname  # noqa: E501
-
-        if configuration.retries is not None:
-            addition_pool_args['retries'] = configuration.retries
-
-        if maxsize is None:
-            if configuration.connection_pool_maxsize is not None:
-                maxsize = configuration.connection_pool_maxsize
+    def __init__(self, configuration, pools_size=None, maxsize=None,
+                 transport=None):
+        """Encodes requests and hands them to a Transport.
+
+        :param configuration: .Configuration object for this client
+        :param pools_size: number of connection pools of the default
+            transport.
+        :param maxsize: connections kept per pool by the default transport.
+        :param transport: Transport to send the requests with. Defaults to
+            an HTTP2Transport if `configuration.http2` is set and httpx is
+            installed, otherwise to an Urllib3Transport.
+        """
+        if transport is None:
+            if configuration.http2 and not http2.is_available():
+                logger.warning("HTTP/2 was requested but httpx[http2] is "
+                               "not installed, falling back to HTTP/1.1.")
+
+            if configuration.http2 and http2.is_available():
+                transport = http2.HTTP2Transport(configuration, maxsize)
             else:
-                maxsize = 4
-
-        # https pool manager
-        if configuration.proxy:
-            self.pool_manager = urllib3.ProxyManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=ca_certs,
-                cert_file=configuration.cert_file,
-                key_file=configuration.key_file,
-                proxy_url=configuration.proxy,
-                proxy_headers=configuration.proxy_headers,
-                **addition_pool_args
-            )
-        else:
-            self.pool_manager = urllib3.PoolManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=ca_certs,
-                cert_file=configuration.cert_file,
-                key_file=configuration.key_file,
-                **addition_pool_args
-            )
+                transport = Urllib3Transport(configuration, pools_size,
+                                             maxsize)
+        self.transport = transport
+        self.configuration = configuration
+        self.compression = RequestCompression(configuration)
+
+    @property
+    def compression_stats(self):
+        """CompressionStats of the requests sent by this client."""
+        return self.compression.stats
+
+    @property
+    def pool_manager(self):
+        """The urllib3.PoolManager of the default transport, if any."""
+        return getattr(self.transport, 'pool_manager', None)
 
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True,
@@ -115,7 +197,8 @@ class RESTClientObject(object):
         :param url: http request url
         :param query_params: query parameters in the url
         :param headers: http request headers
-        :param body: request json body, for `application/json`
+        :param body: request json body, for `application/json`, or the
+                     encoded JSON document as bytes
         :param post_params: request post parameters,
                             `application/x-www-form-urlencoded`
                             and `multipart/form-data`
@@ -137,93 +220,74 @@ class RESTClientObject(object):
             )
 
         post_params = post_params or {}
-        headers = headers or {}
+        # the caller may send the same headers again, e.g. when replaying
+        headers = dict(headers or {})
 
         timeout = None
         if _request_timeout:
-            if isinstance(_request_timeout, (int, ) if six.PY3 else (int, long)):  # noqa: E501,F821
-                timeout = urllib3.Timeout(total=_request_timeout)
+            if isinstance(_request_timeout, (int, float) if six.PY3 else (int, long, float)):  # noqa: E501,F821
+                timeout = _request_timeout
             elif (isinstance(_request_timeout, tuple) and
                   len(_request_timeout) == 2):
-                timeout = urllib3.Timeout(
-                    connect=_request_timeout[0], read=_request_timeout[1])
+                timeout = _request_timeout
 
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
 
-        try:
-            # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
-            if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
-                if query_params:
-                    url += '?' + urlencode(query_params)
-                if re.search('json', headers['Content-Type'], re.IGNORECASE):
-                    request_body = None
-                    if body is not None:
-                        request_body = json.dumps(body)
-                    r = self.pool_manager.request(
-                        method, url,
-                        body=request_body,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
-                elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
-                    r = self.pool_manager.request(
-                        method, url,
-                        fields=post_params,
-                        encode_multipart=False,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
-                elif headers['Content-Type'] == 'multipart/form-data':
-                    # must del headers['Content-Type'], or the correct
-                    # Content-Type which generated by urllib3 will be
-                    # overwritten.
-                    del headers['Content-Type']
-                    r = self.pool_manager.request(
-                        method, url,
-                        fields=post_params,
-                        encode_multipart=True,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
-                # Pass a `string` parameter directly in the body to support
-                # other content types than Json when `body` argument is
-                # provided in serialized form
-                elif isinstance(body, str) or isinstance(body, bytes):
+        request_body = None
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if query_params:
+                url += '?' + urlencode(query_params)
+            if re.search('json', headers['Content-Type'], re.IGNORECASE):
+                if isinstance(body, bytes):
+                    # already encoded, e.g. by Telstra_Messaging.broadcast
                     request_body = body
-                    r = self.pool_manager.request(
-                        method, url,
-                        body=request_body,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
-                else:
-                    # Cannot generate the request from given parameters
-                    msg = """Cannot prepare a request message for provided
-                             arguments. Please check that your arguments match
-                             declared content type."""
-                    raise ApiException(status=0, reason=msg)
-            # For `GET`, `HEAD`
+                elif body is not None:
+                    request_body = self.configuration.json_codec.dumps(body)
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
+                request_body = urlencode(post_params).encode('utf8')
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # the generated Content-Type carries the multipart
+                # boundary, so it replaces the requested one.
+                request_body, headers['Content-Type'] = \
+                    urllib3.encode_multipart_formdata(post_params)
+            # Pass a `string` parameter directly in the body to support
+            # other content types than Json when `body` argument is
+            # provided in serialized form
+            elif isinstance(body, str) or isinstance(body, bytes):
+                request_body = body
             else:
-                r = self.pool_manager.request(method, url,
-                                              fields=query_params,
-                                              preload_content=_preload_content,
-                                              timeout=timeout,
-                                              headers=headers)
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+        # For `GET`, `HEAD`
+        elif query_params:
+            url += '?' + urlencode(query_params)
+
+        request_body, headers = self.compression.prepare(request_body,
+                                                         headers)
+
+        try:
+            r = self.transport.request(method, url,
+                                       headers=headers,
+                                       body=request_body,
+                                       timeout=timeout,
+                                       preload_content=_preload_content)
         except urllib3.exceptions.SSLError as e:
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
             raise ApiException(status=0, reason=msg)
 
+        self.compression.stats.record_response(r.getheaders())
+
         if _preload_content:
             r = RESTResponse(r)
 
-            # In the python 3, the response.data is bytes.
-            # we need to decode it to string.
-            if six.PY3:
-                r.data = r.data.decode('utf8')
-
             # log response body
-            logger.debug("response body: %s", r.data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("response body: %s", r.data)
 
         if not 200 <= r.status <= 299:
             raise ApiException(http_resp=r)
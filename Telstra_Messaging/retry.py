@@ -0,0 +1,205 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+from email.utils import mktime_tz, parsedate_tz
+import logging
+import random
+import time
+
+import urllib3
+
+from Telstra_Messaging.exceptions import (
+    ApiException, CircuitOpenException, QuotaExhaustedException)
+
+
+logger = logging.getLogger(__name__)
+
+monotonic = getattr(time, 'monotonic', time.time)
+
+
+class RetryPolicy(object):
+    """Retries failed API calls with backoff.
+
+    A call is replayed only when the operation is idempotent (`GET`, `HEAD`,
+    `OPTIONS`, `PUT` and `DELETE`, or a `POST` that carries the
+    idempotency header or is listed in `idempotent_operations`) and it
+    failed with one of `retry_statuses` or one of `connection_errors`.
+    ApiExceptions without a status are raised before any response, e.g. by
+    an open circuit breaker or a failed TLS handshake, and are not retried.
+    Delays
+    follow the "decorrelated jitter" schedule,
+    `min(backoff_cap, uniform(backoff_base, 3 * previous_delay))`, and are
+    never shorter than the `Retry-After` header sent by the server. No retry
+    is attempted once it would end after `deadline` seconds from the first
+    attempt.
+
+    Set it on `Configuration.retry_policy` to enable it for an ApiClient.
+
+    :param max_attempts: total number of attempts, including the first.
+    :param backoff_base: smallest delay between attempts, in seconds.
+    :param backoff_cap: largest delay between attempts, in seconds.
+    :param deadline: total time budget for all attempts, in seconds.
+        None disables the deadline.
+    :param retry_statuses: HTTP status codes that are worth retrying.
+    :param idempotency_header: request header that marks a `POST` as safe
+        to replay.
+    :param idempotent_operations: iterable of `(method, resource_path)`
+        tuples, e.g. `('POST', '/messages/sms')`, that are always safe to
+        replay.
+    :param connection_errors: exception classes raised by the transport for
+        connection level failures.
+    """
+
+    IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT',
+                                    'DELETE'])
+
+    def __init__(self, max_attempts=4, backoff_base=0.2, backoff_cap=20.0,
+                 deadline=60.0, retry_statuses=(429, 502, 503, 504),
+                 idempotency_header='Idempotency-Key',
+                 idempotent_operations=None,
+                 connection_errors=(urllib3.exceptions.HTTPError,)):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotency_header = idempotency_header
+        self.idempotent_operations = frozenset(idempotent_operations or ())
+        self.connection_errors = tuple(connection_errors)
+        self.clock = monotonic
+        """Clock used to enforce the deadline"""
+        self.sleep = time.sleep
+        """Function used by the blocking ApiClient to wait between attempts"""
+
+    def is_idempotent(self, method, resource_path, headers=None):
+        """Returns True if the operation can be safely replayed.
+
+        :param method: http request method
+        :param resource_path: path template as passed to `call_api`,
+            e.g. `/messages/sms/{messageId}/status`
+        :param headers: http request headers
+        """
+        if method in self.IDEMPOTENT_METHODS:
+            return True
+        if (method, resource_path) in self.idempotent_operations:
+            return True
+        if headers and self.idempotency_header:
+            return _get_header(headers, self.idempotency_header) is not None
+        return False
+
+    def is_retryable(self, error):
+        """Returns True if `error` is a transient failure."""
+        if isinstance(error, (CircuitOpenException,
+                              QuotaExhaustedException)):
+            # fail fast, the API is not contacted until they clear
+            return False
+        if isinstance(error, ApiException):
+            # transport failures reach the policy as `connection_errors`;
+            # a status-less ApiException is a client side failure
+            return (error.status is not None and
+                    error.status in self.retry_statuses)
+        return isinstance(error, self.connection_errors)
+
+    def get_retry_after(self, error):
+        """Returns the delay requested by the server's `Retry-After`
+        header, in seconds, or None.
+        """
+        headers = getattr(error, 'headers', None)
+        if not headers:
+            return None
+        value = _get_header(headers, 'Retry-After')
+        if value is None:
+            return None
+        value = str(value).strip()
+        if value.isdigit():
+            return float(value)
+        parsed = parsedate_tz(value)
+        if parsed is None:
+            return None
+        return max(0.0, mktime_tz(parsed) - time.time())
+
+    def backoff(self, previous_delay=None):
+        """Returns the next decorrelated jitter delay, in seconds."""
+        if previous_delay is None:
+            previous_delay = self.backoff_base
+        upper = max(self.backoff_base, previous_delay * 3)
+        return min(self.backoff_cap,
+                   random.uniform(self.backoff_base, upper))
+
+    def start(self, method, resource_path, headers=None):
+        """Begins tracking the attempts of one API call.
+
+        :return: RetryState
+        """
+        return RetryState(self, method, resource_path,
+                          self.is_idempotent(method, resource_path, headers))
+
+
+class RetryState(object):
+    """Attempts and delays of a single API call under a RetryPolicy."""
+
+    def __init__(self, policy, method, resource_path, idempotent):
+        self.policy = policy
+        self.method = method
+        self.resource_path = resource_path
+        self.idempotent = idempotent
+        self.attempts = 0
+        self.started = policy.clock()
+        self.previous_delay = None
+
+    def next_delay(self, error, connection_error=False):
+        """Records a failed attempt.
+
+        :param error: the exception raised by the attempt.
+        :param connection_error: True if the caller already classified
+            `error` as a connection level failure.
+        :return: seconds to wait before the next attempt, or None if the
+            error must be raised to the caller.
+        """
+        policy = self.policy
+        self.attempts += 1
+        if not self.idempotent:
+            return None
+        if not connection_error and not policy.is_retryable(error):
+            return None
+        if self.attempts >= policy.max_attempts:
+            return None
+
+        delay = policy.backoff(self.previous_delay)
+        retry_after = policy.get_retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if policy.deadline is not None:
+            elapsed = policy.clock() - self.started
+            if elapsed + delay > policy.deadline:
+                return None
+
+        self.previous_delay = delay
+        logger.info("Retrying %s %s in %.3fs (attempt %d of %d): %s",
+                    self.method, self.resource_path, delay,
+                    self.attempts + 1, policy.max_attempts,
+                    getattr(error, 'status', type(error).__name__))
+        return delay
+
+
+def _get_header(headers, name):
+    value = headers.get(name)
+    if value is not None:
+        return value
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
@@ -0,0 +1,130 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import datetime
+import operator
+
+import six
+
+from Telstra_Messaging.deserializer import PRIMITIVE_TYPES
+
+
+class SerializerCache(object):
+    """Builds JSON serializable objects from request objects.
+
+    The serializer of each type is chosen once and cached. Models get a
+    serializer generated from their `attribute_map` that reads all of their
+    attributes in one call and skips None values, so serializing a model is
+    a single pass over precomputed `(json key, attribute)` pairs. Objects
+    that are neither primitives, containers, dates nor models go through the
+    reflective `sanitize` fallback.
+    """
+
+    def __init__(self):
+        self._serializers = {type(None): _identity}
+
+    def serialize(self, obj):
+        """Builds a JSON POST object, see
+        `ApiClient.sanitize_for_serialization`."""
+        serializer = self._serializers.get(type(obj))
+        if serializer is None:
+            serializer = self._serializers.setdefault(type(obj),
+                                                      self._compile(type(obj)))
+        return serializer(obj)
+
+    def clear(self):
+        self._serializers.clear()
+        self._serializers[type(None)] = _identity
+
+    def __len__(self):
+        return len(self._serializers)
+
+    def _compile(self, cls):
+        serialize = self.serialize
+        if issubclass(cls, PRIMITIVE_TYPES):
+            return _identity
+        elif issubclass(cls, list):
+            return lambda obj: [serialize(sub_obj) for sub_obj in obj]
+        elif issubclass(cls, tuple):
+            return lambda obj: tuple(serialize(sub_obj) for sub_obj in obj)
+        elif issubclass(cls, (datetime.datetime, datetime.date)):
+            return _isoformat
+        elif issubclass(cls, dict):
+            return lambda obj: {key: serialize(val)
+                                for key, val in six.iteritems(obj)}
+        elif (isinstance(getattr(cls, 'openapi_types', None), dict) and
+              isinstance(getattr(cls, 'attribute_map', None), dict)):
+            return self._compile_model(cls)
+        return self.sanitize
+
+    def _compile_model(self, cls):
+        attrs = list(cls.openapi_types)
+        keys = [cls.attribute_map[attr] for attr in attrs]
+        if not attrs:
+            return lambda obj: {}
+        if len(attrs) == 1:
+            key, attr = keys[0], attrs[0]
+
+            def serialize_model(obj):
+                value = getattr(obj, attr)
+                if value is None:
+                    return {}
+                return {key: self.serialize(value)}
+            return serialize_model
+
+        get_values = operator.attrgetter(*attrs)
+        serialize = self.serialize
+        serializers = self._serializers
+
+        def serialize_model(obj):
+            result = {}
+            for key, value in zip(keys, get_values(obj)):
+                if value is not None:
+                    serializer = serializers.get(type(value))
+                    if serializer is _identity:
+                        result[key] = value
+                    else:
+                        result[key] = serialize(value)
+            return result
+        return serialize_model
+
+    def sanitize(self, obj):
+        """Reflective serialization of objects without a serializer."""
+        if isinstance(obj, dict):
+            obj_dict = obj
+        else:
+            # Convert model obj to dict except
+            # attributes `openapi_types`, `attribute_map`
+            # and attributes which value is not None.
+            # Convert attribute name to json key in
+            # model definition for request.
+            obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
+                        for attr, _ in six.iteritems(obj.openapi_types)
+                        if getattr(obj, attr) is not None}
+
+        return {key: self.serialize(val)
+                for key, val in six.iteritems(obj_dict)}
+
+
+def _identity(obj):
+    return obj
+
+
+def _isoformat(obj):
+    return obj.isoformat()
+
+
+serializers = SerializerCache()
+"""Process-wide serializer cache used by
+ApiClient.sanitize_for_serialization"""
@@ -0,0 +1,118 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import datetime
+import re
+import threading
+
+from dateutil.parser import parse
+from dateutil.tz import tzoffset, tzutc
+
+TIMESTAMP_FIELDS = {
+    'GetMmsResponse': ('sent_timestamp',),
+    'InboundPollResponse': ('sent_timestamp',),
+    'OutboundPollResponse': ('sent_timestamp', 'received_timestamp'),
+}
+"""Model attributes declared as strings that hold ISO-8601 timestamps,
+deserialized as datetimes when `Configuration.typed_timestamps` is set"""
+
+_ISO_8601 = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d+))?)?'
+    r'(Z|[+-]\d{2}(?::?\d{2})?)?\Z')
+
+if hasattr(datetime, 'timezone'):
+    UTC = datetime.timezone.utc
+
+    def _fixed_offset(seconds):
+        return datetime.timezone(datetime.timedelta(seconds=seconds))
+else:
+    UTC = tzutc()
+
+    def _fixed_offset(seconds):
+        return tzoffset(None, seconds)
+
+_offsets = {'Z': UTC, '+00:00': UTC, '+0000': UTC, '+00': UTC}
+
+
+def _tzinfo(designator):
+    try:
+        return _offsets[designator]
+    except KeyError:
+        pass
+    digits = designator[1:].replace(':', '')
+    seconds = int(digits[:2]) * 3600 + int(digits[2:4] or 0) * 60
+    if designator[0] == '-':
+        seconds = -seconds
+    return _offsets.setdefault(designator, _fixed_offset(seconds))
+
+
+def parse_iso8601(string):
+    """Parses an ISO-8601 date and time such as
+    `2017-03-17T10:05:22+10:00`.
+
+    Timestamps in the extended format (with or without fraction of second
+    and offset) are parsed by a fixed-format parser; other inputs fall back
+    to `dateutil.parser.parse`. Timestamps with an offset are returned as
+    timezone-aware datetimes, those without as naive ones.
+
+    :raise ValueError: if `string` is not a date and time.
+    """
+    match = _ISO_8601.match(string)
+    if match is None:
+        return parse(string)
+    (year, month, day, hour, minute, second, fraction,
+     designator) = match.groups()
+    microsecond = int(fraction[:6].ljust(6, '0')) if fraction else 0
+    return datetime.datetime(
+        int(year), int(month), int(day), int(hour), int(minute),
+        int(second or 0), microsecond,
+        _tzinfo(designator) if designator else None)
+
+
+class TimestampCache(object):
+    """Parses timestamps, remembering the most recent results.
+
+    Delivery reports and replies often share timestamps, the datetimes of
+    up to `maxsize` distinct strings are kept until the cache is full and
+    is emptied.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def parse(self, string):
+        """Returns `parse_iso8601(string)`, from the cache if possible."""
+        try:
+            return self._cache[string]
+        except KeyError:
+            pass
+        value = parse_iso8601(string)
+        with self._lock:
+            if len(self._cache) >= self.maxsize:
+                self._cache.clear()
+            self._cache[string] = value
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+
+cache = TimestampCache()
+"""Process-wide cache used by the deserializer"""
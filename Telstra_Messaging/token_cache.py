@@ -0,0 +1,146 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import errno
+import os
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from Telstra_Messaging.codec import default_codec
+from Telstra_Messaging.oauth import Token
+
+
+class TokenCache(object):
+    """Storage of OAuth tokens shared by TokenManagers.
+
+    `TokenManager` consults its cache whenever it needs a new token, so
+    that managers sharing a cache, possibly in different processes, share
+    tokens instead of each requesting their own.
+    """
+
+    def load(self, key):
+        """Returns the cached Token of `key`, or None."""
+        raise NotImplementedError()
+
+    def get_or_request(self, key, usable, request):
+        """Returns the cached token of `key` if `usable(token)`, otherwise
+        stores and returns `request()`.
+
+        Implementations must not let two callers sharing the cache request
+        a token for the same key at the same time.
+
+        :param key: credential key, see `TokenManager.cache_key`.
+        :param usable: callable telling whether a cached Token may be used.
+        :param request: callable requesting a new Token.
+        """
+        raise NotImplementedError()
+
+
+class FileTokenCache(TokenCache):
+    """TokenCache shared by the processes of a machine through a file.
+
+    Tokens are stored, with their absolute expiry, in a JSON document
+    encoded with `json_codec`. Access is serialized with advisory `fcntl`
+    locks: a process needing a token holds an exclusive lock on the file
+    while it reads the cached token and, only if that one is missing or
+    about to expire, requests a new one and writes it. The other processes
+    wait for the lock and then find the fresh token, so a fleet of workers
+    starting together or reaching the expiry together makes a single
+    `/oauth/token` call. The file is created readable by its owner only.
+
+    Requires a POSIX system.
+
+    :param path: path of the cache file, shared by the processes.
+    :param json_codec: JsonCodec of the file, defaults to the fastest one
+        installed.
+    """
+
+    def __init__(self, path, json_codec=None):
+        if fcntl is None:
+            raise ImportError("FileTokenCache requires fcntl")
+        self.path = path
+        self.json_codec = json_codec or default_codec()
+
+    def load(self, key):
+        fd = self._open()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH)
+            return self._read(fd).get(key)
+        finally:
+            os.close(fd)
+
+    def get_or_request(self, key, usable, request):
+        fd = self._open()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            tokens = self._read(fd)
+            token = tokens.get(key)
+            if token is not None and usable(token):
+                return token
+            token = request()
+            tokens[key] = token
+            self._write(fd, tokens)
+            return token
+        finally:
+            # closing the descriptor releases the lock
+            os.close(fd)
+
+    def clear(self):
+        """Removes every cached token."""
+        try:
+            os.remove(self.path)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+
+    def _open(self):
+        return os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def _read(self, fd):
+        os.lseek(fd, 0, os.SEEK_SET)
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        try:
+            entries = self.json_codec.loads(b''.join(chunks))
+        except ValueError:
+            # new, or left truncated by a crashed writer
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+        tokens = {}
+        for key, entry in entries.items():
+            try:
+                tokens[key] = Token(entry['access_token'],
+                                    float(entry['expires_at']))
+            except (KeyError, TypeError, ValueError):
+                # malformed entries are misses, replaced when refetched
+                continue
+        return tokens
+
+    def _write(self, fd, tokens):
+        data = self.json_codec.dumps({
+            key: {'access_token': token.access_token,
+                  'expires_at': token.expires_at}
+            for key, token in tokens.items()})
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        while data:
+            data = data[os.write(fd, data):]
@@ -0,0 +1,524 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import io
+import json
+import logging
+import socket
+import ssl
+import threading
+import weakref
+
+import certifi
+import six
+from six.moves import http_client as httplib
+from six.moves.urllib.parse import urlparse
+import urllib3
+from urllib3._collections import HTTPHeaderDict
+
+from Telstra_Messaging.retry import monotonic
+
+
+logger = logging.getLogger(__name__)
+
+
+class Transport(object):
+    """Protocol between `RESTClientObject` and the network.
+
+    `RESTClientObject` encodes the query string and body, so a transport
+    only moves bytes: it sends one request and returns the status, headers
+    and body of the response. Implementations must be safe to call from
+    several threads at once.
+
+    Pass an instance to `ApiClient(transport=...)` to replace the default
+    `Urllib3Transport`.
+    """
+
+    def request(self, method, url, headers=None, body=None, timeout=None,
+                preload_content=True):
+        """Sends a request.
+
+        :param method: http request method, upper case.
+        :param url: absolute url including the query string.
+        :param headers: dict of http request headers.
+        :param body: request body as bytes, or None.
+        :param timeout: None, total timeout in seconds, or a
+            `(connect, read)` tuple of timeouts in seconds.
+        :param preload_content: if False the body may be left unread and
+            the native response object returned.
+        :return: a response with `status`, `reason` and `data` (bytes)
+            attributes and `getheaders()`/`getheader(name, default)`
+            methods, e.g. TransportResponse.
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        """Releases the connections held by the transport."""
+
+
+class TransportResponse(io.IOBase):
+    """A fully read response returned by a Transport."""
+
+    def __init__(self, status, reason=None, headers=None, data=b''):
+        self.status = status
+        self.reason = reason or httplib.responses.get(status)
+        self.headers = HTTPHeaderDict(headers or {})
+        self.data = data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.headers.get(name, default)
+
+    def read(self, *args, **kwargs):
+        return self.data
+
+    def release_conn(self):
+        pass
+
+
+class TransportRequest(object):
+    """A request recorded by InMemoryTransport."""
+
+    def __init__(self, method, url, headers, body, timeout):
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.timeout = timeout
+
+    @property
+    def path(self):
+        return urlparse(self.url).path
+
+    def json(self):
+        """Returns the body decoded from JSON."""
+        if self.body is None:
+            return None
+        body = self.body
+        if isinstance(body, bytes):
+            body = body.decode('utf8')
+        return json.loads(body)
+
+
+class SessionCachingSSLContext(ssl.SSLContext):
+    """SSLContext resuming TLS sessions across connections to a host.
+
+    The session (or TLS 1.3 session ticket) of the last connection to each
+    server name is offered when the next connection is wrapped, so pooled
+    connections opened after the first one skip the full handshake when the
+    server supports resumption. Requires Python 3.6+.
+    """
+
+    def __init__(self, protocol=None):
+        self.sessions = {}
+        """server name -> last ssl.SSLSession"""
+        self.handshakes = 0
+        self.sessions_reused = 0
+        self._last_sockets = {}
+        self._lock = threading.Lock()
+
+    def __new__(cls, protocol=None):
+        if protocol is None:
+            protocol = ssl.PROTOCOL_TLS_CLIENT
+        return super(SessionCachingSSLContext, cls).__new__(cls, protocol)
+
+    def wrap_socket(self, sock, server_side=False,
+                    do_handshake_on_connect=True, suppress_ragged_eofs=True,
+                    server_hostname=None, session=None):
+        if session is None and server_hostname is not None:
+            session = self._session(server_hostname)
+        ssl_sock = super(SessionCachingSSLContext, self).wrap_socket(
+            sock, server_side=server_side,
+            do_handshake_on_connect=do_handshake_on_connect,
+            suppress_ragged_eofs=suppress_ragged_eofs,
+            server_hostname=server_hostname, session=session)
+        if server_hostname is not None:
+            with self._lock:
+                self.handshakes += 1
+                if ssl_sock.session_reused:
+                    self.sessions_reused += 1
+                self._last_sockets[server_hostname] = weakref.ref(ssl_sock)
+                if ssl_sock.session is not None:
+                    self.sessions[server_hostname] = ssl_sock.session
+        return ssl_sock
+
+    def _session(self, server_hostname):
+        with self._lock:
+            # TLS 1.3 tickets arrive after the handshake, so refresh the
+            # session from the previous connection, which has been read
+            # from by now.
+            ref = self._last_sockets.get(server_hostname)
+            last = ref() if ref is not None else None
+            if last is not None:
+                try:
+                    session = last.session
+                except (OSError, ValueError):
+                    session = None
+                if session is not None:
+                    self.sessions[server_hostname] = session
+            return self.sessions.get(server_hostname)
+
+
+def create_ssl_context(configuration):
+    """Returns a SessionCachingSSLContext matching the urllib3 defaults."""
+    context = SessionCachingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    if hasattr(ssl, 'TLSVersion'):
+        context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.options |= getattr(ssl, 'OP_NO_COMPRESSION', 0)
+    if not configuration.verify_ssl or configuration.assert_hostname is False:
+        context.check_hostname = False
+    return context
+
+
+def _read_post_handshake(conn, timeout=0.1):
+    """Processes TLS 1.3 session tickets sent after the handshake.
+
+    Until they are read, urllib3 considers an idle connection with pending
+    data as dropped and replaces it.
+    """
+    sock = getattr(conn, 'sock', None)
+    if not isinstance(sock, ssl.SSLSocket):
+        return
+    previous = sock.gettimeout()
+    sock.settimeout(timeout)
+    try:
+        if not sock.recv(1):
+            conn.close()
+    except (socket.timeout, ssl.SSLWantReadError):
+        pass
+    except (OSError, ssl.SSLError):
+        conn.close()
+    finally:
+        if conn.sock is not None:
+            sock.settimeout(previous)
+
+
+class PoolEntry(object):
+    """A urllib3 PoolManager and the time it was last used.
+
+    When `idle_timeout` is set, the connections of a manager that has not
+    been used for that many seconds are closed before it is used again, so
+    requests do not run into sockets the server has already dropped.
+    """
+
+    def __init__(self, pool_manager, idle_timeout=None):
+        self.pool_manager = pool_manager
+        self.idle_timeout = idle_timeout
+        self.last_used = monotonic()
+        self._lock = threading.Lock()
+
+    def is_idle(self, now=None):
+        if self.idle_timeout is None:
+            return False
+        if now is None:
+            now = monotonic()
+        return now - self.last_used > self.idle_timeout
+
+    def touch(self):
+        """Marks the manager as used, first evicting idle connections."""
+        now = monotonic()
+        with self._lock:
+            if self.is_idle(now):
+                self.pool_manager.clear()
+            self.last_used = now
+
+
+class PoolRegistry(object):
+    """Registry of PoolManagers shared by every Urllib3Transport whose
+    Configuration sets `share_connection_pool`.
+
+    Managers are keyed by everything that makes their connections
+    incompatible (proxy, TLS and pool settings), so ApiClients built for
+    different credentials against the same host reuse warm connections.
+    The module level `shared_pools` instance is used by default.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, factory, idle_timeout=None):
+        """Returns the PoolEntry for `key`, creating its manager with
+        `factory()` on first use."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = PoolEntry(factory(), idle_timeout)
+                self._entries[key] = entry
+            return entry
+
+    def evict_idle(self):
+        """Closes the connections of every idle manager.
+
+        :return: number of managers evicted.
+        """
+        now = monotonic()
+        evicted = 0
+        with self._lock:
+            entries = list(self._entries.values())
+        for entry in entries:
+            with entry._lock:
+                if entry.is_idle(now):
+                    entry.pool_manager.clear()
+                    evicted += 1
+        return evicted
+
+    def clear(self):
+        """Closes and forgets every manager."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            entry.pool_manager.clear()
+
+
+shared_pools = PoolRegistry()
+
+
+class Urllib3Transport(Transport):
+    """Default transport, a `urllib3.PoolManager` (or `ProxyManager`)
+    configured from a Configuration.
+
+    With `configuration.share_connection_pool` set, the manager comes from
+    `registry` and is shared with every other transport using the same
+    connection settings.
+
+    :param configuration: .Configuration object for this client
+    :param pools_size: number of connection pools (one per host), defaults
+        to `configuration.connection_pool_num_pools`.
+    :param maxsize: connections kept per pool, defaults to
+        `configuration.connection_pool_maxsize`.
+    :param registry: PoolRegistry to share managers through, defaults to
+        `shared_pools`.
+    """
+
+    def __init__(self, configuration, pools_size=None, maxsize=None,
+                 registry=None):
+        # urllib3.PoolManager will pass all kw parameters to connectionpool
+        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
+        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
+        # maxsize is the number of requests to host that are allowed in parallel  # noqa: E501
+        # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
+
+        # cert_reqs
+        if configuration.verify_ssl:
+            cert_reqs = ssl.CERT_REQUIRED
+        else:
+            cert_reqs = ssl.CERT_NONE
+
+        # ca_certs
+        if configuration.ssl_ca_cert:
+            ca_certs = configuration.ssl_ca_cert
+        else:
+            # if not set certificate file, use Mozilla's root certificates.
+            ca_certs = certifi.where()
+
+        addition_pool_args = {}
+        if configuration.assert_hostname is not None:
+            addition_pool_args['assert_hostname'] = configuration.assert_hostname  # noqa: E501
+
+        if configuration.retries is not None:
+            addition_pool_args['retries'] = configuration.retries
+
+        if pools_size is None:
+            pools_size = configuration.connection_pool_num_pools
+
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 4
+
+        pool_args = dict(
+            num_pools=pools_size,
+            maxsize=maxsize,
+            block=configuration.connection_pool_block,
+            cert_reqs=cert_reqs,
+            ca_certs=ca_certs,
+            cert_file=configuration.cert_file,
+            key_file=configuration.key_file,
+            **addition_pool_args
+        )
+
+        tls_session_reuse = configuration.tls_session_reuse
+        if tls_session_reuse and not hasattr(ssl.SSLSocket, 'session'):
+            logger.warning("TLS session reuse requires Python 3.6+.")
+            tls_session_reuse = False
+
+        # https pool manager
+        def factory():
+            kwargs = dict(pool_args)
+            if tls_session_reuse:
+                kwargs['ssl_context'] = create_ssl_context(configuration)
+            if configuration.proxy:
+                return urllib3.ProxyManager(
+                    proxy_url=configuration.proxy,
+                    proxy_headers=configuration.proxy_headers,
+                    **kwargs
+                )
+            return urllib3.PoolManager(**kwargs)
+
+        idle_timeout = configuration.connection_pool_idle_timeout
+        self.shared = configuration.share_connection_pool
+        if self.shared:
+            if registry is None:
+                registry = shared_pools
+            key = (configuration.proxy,
+                   tuple(sorted((configuration.proxy_headers or {}).items())),
+                   tuple(sorted(pool_args.items())),
+                   tls_session_reuse)
+            self.pool_entry = registry.get(key, factory, idle_timeout)
+        else:
+            self.pool_entry = PoolEntry(factory(), idle_timeout)
+
+    @property
+    def pool_manager(self):
+        return self.pool_entry.pool_manager
+
+    def request(self, method, url, headers=None, body=None, timeout=None,
+                preload_content=True):
+        if timeout is not None:
+            if isinstance(timeout, tuple):
+                timeout = urllib3.Timeout(connect=timeout[0],
+                                          read=timeout[1])
+            else:
+                timeout = urllib3.Timeout(total=timeout)
+        self.pool_entry.touch()
+        return self.pool_manager.urlopen(method, url,
+                                         body=body,
+                                         headers=headers,
+                                         preload_content=preload_content,
+                                         timeout=timeout)
+
+    def warm_up(self, url, connections):
+        """Opens keep-alive connections to the host of `url`.
+
+        Connections already in the pool count towards `connections`, which
+        is capped at the pool size.
+
+        :return: number of connections opened.
+        """
+        self.pool_entry.touch()
+        pool = self.pool_manager.connection_from_url(url)
+        connections = min(connections, pool.pool.maxsize)
+        checked_out = []
+        opened = []
+        try:
+            for _ in range(connections):
+                try:
+                    conn = pool._get_conn(timeout=0)
+                except urllib3.exceptions.EmptyPoolError:
+                    break
+                checked_out.append(conn)
+                if getattr(conn, 'sock', None) is None:
+                    conn.connect()
+                    opened.append(conn)
+            for conn in opened:
+                _read_post_handshake(conn)
+        finally:
+            for conn in checked_out:
+                pool._put_conn(conn)
+        return len(opened)
+
+    def established(self, url):
+        """Returns the number of idle connections to the host of `url` that
+        are connected."""
+        pool = self.pool_manager.connection_from_url(url)
+        return sum(1 for conn in list(pool.pool.queue)
+                   if getattr(conn, 'sock', None) is not None)
+
+    def close(self):
+        # shared managers are owned by their registry
+        if not self.shared:
+            self.pool_manager.clear()
+
+
+class InMemoryTransport(Transport):
+    """Serves canned responses without any network I/O, for tests and for
+    benchmarking the client in isolation from network latency.
+
+    Responses are either registered per route with `add_response` or
+    computed by `handler(request)`, which receives a TransportRequest and
+    returns a TransportResponse. Every request is recorded in `requests`.
+
+    >>> transport = InMemoryTransport()
+    >>> transport.add_response('POST', '/messages/sms', 201, {...})
+    >>> api = MessagingApi(ApiClient(transport=transport))
+
+    :param handler: optional callable producing the responses.
+    """
+
+    def __init__(self, handler=None):
+        self.handler = handler
+        self.routes = {}
+        self.requests = []
+        self.record = True
+        """Set to False to stop recording requests, e.g. in benchmarks"""
+        self._lock = threading.Lock()
+
+    def add_response(self, method, path, status=200, body=None,
+                     headers=None):
+        """Registers a response for requests whose url path ends with
+        `path`. Responses registered for the same route are served in
+        order, the last one is repeated.
+
+        :param body: bytes, text, or a JSON serializable object.
+        """
+        if body is None:
+            data = b''
+        elif isinstance(body, bytes):
+            data = body
+        elif isinstance(body, six.text_type):
+            data = body.encode('utf8')
+        else:
+            data = json.dumps(body).encode('utf8')
+        headers = dict(headers or {})
+        if body is not None and not isinstance(body, (bytes,
+                                                      six.text_type)):
+            headers.setdefault('Content-Type', 'application/json')
+        with self._lock:
+            self.routes.setdefault((method, path), []).append(
+                (status, headers, data))
+
+    def request(self, method, url, headers=None, body=None, timeout=None,
+                preload_content=True):
+        request = TransportRequest(method, url, headers, body, timeout)
+        if self.record:
+            with self._lock:
+                self.requests.append(request)
+        if self.handler is not None:
+            return self.handler(request)
+        return self._route(request)
+
+    def _route(self, request):
+        path = request.path
+        best = None
+        with self._lock:
+            for (method, route), responses in six.iteritems(self.routes):
+                if method == request.method and path.endswith(route):
+                    if best is None or len(route) > len(best[0]):
+                        best = (route, responses)
+            if best is None:
+                return TransportResponse(404, 'Not Found', {}, b'')
+            responses = best[1]
+            status, headers, data = (responses.pop(0) if len(responses) > 1
+                                     else responses[0])
+        return TransportResponse(status, None, headers, data)
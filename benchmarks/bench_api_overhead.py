@@ -0,0 +1,61 @@
+# coding: utf-8
+
+"""
+Measures the client-side cost of API calls (request building,
+serialization, deserialization) with the network replaced by an
+InMemoryTransport.
+
+    python -m benchmarks.bench_api_overhead
+"""
+
+from __future__ import print_function
+
+import timeit
+
+import Telstra_Messaging
+from Telstra_Messaging.transport import InMemoryTransport
+
+
+def make_api(status_items=100):
+    transport = InMemoryTransport()
+    transport.record = False
+    status_url = ('https://tapi.telstra.com/v2/messages/sms/%s/status'
+                  % ('A' * 32))
+    transport.add_response('POST', '/messages/sms', 201, {
+        'messages': [{'to': '+61412345678', 'deliveryStatus': 'MessageWaiting',
+                      'messageId': 'A' * 32,
+                      'messageStatusURL': status_url}],
+        'country': [{'AUS': 1}], 'messageType': 'SMS', 'numberSegments': 1})
+    transport.add_response('GET', '/status', 200, [
+        {'to': '+61412345678', 'sentTimestamp': '2017-03-17T10:05:22+10:00',
+         'receivedTimestamp': '2017-03-17T10:05:23+10:00',
+         'deliveryStatus': 'DELIVRD'}] * status_items)
+    configuration = Telstra_Messaging.Configuration()
+    configuration.access_token = 'token'
+    api_client = Telstra_Messaging.ApiClient(configuration,
+                                             transport=transport)
+    return Telstra_Messaging.MessagingApi(api_client)
+
+
+def report(name, seconds, number, unit='call'):
+    print("%-40s %10.1f us/%s" % (name, seconds / number * 1e6, unit))
+
+
+def main():
+    api = make_api()
+    payload = Telstra_Messaging.SendSMSRequest(
+        to='+61412345678', body='Hello from the benchmark',
+        notify_url='https://example.com/notify/', validity=60,
+        priority=False)
+
+    number = 2000
+    report('send_sms', timeit.timeit(lambda: api.send_sms(payload),
+                                     number=number), number)
+    number = 200
+    report('get_sms_status (100 items)',
+           timeit.timeit(lambda: api.get_sms_status('abc'), number=number),
+           number)
+
+
+if __name__ == '__main__':
+    main()
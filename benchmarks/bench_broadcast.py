@@ -0,0 +1,72 @@
+# coding: utf-8
+
+"""
+Compares a broadcast through `SmsBroadcast`, which encodes the message once,
+with the naive loop building and sending a `SendSMSRequest` per recipient.
+
+    python -m benchmarks.bench_broadcast
+"""
+
+from __future__ import print_function
+
+import timeit
+
+import Telstra_Messaging
+from Telstra_Messaging.broadcast import SmsBroadcast
+
+from benchmarks.bench_api_overhead import make_api, report
+
+BODY = ('Reminder: your appointment is at 10:30 tomorrow. Reply YES to '
+        'confirm or call us to reschedule.')
+
+
+def naive(api, recipients):
+    for to in recipients:
+        api.send_sms(Telstra_Messaging.SendSMSRequest(
+            to=to, body=BODY, notify_url='https://example.com/notify/',
+            validity=60, priority=False))
+
+
+def broadcast(api, recipients):
+    message = Telstra_Messaging.SendSMSRequest(
+        to='', body=BODY, notify_url='https://example.com/notify/',
+        validity=60, priority=False)
+    for _ in SmsBroadcast(api, message).send(recipients):
+        pass
+
+
+def encode_naive(api, recipients):
+    dumps = api.api_client.configuration.json_codec.dumps
+    for to in recipients:
+        dumps(api.api_client.sanitize_for_serialization(
+            Telstra_Messaging.SendSMSRequest(
+                to=to, body=BODY, notify_url='https://example.com/notify/',
+                validity=60, priority=False)))
+
+
+def encode_broadcast(api, recipients):
+    message = Telstra_Messaging.SendSMSRequest(
+        to='', body=BODY, notify_url='https://example.com/notify/',
+        validity=60, priority=False)
+    sms_body = SmsBroadcast(api, message).sms_body
+    for to in recipients:
+        sms_body(to)
+
+
+def main(count=5000):
+    api = make_api()
+    recipients = ['+614%08d' % i for i in range(count)]
+    for name, func in [('encode per request', encode_naive),
+                       ('encode with SmsBroadcast', encode_broadcast)]:
+        seconds = timeit.timeit(lambda: func(api, recipients), number=1)
+        report('%s (%d recipients)' % (name, count), seconds, count,
+               'recipient')
+    for name, func in [('send_sms loop', naive),
+                       ('SmsBroadcast.send', broadcast)]:
+        seconds = timeit.timeit(lambda: func(api, recipients), number=1)
+        report('%s (%d recipients)' % (name, count), seconds, count,
+               'recipient')
+
+
+if __name__ == '__main__':
+    main()
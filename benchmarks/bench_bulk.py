@@ -0,0 +1,65 @@
+# coding: utf-8
+
+"""
+Compares sending a campaign with one `send_sms` call per recipient against
+BulkSmsDispatcher, against a simulated API answering every request after
+10 ms, and reports the throughput in messages per second.
+
+    python -m benchmarks.bench_bulk
+"""
+
+from __future__ import print_function
+
+import json
+import time
+
+import Telstra_Messaging
+from Telstra_Messaging.bulk import BulkSmsDispatcher
+from Telstra_Messaging.transport import InMemoryTransport, TransportResponse
+
+LATENCY = 0.01
+
+
+def handler(request):
+    time.sleep(LATENCY)
+    body = request.json()
+    recipients = [entry['to'] for entry in body.get('smsMulti', [body])]
+    return TransportResponse(201, None, {
+        'Content-Type': 'application/json'}, json.dumps({
+            'messages': [{'to': to, 'deliveryStatus': 'MessageWaiting',
+                          'messageId': '%032d' % i}
+                         for i, to in enumerate(recipients)],
+            'messageType': 'SMS',
+            'numberSegments': len(recipients)}).encode('utf8'))
+
+
+def campaign(count):
+    return (('+614%08d' % i, 'Your code is %06d' % i) for i in range(count))
+
+
+def main(count=2000):
+    configuration = Telstra_Messaging.Configuration()
+    configuration.access_token = 'token'
+    transport = InMemoryTransport(handler)
+    transport.record = False
+    api = Telstra_Messaging.MessagingApi(Telstra_Messaging.ApiClient(
+        configuration, transport=transport))
+
+    sample = count // 10
+    began = time.time()
+    for to, body in campaign(sample):
+        api.send_sms(Telstra_Messaging.SendSMSRequest(to=to, body=body))
+    print("%-32s %8.0f messages/s" % (
+        'send_sms loop', sample / (time.time() - began)))
+
+    for max_in_flight in (1, 8, 32):
+        dispatcher = BulkSmsDispatcher(api, max_in_flight=max_in_flight)
+        for result in dispatcher.dispatch(campaign(count)):
+            assert result.ok
+        print("%-32s %8.0f messages/s" % (
+            'BulkSmsDispatcher, %d in flight' % max_in_flight,
+            dispatcher.stats.messages_per_second()))
+
+
+if __name__ == '__main__':
+    main()
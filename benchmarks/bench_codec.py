@@ -0,0 +1,72 @@
+# coding: utf-8
+
+"""
+Compares the JSON codecs on `send_multiple_sms` and reports which share of
+the client-side latency is spent encoding the request body and decoding
+the response.
+
+    python -m benchmarks.bench_codec
+"""
+
+from __future__ import print_function
+
+import timeit
+
+import Telstra_Messaging
+from Telstra_Messaging import codec
+from Telstra_Messaging.transport import InMemoryTransport
+
+from benchmarks.bench_api_overhead import report
+
+
+def make_api(json_codec, recipients):
+    transport = InMemoryTransport()
+    transport.record = False
+    transport.add_response('POST', '/messages/sms/multi', 201, {
+        'messages': [{'to': '+614%08d' % i, 'deliveryStatus': 'MessageWaiting',
+                      'messageId': '%032d' % i,
+                      'messageStatusURL': 'https://tapi.telstra.com/v2/'
+                                          'messages/sms/%032d/status' % i}
+                     for i in range(recipients)],
+        'country': [{'AUS': recipients}], 'messageType': 'SMS',
+        'numberSegments': recipients})
+    configuration = Telstra_Messaging.Configuration()
+    configuration.access_token = 'token'
+    configuration.json_codec = json_codec
+    api_client = Telstra_Messaging.ApiClient(configuration,
+                                             transport=transport)
+    return Telstra_Messaging.MessagingApi(api_client), transport
+
+
+def main(recipients=10, number=2000):
+    payload = Telstra_Messaging.SendSmsMultiRequest(
+        sms_multi=[Telstra_Messaging.MessageMulti(
+            to='+614%08d' % i, body='Your appointment is at 10:30 tomorrow',
+            receipt_off=False) for i in range(recipients)],
+        notify_url='https://example.com/notify/')
+
+    codecs = [codec.StdlibJsonCodec()]
+    if codec.orjson is not None:
+        codecs.append(codec.OrjsonCodec())
+    else:
+        print("orjson is not installed, only measuring the stdlib codec")
+
+    for json_codec in codecs:
+        api, transport = make_api(json_codec, recipients)
+        body = api.api_client.sanitize_for_serialization(payload)
+        response = transport.routes[('POST', '/messages/sms/multi')][0][2]
+
+        total = timeit.timeit(lambda: api.send_multiple_sms(payload),
+                              number=number)
+        encode = timeit.timeit(lambda: json_codec.dumps(body), number=number)
+        decode = timeit.timeit(lambda: json_codec.loads(response),
+                               number=number)
+        name = 'send_multiple_sms (%d, %s)' % (recipients, json_codec.name)
+        report(name, total, number)
+        report('  encode + decode', encode + decode, number)
+        print("  serialization share: %.1f%%"
+              % (100.0 * (encode + decode) / total))
+
+
+if __name__ == '__main__':
+    main()
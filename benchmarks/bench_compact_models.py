@@ -0,0 +1,65 @@
+# coding: utf-8
+
+"""
+Compares the memory held per deserialized record by the generated models and
+by the compact `__slots__` based models of `Telstra_Messaging.compact`.
+
+    python -m benchmarks.bench_compact_models
+"""
+
+from __future__ import print_function
+
+import gc
+import timeit
+import tracemalloc
+
+from Telstra_Messaging.deserializer import COMPACT, MODEL, plans
+
+from benchmarks.bench_api_overhead import report
+
+RECORDS = {
+    'Message': {'to': '+61412345678', 'deliveryStatus': 'MessageWaiting',
+                'messageId': 'A' * 32,
+                'messageStatusURL': 'https://tapi.telstra.com/v2/messages/'
+                                    'sms/%s/status' % ('A' * 32)},
+    'OutboundPollResponse': {'to': '+61412345678',
+                             'sentTimestamp': '2017-03-17T10:05:22+10:00',
+                             'receivedTimestamp': '2017-03-17T10:05:23+10:00',
+                             'deliveryStatus': 'DELIVRD'},
+}
+
+
+def held(response_type, data, mode):
+    """Returns the bytes still allocated by the decoded records."""
+    gc.collect()
+    tracemalloc.start()
+    result = plans.decode(data, response_type, mode)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(count=100000):
+    for name, record in sorted(RECORDS.items()):
+        response_type = 'list[%s]' % name
+        # records share their strings, only the model objects are measured
+        data = [dict(record) for _ in range(count)]
+        sizes = {}
+        for mode in (MODEL, COMPACT):
+            plans.decode(data[:1], response_type, mode)
+            sizes[mode] = held(response_type, data, mode) / float(count)
+            number = 3
+            seconds = timeit.timeit(
+                lambda: plans.decode(data, response_type, mode),
+                number=number)
+            report('%s (%s)' % (name, mode), seconds, number * count,
+                   'record')
+            print("%-40s %10.0f bytes/record" % ('', sizes[mode]))
+        print("%-40s %10.1fx less memory"
+              % ('', sizes[MODEL] / sizes[COMPACT]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+# coding: utf-8
+
+"""
+Measures the `send_sms` throughput of a CredentialPool as credentials are
+added, against a simulated API that handles the requests of each
+application one at a time, 5 ms each, as a per-application rate limit
+would.
+
+    python -m benchmarks.bench_credential_pool
+"""
+
+from __future__ import print_function
+
+import json
+import threading
+import time
+from collections import defaultdict
+
+from six.moves.urllib.parse import parse_qs
+
+import Telstra_Messaging
+from Telstra_Messaging.credential_pool import CredentialPool
+from Telstra_Messaging.transport import InMemoryTransport, TransportResponse
+
+SENT = json.dumps({
+    'messages': [{'to': '+61412345678', 'deliveryStatus': 'MessageWaiting',
+                  'messageId': 'A' * 32, 'messageStatusURL': 'https://x'}],
+    'messageType': 'SMS', 'numberSegments': 1}).encode('utf8')
+
+
+class RateLimitedApi(object):
+
+    def __init__(self, latency=0.005):
+        self.latency = latency
+        self.applications = defaultdict(threading.Lock)
+
+    def __call__(self, request):
+        headers = {'Content-Type': 'application/json'}
+        if request.path.endswith('/oauth/token'):
+            client_id = parse_qs(request.body.decode('utf8'))['client_id'][0]
+            return TransportResponse(200, 'OK', headers, json.dumps({
+                'access_token': client_id, 'token_type': 'Bearer',
+                'expires_in': '3599'}).encode('utf8'))
+        with self.applications[request.headers['Authorization']]:
+            time.sleep(self.latency)
+        return TransportResponse(201, 'Created', headers, SENT)
+
+
+def run(credentials, threads, messages):
+    transport = InMemoryTransport(RateLimitedApi())
+    transport.record = False
+    pool = CredentialPool([('app%d' % i, 'secret')
+                           for i in range(credentials)], transport=transport)
+    for credential in pool.credentials:
+        credential.api_client.token_manager.get_token()
+    payload = Telstra_Messaging.SendSMSRequest(to='+61412345678',
+                                               body='Hello')
+
+    def send():
+        for _ in range(messages // threads):
+            pool.send_sms(payload)
+    workers = [threading.Thread(target=send) for _ in range(threads)]
+    began = time.time()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return messages / (time.time() - began)
+
+
+def main(threads=16, messages=800):
+    for credentials in (1, 2, 4, 8):
+        print("%d credential(s): %8.0f messages/s"
+              % (credentials, run(credentials, threads, messages)))
+
+
+if __name__ == '__main__':
+    main()
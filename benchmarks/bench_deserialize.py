@@ -0,0 +1,41 @@
+# coding: utf-8
+
+"""
+Measures how much of deserializing a 10k-item `get_sms_status` response is
+spent parsing JSON and how much building models from it.
+
+    python -m benchmarks.bench_deserialize
+"""
+
+from __future__ import print_function
+
+import json
+import timeit
+
+from Telstra_Messaging.deserializer import plans
+
+from benchmarks.bench_api_overhead import report
+
+
+def main(items=10000):
+    body = json.dumps([
+        {'to': '+61412345678', 'sentTimestamp': '2017-03-17T10:05:22+10:00',
+         'receivedTimestamp': '2017-03-17T10:05:23+10:00',
+         'deliveryStatus': 'DELIVRD'}] * items).encode('utf8')
+    data = json.loads(body)
+    response_type = 'list[OutboundPollResponse]'
+    plans.get(response_type)
+
+    number = 10
+    parse = timeit.timeit(lambda: json.loads(body), number=number)
+    decode = timeit.timeit(lambda: plans.decode(data, response_type),
+                           number=number)
+    unit = 'response'
+    report('json.loads (%d items)' % items, parse, number, unit)
+    report('decode %s' % response_type, decode, number, unit)
+    report('  per item', decode, number * items, 'item')
+    print("parse share: %.0f%%" % (100.0 * parse / (parse + decode)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+# coding: utf-8
+
+"""
+Compares forwarding `get_sms_status` results as dicts by building models and
+calling `to_dict()` with requesting `_response_mode='dict'`.
+
+    python -m benchmarks.bench_dict_mode
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from benchmarks.bench_api_overhead import make_api, report
+
+
+def main(items=100, number=500):
+    api = make_api(status_items=items)
+    to_dict = timeit.timeit(
+        lambda: [m.to_dict() for m in api.get_sms_status('abc')],
+        number=number)
+    raw = timeit.timeit(
+        lambda: api.get_sms_status('abc', _response_mode='dict'),
+        number=number)
+    report('get_sms_status + to_dict() (%d items)' % items, to_dict, number)
+    report("get_sms_status, dict mode (%d items)" % items, raw, number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+# coding: utf-8
+
+"""
+Measures building the headers of a `get_sms_status` request from the
+cached header set of the operation, against rebuilding them (default
+headers, sanitization and `auth_settings()`) for every request.
+
+    python -m benchmarks.bench_headers
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from benchmarks.bench_api_overhead import make_api, report
+
+
+def main(number=100000):
+    api_client = make_api().api_client
+    api_client.set_default_header('X-Tenant', 'benchmark')
+
+    def prepare():
+        return api_client._prepare_request(
+            '/messages/sms/{messageId}/status', 'GET',
+            path_params={'messageId': 'A' * 32},
+            header_params={'Accept': 'application/json'},
+            auth_settings=['auth'])
+
+    def prepare_uncached():
+        api_client._header_sets.clear()
+        return prepare()
+
+    assert prepare() == prepare_uncached()
+    report('prepare request, headers rebuilt',
+           timeit.timeit(prepare_uncached, number=number), number)
+    report('prepare request, cached header set',
+           timeit.timeit(prepare, number=number), number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# coding: utf-8
+
+"""
+Compares eager and lazy deserialization of `retrieve_mms_replies` style
+responses for a worker that only reads `status` and `message_id` of each
+reply.
+
+    python -m benchmarks.bench_lazy_models
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from Telstra_Messaging.deserializer import LAZY, MODEL, plans
+
+from benchmarks.bench_api_overhead import report
+
+
+def reply(index, parts):
+    return {'status': 'RECEIVED', 'destinationAddress': '+61412345678',
+            'senderAddress': '+61487654321', 'subject': 'Photos',
+            'messageId': 'm%d' % index, 'apiMsgId': 'a%d' % index,
+            'sentTimestamp': '2017-03-17T10:05:22+10:00',
+            'MMSContent': [{'type': 'image/jpeg',
+                            'filename': 'photo%d.jpg' % i,
+                            'payload': 'A' * 64} for i in range(parts)]}
+
+
+def route(replies):
+    return [(r.status, r.message_id) for r in replies]
+
+
+def main(count=1000, parts=10):
+    data = [reply(i, parts) for i in range(count)]
+    response_type = 'list[GetMmsResponse]'
+    number = 20
+    for mode in (MODEL, LAZY):
+        plans.decode(data[:1], response_type, mode)
+        seconds = timeit.timeit(
+            lambda: route(plans.decode(data, response_type, mode)),
+            number=number)
+        report('route %d replies (%s)' % (count, mode), seconds,
+               number * count, 'reply')
+
+
+if __name__ == '__main__':
+    main()
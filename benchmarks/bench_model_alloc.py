@@ -0,0 +1,66 @@
+# coding: utf-8
+
+"""
+Measures time and memory allocated per model when deserializing a list of
+status records, with every model building its own Configuration (the
+previous behaviour) and with the shared `Configuration.get_default()`.
+
+    python -m benchmarks.bench_model_alloc
+"""
+
+from __future__ import print_function
+
+import gc
+import timeit
+import tracemalloc
+
+import Telstra_Messaging
+from Telstra_Messaging.deserializer import plans
+
+from benchmarks.bench_api_overhead import report
+
+RECORD = {'to': '+61412345678', 'sentTimestamp': '2017-03-17T10:05:22+10:00',
+          'receivedTimestamp': '2017-03-17T10:05:23+10:00',
+          'deliveryStatus': 'DELIVRD'}
+
+
+def fresh_configuration(items):
+    klass = Telstra_Messaging.OutboundPollResponse
+    return [klass(to=item['to'],
+                  sent_timestamp=item['sentTimestamp'],
+                  received_timestamp=item['receivedTimestamp'],
+                  delivery_status=item['deliveryStatus'],
+                  local_vars_configuration=Telstra_Messaging.Configuration())
+            for item in items]
+
+
+def shared_configuration(items):
+    return plans.decode(items, 'list[OutboundPollResponse]')
+
+
+def allocated(func, items):
+    gc.collect()
+    tracemalloc.start()
+    result = func(items)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(count=5000):
+    items = [dict(RECORD) for _ in range(count)]
+    shared_configuration(items)
+
+    for name, func in [('Configuration() per model', fresh_configuration),
+                       ('shared Configuration', shared_configuration)]:
+        number = 5
+        seconds = timeit.timeit(lambda: func(items), number=number)
+        report('%s (%d items)' % (name, count), seconds, number * count,
+               'item')
+        print("%-40s %10.0f bytes/item"
+              % ('', allocated(func, items) / float(count)))
+
+
+if __name__ == '__main__':
+    main()
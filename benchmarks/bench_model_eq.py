@@ -0,0 +1,55 @@
+# coding: utf-8
+
+"""
+Compares model equality through `to_dict()` (the previous `__eq__`) with the
+field-wise `__eq__`, and deduplicating replies with a set of models against
+a set of keys built from `to_dict()`.
+
+    python -m benchmarks.bench_model_eq
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from Telstra_Messaging.deserializer import plans
+
+from benchmarks.bench_api_overhead import report
+from benchmarks.bench_lazy_models import reply
+
+
+def inbound(index):
+    return {'status': 'RECEIVED', 'destinationAddress': '+61412345678',
+            'senderAddress': '+614%08d' % (index % 1000),
+            'message': 'Reply %d' % (index % 5000),
+            'messageId': 'm%d' % (index % 5000),
+            'sentTimestamp': '2017-03-17T10:05:22+10:00'}
+
+
+def to_dict_key(model):
+    return tuple(sorted(model.to_dict().items()))
+
+
+def main(count=10000, number=20):
+    first, second = plans.decode([reply(1, 10), reply(1, 10)],
+                                 'list[GetMmsResponse]')
+    report('GetMmsResponse to_dict() == to_dict()',
+           timeit.timeit(lambda: first.to_dict() == second.to_dict(),
+                         number=number * 100), number * 100, 'compare')
+    report('GetMmsResponse ==',
+           timeit.timeit(lambda: first == second, number=number * 100),
+           number * 100, 'compare')
+
+    replies = plans.decode([inbound(i) for i in range(count)],
+                           'list[InboundPollResponse]')
+    assert len(set(replies)) == len(set(map(to_dict_key, replies))) == 5000
+    report('dedupe %d replies by to_dict() key' % count,
+           timeit.timeit(lambda: set(map(to_dict_key, replies)),
+                         number=number), number * count, 'reply')
+    report('dedupe %d replies in a set' % count,
+           timeit.timeit(lambda: set(replies), number=number),
+           number * count, 'reply')
+
+
+if __name__ == '__main__':
+    main()
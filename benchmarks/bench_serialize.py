@@ -0,0 +1,63 @@
+# coding: utf-8
+
+"""
+Compares the generated per-model serializers with the reflective walk
+`sanitize_for_serialization` used before on a `send_multiple_sms` payload.
+
+    python -m benchmarks.bench_serialize
+"""
+
+from __future__ import print_function
+
+import datetime
+import timeit
+
+import six
+
+import Telstra_Messaging
+from Telstra_Messaging.deserializer import PRIMITIVE_TYPES
+from Telstra_Messaging.serializer import serializers
+
+from benchmarks.bench_api_overhead import report
+
+
+def reflective(obj):
+    if obj is None:
+        return None
+    elif isinstance(obj, PRIMITIVE_TYPES):
+        return obj
+    elif isinstance(obj, list):
+        return [reflective(sub_obj) for sub_obj in obj]
+    elif isinstance(obj, tuple):
+        return tuple(reflective(sub_obj) for sub_obj in obj)
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+
+    if isinstance(obj, dict):
+        obj_dict = obj
+    else:
+        obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
+                    for attr, _ in six.iteritems(obj.openapi_types)
+                    if getattr(obj, attr) is not None}
+
+    return {key: reflective(val) for key, val in six.iteritems(obj_dict)}
+
+
+def main(recipients=500, number=200):
+    payload = Telstra_Messaging.SendSmsMultiRequest(
+        sms_multi=[Telstra_Messaging.MessageMulti(
+            to='+614%08d' % i, body='Your appointment is at 10:30 tomorrow',
+            receipt_off=False) for i in range(recipients)],
+        notify_url='https://example.com/notify/')
+    assert serializers.serialize(payload) == reflective(payload)
+
+    name = 'SendSmsMultiRequest (%d)' % recipients
+    report('%s reflective' % name,
+           timeit.timeit(lambda: reflective(payload), number=number), number)
+    report('%s generated' % name,
+           timeit.timeit(lambda: serializers.serialize(payload),
+                         number=number), number)
+
+
+if __name__ == '__main__':
+    main()
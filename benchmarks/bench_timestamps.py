@@ -0,0 +1,68 @@
+# coding: utf-8
+
+"""
+Measures the delivery latency computation over a page of
+`get_sms_status` reports: parsing the string timestamps with dateutil, as
+done before `Configuration.typed_timestamps`, against the fixed-format
+parser with and without its cache.
+
+    python -m benchmarks.bench_timestamps
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from dateutil.parser import parse
+
+from Telstra_Messaging import deserializer
+from Telstra_Messaging import timestamps
+
+from benchmarks.bench_api_overhead import report
+
+
+def reports(count):
+    # replies of one broadcast share their sent second
+    return [{'to': '+614%08d' % i, 'messageId': '%032d' % i,
+             'sentTimestamp': '2017-03-17T10:05:%02d+10:00' % (i % 60),
+             'receivedTimestamp': '2017-03-17T10:06:%02d.%03d+10:00'
+                                  % (i % 60, i % 7),
+             'deliveryStatus': 'DELIVRD'} for i in range(count)]
+
+
+def latencies_dateutil(data):
+    responses = deserializer.plans.decode(data, 'list[OutboundPollResponse]')
+    return [parse(response.received_timestamp) -
+            parse(response.sent_timestamp) for response in responses]
+
+
+def latencies_typed(data):
+    responses = deserializer.plans.decode(data, 'list[OutboundPollResponse]',
+                                          typed_timestamps=True)
+    return [response.received_timestamp - response.sent_timestamp
+            for response in responses]
+
+
+def main(count=1000, number=20):
+    data = reports(count)
+    assert latencies_dateutil(data) == latencies_typed(data)
+
+    report('dateutil', timeit.timeit(lambda: latencies_dateutil(data),
+                                     number=number), number * count)
+
+    # a cache of size 0 is emptied before every insertion
+    maxsize = timestamps.cache.maxsize
+    timestamps.cache.maxsize = 0
+    try:
+        report('typed_timestamps, no cache',
+               timeit.timeit(lambda: latencies_typed(data), number=number),
+               number * count)
+    finally:
+        timestamps.cache.maxsize = maxsize
+    timestamps.cache.clear()
+    report('typed_timestamps', timeit.timeit(lambda: latencies_typed(data),
+                                             number=number), number * count)
+
+
+if __name__ == '__main__':
+    main()
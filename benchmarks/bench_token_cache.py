@@ -0,0 +1,96 @@
+# coding: utf-8
+
+"""
+Starts a fleet of worker processes that each need a token, as when gunicorn
+or celery workers boot, and counts the `/oauth/token` requests they make
+with and without a shared FileTokenCache. The token endpoint is simulated
+with a 50 ms latency.
+
+    python -m benchmarks.bench_token_cache
+"""
+
+from __future__ import print_function
+
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+import Telstra_Messaging
+from Telstra_Messaging.token_cache import FileTokenCache
+from Telstra_Messaging.transport import InMemoryTransport, TransportResponse
+
+TOKEN_LATENCY = 0.05
+
+
+class TokenEndpoint(object):
+
+    def __init__(self, issued):
+        self.issued = issued
+
+    def __call__(self, request):
+        time.sleep(TOKEN_LATENCY)
+        with self.issued.get_lock():
+            self.issued.value += 1
+            access_token = 'token-%d' % self.issued.value
+        return TransportResponse(200, 'OK', {
+            'Content-Type': 'application/json'}, json.dumps({
+                'access_token': access_token, 'token_type': 'Bearer',
+                'expires_in': '3599'}).encode('utf8'))
+
+
+def worker(issued, cache_path, start, latencies):
+    api_client = Telstra_Messaging.ApiClient(
+        transport=InMemoryTransport(TokenEndpoint(issued)))
+    cache = FileTokenCache(cache_path) if cache_path else None
+    manager = Telstra_Messaging.TokenManager('id', 'secret', cache=cache)
+    manager.attach(api_client)
+    start.wait()
+    began = time.time()
+    manager.get_token()
+    latencies.put(time.time() - began)
+
+
+def run(processes, cache_path):
+    issued = multiprocessing.Value('i', 0)
+    start = multiprocessing.Event()
+    latencies = multiprocessing.Queue()
+    workers = [multiprocessing.Process(
+        target=worker, args=(issued, cache_path, start, latencies))
+        for _ in range(processes)]
+    for process in workers:
+        process.start()
+    start.set()
+    results = [latencies.get() for _ in workers]
+    for process in workers:
+        process.join()
+    return issued.value, results
+
+
+def main(processes=16):
+    directory = tempfile.mkdtemp()
+    try:
+        for name, cache_path in [
+                ('no cache', None),
+                ('FileTokenCache', os.path.join(directory, 'tokens.json'))]:
+            requests, latencies = run(processes, cache_path)
+            print("%-16s %2d processes: %2d /oauth/token calls, first token "
+                  "after %.1f ms on average, %.1f ms at most"
+                  % (name, processes, requests,
+                     sum(latencies) / len(latencies) * 1e3,
+                     max(latencies) * 1e3))
+            if cache_path:
+                # restarted workers find the cached token
+                requests, latencies = run(processes, cache_path)
+                print("%-16s %2d processes: %2d /oauth/token calls, first "
+                      "token after %.1f ms on average (restart)"
+                      % (name, processes, requests,
+                         sum(latencies) / len(latencies) * 1e3))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
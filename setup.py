@@ -22,6 +22,11 @@ VERSION = "1.0.7"
 # http://pypi.python.org/pypi/setuptools
 
 REQUIRES = ["urllib3 >= 1.15", "six >= 1.10", "certifi", "python-dateutil"]
+EXTRAS_REQUIRE = {
+    "asyncio": ["aiohttp >= 3.0"],
+    "http2": ["httpx[http2] >= 0.26"],
+    "orjson": ["orjson >= 3.0"],
+}
 
 setup(
     name=NAME,
@@ -32,7 +37,8 @@ setup(
     url="https://github.com/Telstra/MessagingAPI-SDK-python",
     keywords=["OpenAPI", "OpenAPI-Generator", "Telstra Messaging API"],
     install_requires=REQUIRES,
-    packages=find_packages(exclude=["test", "tests"]),
+    extras_require=EXTRAS_REQUIRE,
+    packages=find_packages(exclude=["test", "tests", "benchmarks"]),
     include_package_data=True,
     license="MIT",
     long_description="""\
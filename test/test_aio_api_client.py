@@ -0,0 +1,125 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import unittest
+
+try:
+    import asyncio
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    import Telstra_Messaging.aio
+except ImportError:  # pragma: no cover
+    web = None
+
+import Telstra_Messaging
+from Telstra_Messaging.rest import ApiException
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncApiClient(unittest.TestCase):
+    """AsyncApiClient unit test stubs"""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.requests = []
+        self.health_checks = []
+
+        async def send_sms(request):
+            self.requests.append((request.headers, await request.json()))
+            return web.json_response({
+                'messages': [{'to': '+61412345678',
+                              'deliveryStatus': 'MessageWaiting',
+                              'messageId': 'abc123',
+                              'messageStatusURL': 'https://x/status'}],
+                'messageType': 'SMS',
+                'numberSegments': 1,
+            }, status=201)
+
+        async def get_sms_status(request):
+            return web.json_response([{
+                'to': '+61412345678',
+                'deliveryStatus': 'DELIVRD',
+            }])
+
+        async def retrieve_sms_replies(request):
+            return web.json_response({'status': 'EMPTY'}, status=401)
+
+        async def sms_health_check(request):
+            self.health_checks.append(request)
+            # overlap the warming requests
+            await asyncio.sleep(0.05)
+            return web.json_response({'status': 'up'})
+
+        app = web.Application()
+        app.router.add_post('/messages/sms', send_sms)
+        app.router.add_get('/messages/sms/{messageId}/status', get_sms_status)
+        app.router.add_get('/messages/sms', retrieve_sms_replies)
+        app.router.add_get('/messages/sms/healthcheck', sms_health_check)
+        self.server = TestServer(app, loop=self.loop)
+        self.loop.run_until_complete(self.server.start_server())
+
+        configuration = Telstra_Messaging.Configuration(
+            host=str(self.server.make_url('')).rstrip('/'))
+        configuration.access_token = 'token'
+        self.client = Telstra_Messaging.aio.AsyncApiClient(configuration)
+        self.api = Telstra_Messaging.aio.MessagingApi(self.client)
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.client.close())
+        self.loop.run_until_complete(self.server.close())
+        self.loop.close()
+
+    def test_send_sms(self):
+        payload = Telstra_Messaging.SendSMSRequest(
+            to='+61412345678', body='Hello')
+        result = self.loop.run_until_complete(self.api.send_sms(payload))
+        self.assertIsInstance(result, Telstra_Messaging.MessageSentResponseSms)
+        self.assertEqual(result.messages[0].message_id, 'abc123')
+        headers, body = self.requests[0]
+        self.assertEqual(body, {'to': '+61412345678', 'body': 'Hello'})
+        self.assertEqual(headers['Authorization'], 'Bearer token')
+
+    def test_get_sms_status_concurrently(self):
+        async def poll():
+            return await asyncio.gather(*[
+                self.api.get_sms_status('id%d' % i) for i in range(20)])
+        results = self.loop.run_until_complete(poll())
+        self.assertEqual(len(results), 20)
+        self.assertEqual(results[0][0].delivery_status, 'DELIVRD')
+
+    def test_error_response(self):
+        with self.assertRaises(ApiException) as ctx:
+            self.loop.run_until_complete(self.api.retrieve_sms_replies())
+        self.assertEqual(ctx.exception.status, 401)
+        self.assertEqual(json.loads(ctx.exception.body), {'status': 'EMPTY'})
+
+    def test_warm_up(self):
+        self.assertEqual(self.loop.run_until_complete(
+            self.client.warm_up(3)), 3)
+        self.assertEqual(len(self.health_checks), 3)
+        # the warm connections are reused
+        self.assertEqual(self.loop.run_until_complete(
+            self.client.warm_up(3)), 0)
+        self.loop.run_until_complete(self.api.get_sms_status('id'))
+        self.assertEqual(self.client.rest_client.connections_opened, 3)
+
+    def test_warm_up_capped_at_pool_size(self):
+        self.assertEqual(self.loop.run_until_complete(
+            self.client.warm_up(10)), self.client.rest_client.maxsize)
+
+
+if __name__ == '__main__':
+    unittest.main()
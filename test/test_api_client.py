@@ -0,0 +1,116 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import unittest
+
+import Telstra_Messaging
+from Telstra_Messaging.api_client import DefaultHeaders
+from Telstra_Messaging.transport import InMemoryTransport
+
+
+class TestHeaderSets(unittest.TestCase):
+    """ApiClient header set unit test stubs"""
+
+    def setUp(self):
+        self.transport = InMemoryTransport()
+        self.transport.add_response('GET', '/status', 200, [])
+        self.transport.add_response('POST', '/messages/sms', 201, {})
+        configuration = Telstra_Messaging.Configuration()
+        configuration.access_token = 'token'
+        self.api_client = Telstra_Messaging.ApiClient(
+            configuration, transport=self.transport)
+        self.api = Telstra_Messaging.MessagingApi(self.api_client)
+
+    def headers(self):
+        return self.transport.requests[-1].headers
+
+    def test_headers(self):
+        self.api.get_sms_status('id')
+        headers = self.headers()
+        self.assertEqual(headers['Accept'], 'application/json')
+        self.assertEqual(headers['User-Agent'],
+                         'OpenAPI-Generator/1.0.7/python')
+        self.assertEqual(headers['Authorization'], 'Bearer token')
+        self.api.send_sms({'to': '+61412345678', 'body': 'Hi'},
+                          _response_mode='dict')
+        self.assertEqual(self.headers()['Content-Type'], 'application/json')
+        headers = self.api_client._prepare_request(
+            '/messages/sms/healthcheck', 'GET',
+            header_params={'Accept': 'application/json'},
+            auth_settings=[])[2]
+        self.assertNotIn('Authorization', headers)
+        self.assertEqual(len(self.api_client._header_sets), 3)
+
+    def test_cached(self):
+        self.api.get_sms_status('id')
+        entry = self.api_client._header_sets.copy()
+        self.api.get_sms_status('id')
+        self.assertEqual(self.api_client._header_sets, entry)
+        # requests get their own copy
+        self.assertIsNot(self.transport.requests[0].headers,
+                         self.transport.requests[1].headers)
+
+    def test_access_token_changes(self):
+        self.api.get_sms_status('id')
+        self.api_client.configuration.access_token = 'other'
+        self.api.get_sms_status('id')
+        self.assertEqual(self.headers()['Authorization'], 'Bearer other')
+
+    def test_default_headers_change(self):
+        self.api.get_sms_status('id')
+        self.api_client.set_default_header('X-Tenant', 'a')
+        self.api.get_sms_status('id')
+        self.assertEqual(self.headers()['X-Tenant'], 'a')
+        self.api_client.default_headers['X-Tenant'] = 'b'
+        self.api.get_sms_status('id')
+        self.assertEqual(self.headers()['X-Tenant'], 'b')
+        del self.api_client.default_headers['X-Tenant']
+        self.api.get_sms_status('id')
+        self.assertNotIn('X-Tenant', self.headers())
+        self.api_client.default_headers = {'X-Other': 'c'}
+        self.assertIsInstance(self.api_client.default_headers,
+                              DefaultHeaders)
+        self.api.get_sms_status('id')
+        self.assertEqual(self.headers()['X-Other'], 'c')
+        self.assertNotIn('User-Agent', self.headers())
+
+    def test_cookie_changes(self):
+        self.api.get_sms_status('id')
+        self.api_client.cookie = 'session=1'
+        self.api.get_sms_status('id')
+        self.assertEqual(self.headers()['Cookie'], 'session=1')
+
+    def test_uncacheable_headers(self):
+        headers, _ = self.api_client._prepare_request(
+            '/messages/sms', 'GET', header_params={'X-Count': 2},
+            auth_settings=['auth'])[2:4]
+        self.assertEqual(headers['X-Count'], 2)
+        self.assertEqual(headers['Authorization'], 'Bearer token')
+        self.assertEqual(self.api_client._header_sets, {})
+
+    def test_default_headers_version(self):
+        headers = DefaultHeaders(a='1')
+        for change in [lambda: headers.__setitem__('b', '2'),
+                       lambda: headers.update(c='3'),
+                       lambda: headers.setdefault('d', '4'),
+                       lambda: headers.pop('d'),
+                       lambda: headers.popitem(),
+                       lambda: headers.clear()]:
+            version = headers.version
+            change()
+            self.assertNotEqual(headers.version, version)
+
+
+if __name__ == '__main__':
+    unittest.main()
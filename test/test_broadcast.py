@@ -0,0 +1,95 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import unittest
+
+import Telstra_Messaging
+from Telstra_Messaging.broadcast import SmsBroadcast
+from Telstra_Messaging.codec import StdlibJsonCodec
+from Telstra_Messaging.exceptions import ApiValueError
+from Telstra_Messaging.transport import InMemoryTransport
+
+SENT = {'messages': [{'to': '+61412345678', 'deliveryStatus': 'Sent',
+                      'messageId': 'abc'}],
+        'messageType': 'SMS', 'numberSegments': 1}
+
+
+class TestSmsBroadcast(unittest.TestCase):
+    """SmsBroadcast unit test stubs"""
+
+    def setUp(self):
+        self.transport = InMemoryTransport()
+        self.transport.add_response('POST', '/messages/sms', 201, SENT)
+        self.transport.add_response('POST', '/messages/sms/multi', 201, SENT)
+        configuration = Telstra_Messaging.Configuration()
+        configuration.access_token = 'token'
+        self.api_client = Telstra_Messaging.ApiClient(
+            configuration, transport=self.transport)
+        self.api = Telstra_Messaging.MessagingApi(self.api_client)
+
+    def message(self, **kwargs):
+        return Telstra_Messaging.SendSMSRequest(to='', body=u'Hello ☃',
+                                                **kwargs)
+
+    def test_same_body_as_send_sms(self):
+        for codec in (StdlibJsonCodec(), self.api_client.configuration
+                      .json_codec):
+            self.api_client.configuration.json_codec = codec
+            message = self.message(validity=60, priority=False,
+                                   notify_url='https://example.com/')
+            body = SmsBroadcast(self.api, message).sms_body('+61412345678')
+            message.to = '+61412345678'
+            self.assertEqual(
+                json.loads(body.decode('utf8')),
+                self.api_client.sanitize_for_serialization(message))
+
+    def test_send(self):
+        broadcast = SmsBroadcast(self.api, self.message())
+        results = list(broadcast.send(['+61412345678', '+61487654321']))
+        self.assertEqual([to for to, _ in results],
+                         ['+61412345678', '+61487654321'])
+        self.assertIsInstance(results[0][1],
+                              Telstra_Messaging.MessageSentResponseSms)
+        self.assertEqual([r.json() for r in self.transport.requests], [
+            {'to': '+61412345678', 'body': u'Hello ☃'},
+            {'to': '+61487654321', 'body': u'Hello ☃'}])
+        self.assertEqual(self.transport.requests[0].headers['Authorization'],
+                         'Bearer token')
+
+    def test_send_multiple(self):
+        broadcast = SmsBroadcast(
+            self.api, self.message(notify_url='https://example.com/'),
+            receipt_off=True)
+        recipients = ['+614%08d' % i for i in range(12)]
+        chunks = [chunk for chunk, _ in broadcast.send_multiple(recipients)]
+        self.assertEqual(chunks, [recipients[:10], recipients[10:]])
+        self.assertEqual(self.transport.requests[1].json(), {
+            'smsMulti': [{'to': to, 'body': u'Hello ☃',
+                          'receiptOff': True} for to in recipients[10:]],
+            'notifyURL': 'https://example.com/'})
+
+        broadcast = SmsBroadcast(self.api, {'body': 'Hi'})
+        list(broadcast.send_multiple(recipients[:1]))
+        self.assertEqual(self.transport.requests[-1].json(), {
+            'smsMulti': [{'to': recipients[0], 'body': 'Hi'}]})
+
+    def test_send_multiple_unsupported_fields(self):
+        broadcast = SmsBroadcast(self.api, self.message(validity=60))
+        with self.assertRaises(ApiValueError):
+            list(broadcast.send_multiple(['+61412345678']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import threading
+import time
+import unittest
+
+import Telstra_Messaging
+from Telstra_Messaging.bulk import BulkSmsDispatcher
+from Telstra_Messaging.credential_pool import CredentialPool
+from Telstra_Messaging.transport import InMemoryTransport, TransportResponse
+
+
+class MultiSmsServer(object):
+    """Accepts `send_multiple_sms` requests, tracking the requests in
+    flight."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.bodies = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail = set()
+        self.drop = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        headers = {'Content-Type': 'application/json'}
+        if request.path.endswith('/oauth/token'):
+            return TransportResponse(200, 'OK', headers, json.dumps({
+                'access_token': 'token', 'token_type': 'Bearer',
+                'expires_in': '3599'}).encode('utf8'))
+        body = request.json()
+        with self._lock:
+            self.bodies.append(body)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        recipients = [entry['to'] for entry in body['smsMulti']]
+        if recipients[0] in self.fail:
+            return TransportResponse(500, None, {}, b'')
+        return TransportResponse(201, None, headers, json.dumps({
+            'messages': [{'to': to, 'deliveryStatus': 'MessageWaiting',
+                          'messageId': 'id-' + to}
+                         for to in recipients if to not in self.drop],
+            'messageType': 'SMS',
+            'numberSegments': len(recipients)}).encode('utf8'))
+
+
+class TestBulkSmsDispatcher(unittest.TestCase):
+    """BulkSmsDispatcher unit test stubs"""
+
+    def setUp(self):
+        self.server = MultiSmsServer()
+        configuration = Telstra_Messaging.Configuration()
+        configuration.access_token = 'token'
+        self.api_client = Telstra_Messaging.ApiClient(
+            configuration, transport=InMemoryTransport(self.server))
+        self.api = Telstra_Messaging.MessagingApi(self.api_client)
+
+    def messages(self, count):
+        return (('+614%08d' % i, 'Message %d' % i) for i in range(count))
+
+    def test_batches(self):
+        dispatcher = BulkSmsDispatcher(self.api)
+        results = list(dispatcher.dispatch(
+            self.messages(25), notify_url='https://example.com/notify'))
+        self.assertEqual([len(body['smsMulti'])
+                          for body in self.server.bodies], [10, 10, 5])
+        self.assertEqual(self.server.bodies[0]['notifyURL'],
+                         'https://example.com/notify')
+        self.assertEqual(self.server.bodies[0]['smsMulti'][1],
+                         {'to': '+61400000001', 'body': 'Message 1'})
+        self.assertEqual(len(results), 25)
+        for i, result in enumerate(results):
+            self.assertTrue(result.ok)
+            self.assertEqual(result.request[0], '+614%08d' % i)
+            self.assertEqual(result.message.message_id, 'id-+614%08d' % i)
+        self.assertEqual(dispatcher.stats.sent, 25)
+        self.assertEqual(dispatcher.stats.requests, 3)
+        self.assertGreater(dispatcher.stats.messages_per_second(), 0)
+
+    def test_options(self):
+        list(BulkSmsDispatcher(self.api, batch_size=2).dispatch([
+            ('+61412345678', 'Hi', {'receipt_off': True}),
+            ('+61412345679', 'Hi')]))
+        self.assertEqual(self.server.bodies[0]['smsMulti'][0],
+                         {'to': '+61412345678', 'body': 'Hi',
+                          'receiptOff': True})
+
+    def test_malformed_messages(self):
+        self.server.delay = 0.01
+        messages = list(self.messages(25))
+        messages[3] = ('+61412345678', 'Hi', {'priority': True})
+        messages[12] = ('+61412345678',)
+        messages[20:] = [None] * 5
+        dispatcher = BulkSmsDispatcher(self.api)
+        results = list(dispatcher.dispatch(messages))
+        self.assertEqual([index for index, result in enumerate(results)
+                          if not result.ok], [3, 12, 20, 21, 22, 23, 24])
+        for index in (3, 12, 20):
+            self.assertIsInstance(results[index].error,
+                                  Telstra_Messaging.ApiValueError)
+        self.assertEqual(results[4].message.to, '+61400000004')
+        # the other messages are sent, a batch of only malformed items is not
+        self.assertEqual([len(body['smsMulti'])
+                          for body in self.server.bodies], [9, 9])
+        self.assertEqual(dispatcher.stats.sent, 18)
+        self.assertEqual(dispatcher.stats.failed, 7)
+        self.assertEqual(dispatcher.stats.requests, 2)
+
+    def test_bounded_in_flight(self):
+        self.server.delay = 0.02
+        dispatcher = BulkSmsDispatcher(self.api, max_in_flight=3)
+        self.assertEqual(len(list(dispatcher.dispatch(self.messages(200)))),
+                         200)
+        self.assertEqual(self.server.max_in_flight, 3)
+
+    def test_streams_input(self):
+        consumed = []
+
+        def messages():
+            for item in self.messages(1000):
+                consumed.append(item)
+                yield item
+        results = BulkSmsDispatcher(self.api, max_in_flight=2).dispatch(
+            messages())
+        next(results)
+        # the batches in flight and the one waiting for a slot
+        self.assertLessEqual(len(consumed), 30)
+        results.close()
+
+    def test_failed_request(self):
+        self.server.fail.add('+61400000010')
+        dispatcher = BulkSmsDispatcher(self.api)
+        results = list(dispatcher.dispatch(self.messages(25)))
+        self.assertEqual([result.ok for result in results],
+                         [True] * 10 + [False] * 10 + [True] * 5)
+        self.assertEqual(results[10].error.status, 500)
+        self.assertEqual(dispatcher.stats.failed, 10)
+        self.assertEqual(dispatcher.stats.sent, 15)
+
+    def test_missing_message(self):
+        self.server.drop.add('+61400000001')
+        results = list(BulkSmsDispatcher(self.api).dispatch(
+            self.messages(3)))
+        self.assertEqual([result.message and result.message.to
+                          for result in results],
+                         ['+61400000000', None, '+61400000002'])
+
+    def test_dict_response_mode(self):
+        results = list(BulkSmsDispatcher(self.api).dispatch(
+            self.messages(2), _response_mode='dict'))
+        self.assertEqual(results[1].message['message_id'], 'id-+61400000001')
+
+    def test_credential_pool(self):
+        pool = CredentialPool([('a', 'x'), ('b', 'y')],
+                              transport=InMemoryTransport(self.server))
+        results = list(BulkSmsDispatcher(pool).dispatch(self.messages(40)))
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual([stats['sent'] for stats in pool.stats()],
+                         [20, 20])
+
+    def test_invalid_settings(self):
+        with self.assertRaises(Telstra_Messaging.ApiValueError):
+            BulkSmsDispatcher(self.api, batch_size=11)
+        with self.assertRaises(Telstra_Messaging.ApiValueError):
+            BulkSmsDispatcher(self.api, max_in_flight=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
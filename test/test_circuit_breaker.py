@@ -0,0 +1,97 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import unittest
+
+import Telstra_Messaging
+from Telstra_Messaging.circuit_breaker import (CLOSED, HALF_OPEN, OPEN,
+                                               CircuitBreakerRegistry)
+from Telstra_Messaging.exceptions import CircuitOpenException
+from Telstra_Messaging.rest import ApiException
+from Telstra_Messaging.transport import InMemoryTransport, TransportResponse
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """CircuitBreakerRegistry unit test stubs"""
+
+    def setUp(self):
+        self.now = 0.0
+        self.breakers = CircuitBreakerRegistry(failure_threshold=3,
+                                               recovery_timeout=10.0)
+        self.breakers.clock = lambda: self.now
+        configuration = Telstra_Messaging.Configuration()
+        configuration.circuit_breakers = self.breakers
+        self.status, self.body = 503, {}
+        self.transport = InMemoryTransport(lambda request: TransportResponse(
+            self.status, None, {}, json.dumps(self.body).encode('utf8')))
+        self.api_client = Telstra_Messaging.ApiClient(
+            configuration, transport=self.transport)
+        self.api = Telstra_Messaging.MessagingApi(self.api_client)
+
+    def fail(self, times):
+        for _ in range(times):
+            with self.assertRaises(ApiException):
+                self.api.retrieve_sms_replies()
+
+    def test_opens_after_threshold(self):
+        self.fail(3)
+        self.assertEqual(self.breakers.state('GET', '/messages/sms'), OPEN)
+        with self.assertRaises(CircuitOpenException) as ctx:
+            self.api.retrieve_sms_replies()
+        self.assertEqual(ctx.exception.retry_after, 10.0)
+        self.assertEqual(len(self.transport.requests), 3)
+        # other operations are not affected
+        self.assertEqual(self.breakers.state('POST', '/messages/sms'), CLOSED)
+
+    def test_half_open_probe_closes(self):
+        self.fail(3)
+        self.now = 10.0
+        self.assertEqual(self.breakers.state('GET', '/messages/sms'),
+                         HALF_OPEN)
+        self.status, self.body = 200, {'status': 'EMPTY'}
+        self.api.retrieve_sms_replies()
+        self.assertEqual(self.breakers.state('GET', '/messages/sms'), CLOSED)
+
+    def test_half_open_probe_failure_reopens(self):
+        self.fail(3)
+        self.now = 10.0
+        self.fail(1)
+        self.assertEqual(self.breakers.state('GET', '/messages/sms'), OPEN)
+        self.assertEqual(self.breakers.retry_after('GET', '/messages/sms'),
+                         10.0)
+
+    def test_client_errors_are_not_failures(self):
+        self.status = 400
+        self.fail(5)
+        self.assertEqual(self.breakers.state('GET', '/messages/sms'), CLOSED)
+
+    def test_errors_without_status_are_failures(self):
+        for status in (None, 0):
+            self.assertTrue(self.breakers.is_failure(
+                ApiException(status=status, reason='connection reset')))
+        self.assertFalse(self.breakers.is_failure(ApiException(status=404)))
+
+    def test_seed_from_health_check(self):
+        self.status, self.body = 200, {'status': 'down'}
+        healthy = self.breakers.seed_from_health_check(self.api)
+        self.assertEqual(healthy, {'sms': False, 'mms': False})
+        self.assertEqual(self.breakers.state('POST', '/messages/sms/multi'),
+                         OPEN)
+        self.assertEqual(
+            self.breakers.snapshot()[('GET', '/messages/mms')], OPEN)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import unittest
+
+import Telstra_Messaging
+from Telstra_Messaging import codec
+from Telstra_Messaging.transport import InMemoryTransport
+
+
+class RecordingCodec(codec.StdlibJsonCodec):
+
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append('dumps')
+        return super(RecordingCodec, self).dumps(obj)
+
+    def loads(self, data):
+        self.calls.append('loads')
+        return super(RecordingCodec, self).loads(data)
+
+
+class TestJsonCodec(unittest.TestCase):
+    """JsonCodec unit test stubs"""
+
+    def check_round_trip(self, json_codec):
+        document = {'to': u'+61412345678', 'body': u'café',
+                    'validity': 60, 'priority': False, 'tags': None}
+        data = json_codec.dumps(document)
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(json_codec.loads(data), document)
+        self.assertEqual(json_codec.loads(data.decode('utf8')), document)
+        with self.assertRaises(ValueError):
+            json_codec.loads(b'not json')
+
+    def test_stdlib(self):
+        self.check_round_trip(codec.StdlibJsonCodec())
+
+    @unittest.skipIf(codec.orjson is None, "orjson is not installed")
+    def test_orjson(self):
+        self.check_round_trip(codec.OrjsonCodec())
+        self.assertIsInstance(Telstra_Messaging.Configuration().json_codec,
+                              codec.OrjsonCodec)
+
+    def test_default_codec(self):
+        expected = (codec.StdlibJsonCodec if codec.orjson is None
+                    else codec.OrjsonCodec)
+        self.assertIsInstance(codec.default_codec(), expected)
+
+    def test_used_by_api_client(self):
+        transport = InMemoryTransport()
+        transport.add_response('POST', '/messages/sms', 201, {
+            'messages': [{'to': '+61412345678', 'deliveryStatus': 'Sent',
+                          'messageId': 'abc'}],
+            'messageType': 'SMS', 'numberSegments': 1})
+        configuration = Telstra_Messaging.Configuration()
+        configuration.json_codec = RecordingCodec()
+        api_client = Telstra_Messaging.ApiClient(configuration,
+                                                 transport=transport)
+        api = Telstra_Messaging.MessagingApi(api_client)
+        result = api.send_sms(Telstra_Messaging.SendSMSRequest(
+            to='+61412345678', body='Hello'))
+        self.assertEqual(result.messages[0].message_id, 'abc')
+        self.assertEqual(configuration.json_codec.calls, ['dumps', 'loads'])
+
+        payload = api_client.deserialize_payload(
+            b'{"status": "RECEIVED", "senderAddress": "+61487654321", '
+            b'"message": "Hi"}', 'InboundPollResponse')
+        self.assertEqual(payload.message, 'Hi')
+        self.assertEqual(payload.sender_address, '+61487654321')
+        self.assertEqual(len(configuration.json_codec.calls), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import pickle
+import unittest
+
+import Telstra_Messaging
+from Telstra_Messaging import compact
+from Telstra_Messaging.transport import InMemoryTransport
+
+SENT = {
+    'messages': [{'to': '+61412345678', 'deliveryStatus': 'MessageWaiting',
+                  'messageId': 'abc',
+                  'messageStatusURL': 'https://example.com/abc/status'}],
+    'country': [{'AUS': 1}], 'messageType': 'SMS', 'numberSegments': 1}
+
+
+class TestCompactModels(unittest.TestCase):
+    """Compact model unit test stubs"""
+
+    def setUp(self):
+        self.transport = InMemoryTransport()
+        self.transport.add_response('POST', '/messages/sms', 201, SENT)
+        self.transport.add_response('GET', '/status', 200, [
+            {'to': '+61412345678', 'deliveryStatus': 'DELIVRD',
+             'sentTimestamp': '2017-03-17T10:05:22+10:00'}])
+        self.configuration = Telstra_Messaging.Configuration()
+        self.configuration.access_token = 'token'
+        self.api = Telstra_Messaging.MessagingApi(Telstra_Messaging.ApiClient(
+            self.configuration, transport=self.transport))
+
+    def test_compact_class(self):
+        message = compact.Message(to='+61412345678', message_id='abc')
+        self.assertIs(compact.compact_class('Message'), compact.Message)
+        self.assertIs(compact.Message.model, Telstra_Messaging.Message)
+        self.assertEqual(compact.Message.attribute_map,
+                         Telstra_Messaging.Message.attribute_map)
+        self.assertFalse(hasattr(message, '__dict__'))
+        self.assertIsNone(message.delivery_status)
+        with self.assertRaises(AttributeError):
+            message.discriminator = None
+        with self.assertRaises(TypeError):
+            compact.Message(message_status='x')
+
+    def test_response_mode(self):
+        payload = Telstra_Messaging.SendSMSRequest(to='+61412345678',
+                                                   body='Hello')
+        expected = self.api.send_sms(payload)
+        self.configuration.response_mode = 'compact'
+        result = self.api.send_sms(payload)
+
+        self.assertIsInstance(result, compact.MessageSentResponseSms)
+        self.assertIsInstance(result.messages[0], compact.Message)
+        self.assertEqual(result.to_dict(), expected.to_dict())
+        self.assertEqual(result.to_model(), expected)
+        self.assertEqual(result, pickle.loads(pickle.dumps(result)))
+
+        status = self.api.get_sms_status('abc')
+        self.assertIsInstance(status[0], compact.OutboundPollResponse)
+        self.assertEqual(status[0].sent_timestamp,
+                         '2017-03-17T10:05:22+10:00')
+        self.assertIsNone(status[0].received_timestamp)
+
+    def test_serialization(self):
+        api_client = self.api.api_client
+        message = compact.MessageMulti(to='+61412345678', body='Hello')
+        self.assertEqual(api_client.sanitize_for_serialization(message),
+                         {'to': '+61412345678', 'body': 'Hello'})
+
+    def test_invalid_response_mode(self):
+        self.configuration.response_mode = 'unknown'
+        with self.assertRaises(ValueError):
+            self.api.get_sms_status('abc')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import unittest
+
+import Telstra_Messaging
+from Telstra_Messaging.configuration import Configuration
+
+
+class TestConfiguration(unittest.TestCase):
+    """Configuration unit test stubs"""
+
+    def setUp(self):
+        self.default = Configuration._default
+
+    def tearDown(self):
+        Configuration.set_default(self.default)
+
+    def test_get_default(self):
+        Configuration.set_default(None)
+        default = Configuration.get_default()
+        self.assertIsInstance(default, Configuration)
+        self.assertIs(Configuration.get_default(), default)
+        model = Telstra_Messaging.OutboundPollResponse()
+        self.assertIs(model.local_vars_configuration, default)
+
+    def test_set_default(self):
+        configuration = Configuration()
+        configuration.client_side_validation = False
+        Configuration.set_default(configuration)
+        # required fields are not validated any more
+        message = Telstra_Messaging.Message()
+        self.assertIs(message.local_vars_configuration, configuration)
+
+    def test_explicit_configuration(self):
+        configuration = Configuration()
+        model = Telstra_Messaging.OutboundPollResponse(
+            local_vars_configuration=configuration)
+        self.assertIs(model.local_vars_configuration, configuration)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,203 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import threading
+import unittest
+
+from six.moves.urllib.parse import parse_qs
+
+import Telstra_Messaging
+from Telstra_Messaging.broadcast import SmsBroadcast
+from Telstra_Messaging.credential_pool import (
+    Credential, CredentialPool, ROUND_ROBIN)
+from Telstra_Messaging.transport import InMemoryTransport, TransportResponse
+
+SENT = {'messages': [{'to': '+61412345678', 'deliveryStatus': 'MessageWaiting',
+                      'messageId': 'id', 'messageStatusURL': 'https://x'}],
+        'messageType': 'SMS', 'numberSegments': 1}
+
+
+def json_response(status, body):
+    return TransportResponse(status, None, {
+        'Content-Type': 'application/json'}, json.dumps(body).encode('utf8'))
+
+
+class Server(object):
+    """Issues `<client_id>-token` tokens and records which token sent each
+    message."""
+
+    def __init__(self):
+        self.senders = []
+        self.status = 201
+        self.gate = None
+
+    def __call__(self, request):
+        if request.path.endswith('/oauth/token'):
+            client_id = parse_qs(request.body.decode('utf8'))['client_id'][0]
+            return json_response(200, {'access_token': client_id + '-token',
+                                       'token_type': 'Bearer',
+                                       'expires_in': '3599'})
+        self.senders.append(request.headers['Authorization'][7:-6])
+        if self.gate is not None:
+            self.gate.wait()
+        return json_response(self.status, SENT)
+
+
+class TestCredentialPool(unittest.TestCase):
+    """CredentialPool unit test stubs"""
+
+    def setUp(self):
+        self.server = Server()
+        self.transport = InMemoryTransport(self.server)
+        self.payload = Telstra_Messaging.SendSMSRequest(to='+61412345678',
+                                                        body='Hello')
+
+    def make_pool(self, credentials, **kwargs):
+        return CredentialPool(credentials, transport=self.transport,
+                              **kwargs)
+
+    def test_clients(self):
+        pool = self.make_pool([('a', 'x'), ('b', 'y')])
+        first, second = pool.credentials
+        self.assertIsNot(first.api_client.configuration,
+                         second.api_client.configuration)
+        self.assertIs(first.api_client.rest_client.transport,
+                      second.api_client.rest_client.transport)
+        self.assertIs(pool.api_client, first.api_client)
+        with self.assertRaises(Telstra_Messaging.ApiValueError):
+            self.make_pool([])
+        with self.assertRaises(Telstra_Messaging.ApiValueError):
+            self.make_pool([('a', 'x')], strategy='random')
+
+    def test_shared_connections(self):
+        pool = CredentialPool([('a', 'x'), ('b', 'y')])
+        first, second = pool.credentials
+        self.assertIs(first.api_client.rest_client.pool_manager,
+                      second.api_client.rest_client.pool_manager)
+
+    def test_round_robin(self):
+        pool = self.make_pool([Credential('a', 'x', weight=2),
+                               Credential('b', 'y')], strategy=ROUND_ROBIN)
+        for _ in range(6):
+            pool.send_sms(self.payload)
+        self.assertEqual(self.server.senders, ['a', 'b', 'a'] * 2)
+        self.assertEqual([stats['sent'] for stats in pool.stats()], [4, 2])
+
+    def test_least_loaded(self):
+        pool = self.make_pool([('a', 'x'), ('b', 'y'), ('c', 'z')])
+        # the tokens are requested outside of the measured requests
+        for credential in pool.credentials:
+            credential.api_client.token_manager.get_token()
+        self.server.gate = threading.Event()
+        threads = [threading.Thread(target=pool.send_sms,
+                                    args=(self.payload,)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while len(self.server.senders) < 3:
+            threading.Event().wait(0.01)
+        self.assertEqual(sorted(self.server.senders), ['a', 'b', 'c'])
+        self.assertEqual([stats['in_flight'] for stats in pool.stats()],
+                         [1, 1, 1])
+        self.server.gate.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([stats['in_flight'] for stats in pool.stats()],
+                         [0, 0, 0])
+
+    def test_quota(self):
+        pool = self.make_pool([Credential('a', 'x', quota=2),
+                               Credential('b', 'y', quota=1)])
+        multi = Telstra_Messaging.SendSmsMultiRequest(sms_multi=[
+            Telstra_Messaging.MessageMulti(to='+6141234567%d' % i, body='Hi')
+            for i in range(2)])
+        pool.send_multiple_sms(multi)
+        pool.send_sms(self.payload)
+        self.assertEqual(self.server.senders, ['a', 'b'])
+        self.assertEqual([stats['remaining'] for stats in pool.stats()],
+                         [0, 0])
+        with self.assertRaises(Telstra_Messaging.QuotaExhaustedException) \
+                as ctx:
+            pool.send_sms(self.payload)
+        self.assertIsNone(ctx.exception.retry_after)
+        self.assertEqual(len(self.server.senders), 2)
+
+    def test_rejected_requests_keep_quota(self):
+        pool = self.make_pool([Credential('a', 'x', quota=1)])
+        self.server.status = 400
+        with self.assertRaises(Telstra_Messaging.ApiException):
+            pool.send_sms(self.payload)
+        self.assertEqual(pool.stats()[0]['remaining'], 1)
+        self.assertEqual(pool.stats()[0]['errors'], 1)
+        with self.assertRaises(Telstra_Messaging.ApiTypeError):
+            pool.send_sms(self.payload, unexpected=True)
+        self.assertEqual(pool.stats()[0]['remaining'], 1)
+        self.server.status = 201
+        pool.send_sms(self.payload)
+        self.assertEqual(pool.stats()[0]['remaining'], 0)
+
+    def test_server_errors_use_quota(self):
+        # the API may have accepted the message before failing
+        pool = self.make_pool([Credential('a', 'x', quota=1)])
+        self.server.status = 500
+        with self.assertRaises(Telstra_Messaging.ApiException):
+            pool.send_sms(self.payload)
+        self.assertEqual(pool.stats()[0]['remaining'], 0)
+        self.assertEqual(pool.stats()[0]['errors'], 1)
+
+    def test_quota_period(self):
+        now = [100.0]
+        pool = self.make_pool([Credential('a', 'x', quota=1)],
+                              quota_period=60)
+        pool.clock = lambda: now[0]
+        pool.credentials[0].period_start = now[0]
+        pool.send_sms(self.payload)
+        now[0] += 15
+        with self.assertRaises(Telstra_Messaging.QuotaExhaustedException) \
+                as ctx:
+            pool.send_sms(self.payload)
+        self.assertEqual(ctx.exception.retry_after, 45)
+        now[0] += 45
+        pool.send_sms(self.payload)
+        self.assertEqual(pool.stats()[0]['sent'], 2)
+
+    def test_recipients(self):
+        pool = self.make_pool([('a', 'x')])
+        pool.send_sms({'to': '+61412345678,+61412345679', 'body': 'Hi'})
+        self.assertEqual(pool.stats()[0]['sent'], 2)
+        pool.send_sms(json.dumps({'to': '+61412345678,+61412345679',
+                                  'body': 'Hi'}).encode('utf8'))
+        self.assertEqual(pool.stats()[0]['sent'], 4)
+        pool.send_multiple_sms(json.dumps({'smsMulti': [
+            {'to': '+61412345678', 'body': 'Hi'},
+            {'to': '+61412345679,+61412345670', 'body': 'Hi'}]}))
+        self.assertEqual(pool.stats()[0]['sent'], 7)
+
+    def test_broadcast(self):
+        pool = self.make_pool([('a', 'x'), ('b', 'y')], strategy=ROUND_ROBIN)
+        message = Telstra_Messaging.SendSMSRequest(to='', body='Hello')
+        recipients = ['+6141234%04d' % i for i in range(15)]
+        results = list(SmsBroadcast(pool, message).send_multiple(recipients))
+        self.assertEqual(len(results), 2)
+        self.assertEqual(self.server.senders, ['a', 'b'])
+        self.assertEqual([stats['sent'] for stats in pool.stats()], [10, 5])
+
+    def test_async_req(self):
+        pool = self.make_pool([('a', 'x')])
+        with self.assertRaises(Telstra_Messaging.ApiValueError):
+            pool.send_sms(self.payload, async_req=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
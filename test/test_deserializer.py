@@ -0,0 +1,115 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import datetime
+import unittest
+
+import Telstra_Messaging
+from Telstra_Messaging.deserializer import PlanCache
+from Telstra_Messaging.rest import ApiException
+from Telstra_Messaging.transport import InMemoryTransport
+
+
+class TestPlanCache(unittest.TestCase):
+    """PlanCache unit test stubs"""
+
+    def setUp(self):
+        self.plans = PlanCache()
+
+    def test_list_of_models(self):
+        result = self.plans.decode([
+            {'to': '+61412345678', 'sentTimestamp': '2017-03-17T10:05:22',
+             'deliveryStatus': 'DELIVRD', 'unknown': 1},
+            None], 'list[OutboundPollResponse]')
+        self.assertIsInstance(result[0],
+                              Telstra_Messaging.OutboundPollResponse)
+        self.assertEqual(result[0].to, '+61412345678')
+        self.assertEqual(result[0].sent_timestamp, '2017-03-17T10:05:22')
+        self.assertIsNone(result[0].received_timestamp)
+        # enum models without attributes keep the raw value
+        self.assertEqual(result[0].delivery_status, 'DELIVRD')
+        self.assertIsNone(result[1])
+
+    def test_nested_models(self):
+        result = self.plans.decode({
+            'messages': [{'to': '+61412345678', 'deliveryStatus': 'Sent',
+                          'messageId': 'abc'}],
+            'messageType': 'SMS', 'numberSegments': 1},
+            'MessageSentResponseSms')
+        self.assertEqual(result.messages[0].message_id, 'abc')
+        self.assertEqual(result.number_segments, 1)
+
+    def test_primitives(self):
+        self.assertEqual(self.plans.decode('1', 'int'), 1)
+        self.assertEqual(self.plans.decode(1, 'str'), '1')
+        self.assertEqual(self.plans.decode({'a': '2'}, 'dict(str, int)'),
+                         {'a': 2})
+        self.assertEqual(self.plans.decode([1, 'a'], 'object'), [1, 'a'])
+        self.assertEqual(self.plans.decode('2020-01-02', 'date'),
+                         datetime.date(2020, 1, 2))
+        self.assertEqual(self.plans.decode('2020-01-02T03:04:05', 'datetime'),
+                         datetime.datetime(2020, 1, 2, 3, 4, 5))
+        with self.assertRaises(ApiException):
+            self.plans.decode('not a date', 'datetime')
+
+    def test_models_share_default_configuration(self):
+        result = self.plans.decode([{'to': '+61412345678'}] * 3,
+                                   'list[OutboundPollResponse]')
+        default = Telstra_Messaging.Configuration.get_default()
+        for item in result:
+            self.assertIs(item.local_vars_configuration, default)
+
+    def test_dict_mode(self):
+        data = {'messages': [{'to': '+61412345678', 'deliveryStatus': 'Sent',
+                              'messageId': 'abc'}],
+                'messageType': 'SMS', 'numberSegments': '1'}
+        result = self.plans.decode(data, 'MessageSentResponseSms', 'dict')
+        expected = self.plans.decode(data, 'MessageSentResponseSms')
+        self.assertEqual(result, expected.to_dict())
+        self.assertEqual(result['number_segments'], 1)
+        self.assertIsNone(result['messages'][0]['message_status_url'])
+
+    def test_per_call_response_mode(self):
+        transport = InMemoryTransport()
+        transport.add_response('GET', '/status', 200, [
+            {'to': '+61412345678', 'deliveryStatus': 'DELIVRD'}])
+        api = Telstra_Messaging.MessagingApi(
+            Telstra_Messaging.ApiClient(transport=transport))
+        result = api.get_sms_status('abc', _response_mode='dict')
+        self.assertEqual(result, [{'to': '+61412345678',
+                                   'delivery_status': 'DELIVRD',
+                                   'sent_timestamp': None,
+                                   'received_timestamp': None}])
+        data, status, _ = api.get_sms_status_with_http_info(
+            'abc', _response_mode='dict')
+        self.assertEqual((data, status), (result, 200))
+        self.assertIsInstance(api.get_sms_status('abc')[0],
+                              Telstra_Messaging.OutboundPollResponse)
+
+    def test_plans_are_cached(self):
+        plan = self.plans.get('list[InboundPollResponse]')
+        self.assertIs(self.plans.get('list[InboundPollResponse]'), plan)
+        self.assertIn((Telstra_Messaging.InboundPollResponse, 'model', False),
+                      self.plans._plans)
+        self.plans.clear()
+        self.assertEqual(len(self.plans), 0)
+
+    def test_unknown_model(self):
+        with self.assertRaises(AttributeError):
+            self.plans.get('list[NoSuchModel]')
+        self.assertEqual(len(self.plans), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
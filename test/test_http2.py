@@ -0,0 +1,154 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import socket
+import threading
+import unittest
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+except ImportError:  # pragma: no cover
+    h2 = None
+
+import Telstra_Messaging
+from Telstra_Messaging import http2
+from Telstra_Messaging.rest import ApiException
+
+
+class H2StubServer(object):
+    """Minimal h2c (prior knowledge) server answering every request with
+    the JSON document returned by `handler(method, path, body)`."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.connections = 0
+        self.streams = []
+        self.sock = socket.socket()
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen(8)
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self._serve)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def close(self):
+        self.sock.close()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            t = threading.Thread(target=self._handle, args=(conn,))
+            t.daemon = True
+            t.start()
+
+    def _handle(self, conn):
+        h2conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False))
+        h2conn.initiate_connection()
+        conn.sendall(h2conn.data_to_send())
+        requests = {}
+        while True:
+            data = conn.recv(65535)
+            if not data:
+                break
+            for event in h2conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    requests[event.stream_id] = [dict(event.headers), b'']
+                elif isinstance(event, h2.events.DataReceived):
+                    requests[event.stream_id][1] += event.data
+                    h2conn.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    headers, body = requests.pop(event.stream_id)
+                    self.streams.append(event.stream_id)
+                    status, doc = self.handler(
+                        headers[b':method'].decode(),
+                        headers[b':path'].decode(), body)
+                    payload = json.dumps(doc).encode()
+                    h2conn.send_headers(event.stream_id, [
+                        (':status', str(status)),
+                        ('content-type', 'application/json'),
+                        ('content-length', str(len(payload))),
+                    ])
+                    h2conn.send_data(event.stream_id, payload,
+                                     end_stream=True)
+            conn.sendall(h2conn.data_to_send())
+        conn.close()
+
+
+@unittest.skipIf(h2 is None or not http2.is_available(),
+                 "httpx[http2] is not installed")
+class TestHTTP2(unittest.TestCase):
+    """HTTP/2 transport unit test stubs"""
+
+    def setUp(self):
+        def handler(method, path, body):
+            if path == '/messages/sms' and method == 'POST':
+                return 201, {'messages': [{'to': json.loads(body)['to'],
+                                           'deliveryStatus': 'MessageWaiting',
+                                           'messageId': 'abc'}],
+                             'messageType': 'SMS', 'numberSegments': 1,
+                             'country': []}
+            if path.endswith('/status'):
+                return 200, [{'to': '+61412345678',
+                              'deliveryStatus': 'DELIVRD'}]
+            return 404, {'status': 'not found'}
+
+        self.server = H2StubServer(handler)
+        configuration = Telstra_Messaging.Configuration(
+            host='http://127.0.0.1:%d' % self.server.port)
+        configuration.http2 = True
+        configuration.http2_prior_knowledge = True
+        self.api_client = Telstra_Messaging.ApiClient(configuration,
+                                                      pool_threads=8)
+        self.api = Telstra_Messaging.MessagingApi(self.api_client)
+
+    def tearDown(self):
+        self.api_client.rest_client.transport.close()
+        self.server.close()
+
+    def test_transport(self):
+        self.assertIsInstance(self.api_client.rest_client.transport,
+                              http2.HTTP2Transport)
+
+    def test_multiplexed_requests(self):
+        threads = [self.api.get_sms_status('id%d' % i, async_req=True)
+                   for i in range(32)]
+        results = [t.get() for t in threads]
+        self.assertEqual(results[0][0].delivery_status, 'DELIVRD')
+        self.assertEqual(len(self.server.streams), 32)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.api_client.last_response.urllib3_response
+                         .http_version, 'HTTP/2')
+
+    def test_send_sms(self):
+        result = self.api.send_sms(Telstra_Messaging.SendSMSRequest(
+            to='+61412345678', body='Hello'))
+        self.assertEqual(result.messages[0].to, '+61412345678')
+
+    def test_error_response(self):
+        with self.assertRaises(ApiException) as ctx:
+            self.api.retrieve_mms_replies()
+        self.assertEqual(ctx.exception.status, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import copy
+import pickle
+import unittest
+
+import Telstra_Messaging
+from Telstra_Messaging.deserializer import PlanCache
+
+REPLY = {'status': 'RECEIVED', 'destinationAddress': '+61412345678',
+         'senderAddress': '+61487654321', 'subject': 'Photos',
+         'messageId': 'abc', 'sentTimestamp': '2017-03-17T10:05:22+10:00',
+         'MMSContent': [{'type': 'image/jpeg', 'filename': 'a.jpg',
+                         'payload': 'AAAA'}]}
+
+
+class TestLazyModels(unittest.TestCase):
+    """Lazy model unit test stubs"""
+
+    def setUp(self):
+        self.plans = PlanCache()
+
+    def decode(self, data, response_type='GetMmsResponse'):
+        return (self.plans.decode(data, response_type, 'lazy'),
+                self.plans.decode(data, response_type))
+
+    def test_same_behaviour(self):
+        reply, expected = self.decode(REPLY)
+        self.assertIsInstance(reply, Telstra_Messaging.GetMmsResponse)
+        self.assertEqual(type(reply).__name__, 'GetMmsResponse')
+        self.assertEqual(reply.message_id, 'abc')
+        self.assertIsNone(reply.api_msg_id)
+        self.assertIsInstance(reply.mms_content[0],
+                              Telstra_Messaging.MMSContent)
+        self.assertEqual(reply, expected)
+        self.assertEqual(expected, reply)
+        self.assertEqual(reply.to_dict(), expected.to_dict())
+        self.assertEqual(repr(reply), repr(expected))
+
+    def test_fields_decoded_on_access(self):
+        reply, _ = self.decode(REPLY)
+        self.assertNotIn('_mms_content', vars(reply))
+        self.assertEqual(reply.status, 'RECEIVED')
+        self.assertNotIn('_mms_content', vars(reply))
+        content = reply.mms_content
+        self.assertIs(reply.mms_content, content)
+
+        reply.status = 'READ'
+        self.assertEqual(reply.status, 'READ')
+        with self.assertRaises(AttributeError):
+            reply.unknown
+
+    def test_required_fields_validated(self):
+        data = dict(REPLY)
+        del data['senderAddress']
+        with self.assertRaises(ValueError):
+            self.plans.decode(data, 'GetMmsResponse', 'lazy')
+
+    def test_copy_and_pickle(self):
+        reply, expected = self.decode(REPLY)
+        for clone in (pickle.loads(pickle.dumps(reply)), copy.copy(reply),
+                      copy.deepcopy(reply)):
+            self.assertIs(type(clone), Telstra_Messaging.GetMmsResponse)
+            self.assertEqual(clone, expected)
+        self.assertNotIn('_lazy_data', vars(reply))
+
+    def test_api_client(self):
+        configuration = Telstra_Messaging.Configuration()
+        configuration.response_mode = 'lazy'
+        api_client = Telstra_Messaging.ApiClient(configuration)
+        replies = api_client.deserialize_payload(
+            b'[{"status": "RECEIVED", "destinationAddress": "+61412345678",'
+            b' "senderAddress": "+61487654321", "sentTimestamp": "now",'
+            b' "MMSContent": []}]', 'list[GetMmsResponse]')
+        self.assertEqual(replies[0].sender_address, '+61487654321')
+        self.assertEqual(replies[0].mms_content, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
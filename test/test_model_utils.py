@@ -0,0 +1,87 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import unittest
+
+import Telstra_Messaging
+from Telstra_Messaging.deserializer import PlanCache
+from Telstra_Messaging.model_utils import field_values
+
+REPLY = {'status': 'RECEIVED', 'destinationAddress': '+61412345678',
+         'senderAddress': '+61487654321', 'messageId': 'abc',
+         'sentTimestamp': '2017-03-17T10:05:22+10:00',
+         'MMSContent': [{'type': 'text/plain', 'filename': 'a.txt',
+                         'payload': 'SGk='}]}
+
+
+class TestModelEquality(unittest.TestCase):
+    """Model equality and hashing unit test stubs"""
+
+    def setUp(self):
+        self.plans = PlanCache()
+
+    def test_field_values(self):
+        status = Telstra_Messaging.OutboundPollResponse(
+            to='+61412345678', delivery_status='DELIVRD')
+        self.assertEqual(field_values(status),
+                         ('+61412345678', None, None, 'DELIVRD'))
+        self.assertEqual(field_values(Telstra_Messaging.Status()), ())
+
+    def test_equality(self):
+        first = self.plans.decode(REPLY, 'GetMmsResponse')
+        second = self.plans.decode(REPLY, 'GetMmsResponse')
+        self.assertEqual(first, second)
+        self.assertFalse(first != second)
+        self.assertEqual(hash(first), hash(second))
+
+        second.mms_content[0].payload = 'SGVsbG8='
+        self.assertNotEqual(first, second)
+        self.assertNotEqual(first, first.to_dict())
+
+    def test_dedupe(self):
+        replies = self.plans.decode([
+            {'messageId': 'a', 'message': 'Yes'},
+            {'messageId': 'b', 'message': 'No'},
+            {'messageId': 'a', 'message': 'Yes'}], 'list[InboundPollResponse]')
+        self.assertEqual(len(set(replies)), 2)
+        seen = {replies[0]: 1}
+        self.assertIn(replies[2], seen)
+
+    def test_other_representations(self):
+        eager = self.plans.decode(REPLY, 'GetMmsResponse')
+        lazy = self.plans.decode(REPLY, 'GetMmsResponse', 'lazy')
+        self.assertEqual(lazy, eager)
+        self.assertEqual(hash(lazy), hash(eager))
+
+        first = self.plans.decode(REPLY, 'GetMmsResponse', 'compact')
+        second = self.plans.decode(REPLY, 'GetMmsResponse', 'compact')
+        self.assertEqual(first, second)
+        self.assertEqual(len({first, second}), 1)
+        self.assertNotEqual(first, eager)
+        self.assertEqual(first.to_model(), eager)
+
+    def test_list_fields(self):
+        sent = Telstra_Messaging.MessageSentResponseSms(
+            messages=[Telstra_Messaging.Message(to='1', delivery_status='a',
+                                                message_id='m')],
+            country=[{'AUS': 1}], message_type='SMS', number_segments=1)
+        other = Telstra_Messaging.MessageSentResponseSms(
+            messages=list(sent.messages), country=[{'AUS': 1}],
+            message_type='SMS', number_segments=1)
+        self.assertEqual(hash(sent), hash(other))
+        self.assertEqual(sent, other)
+
+
+if __name__ == '__main__':
+    unittest.main()
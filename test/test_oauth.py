@@ -0,0 +1,351 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import threading
+import time
+import unittest
+import zlib
+
+try:
+    import asyncio
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    import Telstra_Messaging.aio
+    from Telstra_Messaging.aio.oauth import AsyncTokenManager
+except ImportError:  # pragma: no cover
+    web = None
+
+import Telstra_Messaging
+from Telstra_Messaging.oauth import Token, TokenManager
+from Telstra_Messaging.transport import InMemoryTransport, TransportResponse
+
+STATUS = [{'to': '+61412345678', 'deliveryStatus': 'DELIVRD'}]
+
+
+class TokenServer(object):
+    """Issues `token-<n>` tokens, taking `delay` seconds per token."""
+
+    def __init__(self, delay=0.0, expires_in=3600):
+        self.delay = delay
+        self.expires_in = expires_in
+        self.issued = 0
+        self.fail = False
+        self.revoked = set()
+        self.authorizations = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        if request.path.endswith('/oauth/token'):
+            time.sleep(self.delay)
+            if self.fail:
+                return TransportResponse(503, 'Unavailable', {}, b'')
+            with self._lock:
+                self.issued += 1
+                body = {'access_token': 'token-%d' % self.issued,
+                        'token_type': 'Bearer',
+                        'expires_in': str(self.expires_in)}
+            return TransportResponse(200, 'OK', {
+                'Content-Type': 'application/json'}, json.dumps(body).encode())
+        self.authorizations.append(request.headers.get('Authorization'))
+        if request.headers.get('Authorization') in self.revoked:
+            return TransportResponse(401, 'Unauthorized', {}, b'')
+        return TransportResponse(200, 'OK', {
+            'Content-Type': 'application/json'}, json.dumps(STATUS).encode())
+
+
+class TestTokenManager(unittest.TestCase):
+    """TokenManager unit test stubs"""
+
+    def setUp(self):
+        self.server = TokenServer()
+        self.transport = InMemoryTransport(self.server)
+        self.api_client = Telstra_Messaging.ApiClient(transport=self.transport)
+        self.manager = TokenManager('id', 'secret', refresh_margin=300,
+                                    min_validity=30)
+        self.manager.attach(self.api_client)
+        self.now = 1000000.0
+        self.manager.clock = lambda: self.now
+        self.api = Telstra_Messaging.MessagingApi(self.api_client)
+
+    def test_token_on_first_request(self):
+        self.api.get_sms_status('id')
+        self.api.get_sms_status('id')
+        self.assertEqual(self.server.issued, 1)
+        self.assertEqual(self.server.authorizations,
+                         ['Bearer token-1', 'Bearer token-1'])
+        self.assertEqual(self.api_client.configuration.access_token,
+                         'token-1')
+        self.assertEqual(self.manager.token.expires_at, self.now + 3600)
+        form = self.transport.requests[0].body
+        self.assertIn(b'client_id=id', form)
+        self.assertIn(b'scope=NSMS', form)
+
+    def test_unauthenticated_operations(self):
+        self.api.sms_health_check()
+        self.assertEqual(self.server.issued, 0)
+
+    def test_background_refresh(self):
+        self.api.get_sms_status('id')
+        self.now += 3600 - 200
+        self.server.delay = 0.2
+        self.api.get_sms_status('id')
+        # served with the current token while the refresh is running
+        self.assertEqual(self.server.authorizations[-1], 'Bearer token-1')
+        self.manager._background.join()
+        self.api.get_sms_status('id')
+        self.assertEqual(self.server.authorizations[-1], 'Bearer token-2')
+        self.assertEqual(self.server.issued, 2)
+
+    def test_background_refresh_failure(self):
+        self.api.get_sms_status('id')
+        self.now += 3600 - 200
+        self.server.fail = True
+        self.api.get_sms_status('id')
+        self.manager._background.join()
+        self.assertIsNone(self.manager._background)
+        # not retried before retry_interval
+        self.api.get_sms_status('id')
+        self.assertIsNone(self.manager._background)
+        self.assertEqual(self.server.authorizations[-1], 'Bearer token-1')
+
+    def test_single_flight(self):
+        self.server.delay = 0.1
+        threads = [threading.Thread(target=self.api.get_sms_status,
+                                    args=('id',)) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.server.issued, 1)
+        self.assertEqual(set(self.server.authorizations), {'Bearer token-1'})
+
+    def test_expired_token_waits(self):
+        self.api.get_sms_status('id')
+        self.now += 3600 - 10
+        self.api.get_sms_status('id')
+        self.assertEqual(self.server.authorizations[-1], 'Bearer token-2')
+
+    def test_refresh(self):
+        first = self.manager.get_token()
+        second = self.manager.refresh(first.access_token)
+        self.assertEqual(second.access_token, 'token-2')
+        # reporting the replaced token does not request another one
+        self.assertIs(self.manager.refresh(first.access_token), second)
+        self.assertEqual(self.manager.refresh().access_token, 'token-3')
+
+    def test_rejected_token(self):
+        self.api.get_sms_status('id')
+        self.server.revoked.add('Bearer token-1')
+        self.assertEqual(self.api.get_sms_status('id')[0].to,
+                         '+61412345678')
+        self.assertEqual(self.server.authorizations[-2:],
+                         ['Bearer token-1', 'Bearer token-2'])
+        self.assertEqual(self.server.issued, 2)
+
+    def test_rejected_token_replayed_once(self):
+        self.api.get_sms_status('id')
+        self.server.revoked.update(['Bearer token-1', 'Bearer token-2'])
+        with self.assertRaises(Telstra_Messaging.ApiException) as ctx:
+            self.api.get_sms_status('id')
+        self.assertEqual(ctx.exception.status, 401)
+        self.assertEqual(len(self.server.authorizations), 3)
+        self.assertEqual(self.server.issued, 2)
+
+    def test_rejected_tokens_coalesce(self):
+        self.api.get_sms_status('id')
+        self.server.revoked.add('Bearer token-1')
+        self.server.delay = 0.1
+        errors = []
+
+        def poll():
+            try:
+                self.api.get_sms_status('id')
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+        threads = [threading.Thread(target=poll) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.server.issued, 2)
+        self.assertEqual(self.server.authorizations.count('Bearer token-2'),
+                         10)
+
+    def test_rejected_token_compressed_body(self):
+        self.api_client.configuration.request_compression = True
+        self.api_client.configuration.request_compression_threshold = 0
+        self.api.get_sms_status('id')
+        self.server.revoked.add('Bearer token-1')
+        self.api.send_sms(Telstra_Messaging.SendSMSRequest(
+            to='+61412345678', body='Hello world'), _preload_content=False)
+        first, replay = [request for request in self.transport.requests
+                         if request.path.endswith('/messages/sms')]
+        self.assertEqual(replay.headers['Authorization'], 'Bearer token-2')
+        for request in (first, replay):
+            self.assertEqual(request.headers['Content-Encoding'], 'gzip')
+            body = zlib.decompress(request.body, 16 + zlib.MAX_WBITS)
+            self.assertEqual(json.loads(body.decode('utf8'))['to'],
+                             '+61412345678')
+
+    def test_rejected_without_manager(self):
+        api_client = Telstra_Messaging.ApiClient(transport=self.transport)
+        api_client.configuration.access_token = 'token-1'
+        self.server.revoked.add('Bearer token-1')
+        with self.assertRaises(Telstra_Messaging.ApiException):
+            Telstra_Messaging.MessagingApi(api_client).get_sms_status('id')
+        self.assertEqual(self.server.issued, 0)
+
+    @unittest.skipIf(web is None, "aiohttp is not installed")
+    def test_attach_async_client(self):
+        loop = asyncio.new_event_loop()
+        try:
+            api_client = Telstra_Messaging.aio.AsyncApiClient()
+            with self.assertRaises(Telstra_Messaging.ApiTypeError):
+                TokenManager('id', 'secret').attach(api_client)
+            self.assertIsNone(api_client.token_manager)
+            with self.assertRaises(Telstra_Messaging.ApiTypeError):
+                AsyncTokenManager('id', 'secret').attach(self.api_client)
+            self.assertIs(self.api_client.token_manager, self.manager)
+            loop.run_until_complete(api_client.close())
+        finally:
+            loop.close()
+
+    def test_not_attached(self):
+        with self.assertRaises(ValueError):
+            TokenManager('id', 'secret').get_token()
+
+    def test_token(self):
+        token = Token('abc', 10.0)
+        self.assertEqual(token.authorization, 'Bearer abc')
+        self.assertNotIn('abc', repr(token))
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncTokenManager(unittest.TestCase):
+    """AsyncTokenManager unit test stubs"""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.issued = 0
+        self.authorizations = []
+
+        async def auth_token(request):
+            await asyncio.sleep(0.05)
+            self.issued += 1
+            return web.json_response({
+                'access_token': 'token-%d' % self.issued,
+                'token_type': 'Bearer', 'expires_in': '3599'})
+
+        async def get_sms_status(request):
+            self.authorizations.append(request.headers.get('Authorization'))
+            return web.json_response(STATUS)
+
+        app = web.Application()
+        app.router.add_post('/oauth/token', auth_token)
+        app.router.add_get('/messages/sms/{messageId}/status', get_sms_status)
+        self.server = TestServer(app, loop=self.loop)
+        self.loop.run_until_complete(self.server.start_server())
+
+        configuration = Telstra_Messaging.Configuration(
+            host=str(self.server.make_url('')).rstrip('/'))
+        self.client = Telstra_Messaging.aio.AsyncApiClient(configuration)
+        self.manager = AsyncTokenManager('id', 'secret')
+        self.manager.attach(self.client)
+        self.api = Telstra_Messaging.aio.MessagingApi(self.client)
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.client.close())
+        self.loop.run_until_complete(self.server.close())
+        self.loop.close()
+
+    def test_single_flight(self):
+        async def poll():
+            return await asyncio.gather(*[
+                self.api.get_sms_status('id%d' % i) for i in range(20)])
+        self.loop.run_until_complete(poll())
+        self.assertEqual(self.issued, 1)
+        self.assertEqual(set(self.authorizations), {'Bearer token-1'})
+
+    def test_background_refresh(self):
+        self.loop.run_until_complete(self.api.get_sms_status('id'))
+        self.manager.clock = lambda: time.time() + 3599 - 200
+
+        async def poll():
+            await self.api.get_sms_status('id')
+            self.assertEqual(self.authorizations[-1], 'Bearer token-1')
+            await self.manager._task
+            await self.api.get_sms_status('id')
+        self.loop.run_until_complete(poll())
+        self.assertEqual(self.authorizations[-1], 'Bearer token-2')
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncTokenRejection(unittest.TestCase):
+    """AsyncApiClient 401 replay unit test stubs"""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.issued = 0
+        self.rejected = 0
+        self.authorizations = []
+
+        async def auth_token(request):
+            await asyncio.sleep(0.05)
+            self.issued += 1
+            return web.json_response({
+                'access_token': 'token-%d' % self.issued,
+                'token_type': 'Bearer', 'expires_in': '3599'})
+
+        async def get_sms_status(request):
+            # the first token is revoked
+            if request.headers.get('Authorization') == 'Bearer token-1':
+                self.rejected += 1
+                return web.json_response({}, status=401)
+            self.authorizations.append(request.headers.get('Authorization'))
+            return web.json_response(STATUS)
+
+        app = web.Application()
+        app.router.add_post('/oauth/token', auth_token)
+        app.router.add_get('/messages/sms/{messageId}/status', get_sms_status)
+        self.server = TestServer(app, loop=self.loop)
+        self.loop.run_until_complete(self.server.start_server())
+
+        configuration = Telstra_Messaging.Configuration(
+            host=str(self.server.make_url('')).rstrip('/'))
+        self.client = Telstra_Messaging.aio.AsyncApiClient(configuration)
+        AsyncTokenManager('id', 'secret').attach(self.client)
+        self.api = Telstra_Messaging.aio.MessagingApi(self.client)
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.client.close())
+        self.loop.run_until_complete(self.server.close())
+        self.loop.close()
+
+    def test_rejected_tokens_coalesce(self):
+        async def poll():
+            return await asyncio.gather(*[
+                self.api.get_sms_status('id%d' % i) for i in range(20)])
+        results = self.loop.run_until_complete(poll())
+        self.assertEqual(len(results), 20)
+        self.assertEqual(self.issued, 2)
+        # the rejected requests share the second token
+        self.assertEqual(self.rejected, 20)
+        self.assertEqual(self.authorizations, ['Bearer token-2'] * 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import unittest
+import zlib
+
+import Telstra_Messaging
+from Telstra_Messaging.transport import InMemoryTransport
+
+
+SENT = {'messages': [{'to': '+61412345678', 'deliveryStatus': 'Sent',
+                      'messageId': 'abc'}],
+        'messageType': 'SMS', 'numberSegments': 1}
+
+
+class TestRequestCompression(unittest.TestCase):
+    """RequestCompression unit test stubs"""
+
+    def setUp(self):
+        self.transport = InMemoryTransport()
+        self.transport.add_response('POST', '/messages/sms/multi', 201, SENT,
+                                    headers={'Content-Encoding': 'gzip'})
+        self.configuration = Telstra_Messaging.Configuration()
+        self.configuration.request_compression = True
+        self.configuration.request_compression_threshold = 512
+        self.api_client = Telstra_Messaging.ApiClient(
+            self.configuration, transport=self.transport)
+        self.api = Telstra_Messaging.MessagingApi(self.api_client)
+
+    def send(self, count):
+        self.api.send_multiple_sms(Telstra_Messaging.SendSmsMultiRequest(
+            sms_multi=[Telstra_Messaging.MessageMulti(
+                to='+614123456%02d' % i, body='Campaign message body')
+                for i in range(count)]))
+        return self.transport.requests[-1]
+
+    def test_compresses_large_bodies(self):
+        request = self.send(10)
+        self.assertEqual(request.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(request.headers['Accept-Encoding'], 'gzip')
+        body = json.loads(zlib.decompress(request.body, 16 + zlib.MAX_WBITS))
+        self.assertEqual(len(body['smsMulti']), 10)
+
+        stats = self.api_client.rest_client.compression_stats
+        self.assertEqual(stats.requests_compressed, 1)
+        self.assertEqual(stats.request_bytes_sent, len(request.body))
+        self.assertGreater(stats.request_bytes_saved, 0)
+        self.assertEqual(stats.responses_compressed, 1)
+
+    def test_skips_small_bodies(self):
+        request = self.send(1)
+        self.assertNotIn('Content-Encoding', request.headers)
+        stats = self.api_client.rest_client.compression_stats
+        self.assertEqual(stats.requests, 1)
+        self.assertEqual(stats.requests_compressed, 0)
+        self.assertEqual(stats.request_bytes_saved, 0)
+
+    def test_disabled(self):
+        self.configuration.request_compression = False
+        self.configuration.response_compression = False
+        request = self.send(10)
+        self.assertNotIn('Content-Encoding', request.headers)
+        self.assertNotIn('Accept-Encoding', request.headers)
+        self.assertEqual(len(request.json()['smsMulti']), 10)
+
+    def test_caller_headers_unchanged(self):
+        headers = {'Content-Type': 'application/json'}
+        body = json.dumps({'body': 'x' * 1024}).encode('utf8')
+        for _ in range(2):
+            self.api_client.rest_client.request(
+                'POST', self.configuration.host + '/messages/sms/multi',
+                headers=headers, body=body)
+            self.assertEqual(self.transport.requests[-1].headers[
+                'Content-Encoding'], 'gzip')
+        self.assertEqual(headers, {'Content-Type': 'application/json'})
+
+
+class TestRESTResponse(unittest.TestCase):
+    """RESTResponse unit test stubs"""
+
+    def setUp(self):
+        self.transport = InMemoryTransport()
+        self.api_client = Telstra_Messaging.ApiClient(
+            transport=self.transport)
+        self.api = Telstra_Messaging.MessagingApi(self.api_client)
+
+    def test_json_is_parsed_from_bytes(self):
+        self.transport.add_response('GET', '/status', 200, [
+            {'to': '+61412345678', 'deliveryStatus': 'DELIVRD'}])
+        result = self.api.get_sms_status('abc')
+        self.assertEqual(result[0].to, '+61412345678')
+        response = self.api_client.last_response
+        self.assertIsInstance(response.raw_data, bytes)
+        self.assertIsNone(response._data)
+        self.assertEqual(json.loads(response.data)[0]['to'], '+61412345678')
+
+    def test_error_body_is_text(self):
+        self.transport.add_response('GET', '/status', 400,
+                                    {'status': '400', 'message': u'\u00e9'})
+        with self.assertRaises(Telstra_Messaging.ApiException) as ctx:
+            self.api.get_sms_status('abc')
+        self.assertEqual(json.loads(ctx.exception.body)['message'], u'\u00e9')
+
+
+if __name__ == '__main__':
+    unittest.main()
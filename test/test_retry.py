@@ -0,0 +1,181 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import unittest
+
+import urllib3
+
+import Telstra_Messaging
+from Telstra_Messaging.circuit_breaker import CircuitBreakerRegistry
+from Telstra_Messaging.exceptions import (
+    CircuitOpenException, QuotaExhaustedException)
+from Telstra_Messaging.retry import RetryPolicy
+from Telstra_Messaging.rest import ApiException
+from Telstra_Messaging.transport import InMemoryTransport, TransportResponse
+
+
+def replay(*responses):
+    """Transport handler serving canned (status, headers, body) responses;
+    a body that is an exception is raised instead."""
+    responses = list(responses)
+
+    def handler(request):
+        status, headers, body = responses.pop(0)
+        if isinstance(body, Exception):
+            raise body
+        return TransportResponse(status, None, headers,
+                                 json.dumps(body).encode('utf8'))
+    return handler
+
+
+STATUS = [{'to': '+61412345678', 'deliveryStatus': 'DELIVRD'}]
+SENT = {'messages': [{'to': '+61412345678', 'deliveryStatus': 'Sent',
+                      'messageId': 'abc'}],
+        'messageType': 'SMS', 'numberSegments': 1}
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """RetryPolicy unit test stubs"""
+
+    def setUp(self):
+        self.sleeps = []
+        self.policy = RetryPolicy(max_attempts=3, backoff_base=0.1,
+                                  backoff_cap=1.0, deadline=30.0)
+        self.policy.sleep = self.sleeps.append
+        configuration = Telstra_Messaging.Configuration()
+        configuration.retry_policy = self.policy
+        self.transport = InMemoryTransport()
+        self.api_client = Telstra_Messaging.ApiClient(
+            configuration, transport=self.transport)
+        self.api = Telstra_Messaging.MessagingApi(self.api_client)
+
+    def fake(self, *responses):
+        self.transport.handler = replay(*responses)
+        return self.transport
+
+    def test_retries_get_on_503(self):
+        fake = self.fake((503, {}, {}), (200, {}, STATUS))
+        result = self.api.get_sms_status('abc')
+        self.assertEqual(result[0].delivery_status, 'DELIVRD')
+        self.assertEqual(len(fake.requests), 2)
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertTrue(0.1 <= self.sleeps[0] <= 1.0)
+
+    def test_honors_retry_after(self):
+        self.policy.backoff_cap = 10.0
+        self.fake((429, {'Retry-After': '7'}, {}), (200, {}, STATUS))
+        self.api.get_sms_status('abc')
+        self.assertGreaterEqual(self.sleeps[0], 7.0)
+
+    def test_gives_up_after_max_attempts(self):
+        fake = self.fake((503, {}, {}), (503, {}, {}), (503, {}, {}))
+        with self.assertRaises(ApiException) as ctx:
+            self.api.get_sms_status('abc')
+        self.assertEqual(ctx.exception.status, 503)
+        self.assertEqual(len(fake.requests), 3)
+
+    def test_respects_deadline(self):
+        self.policy.deadline = 5.0
+        fake = self.fake((429, {'Retry-After': '60'}, {}))
+        with self.assertRaises(ApiException):
+            self.api.get_sms_status('abc')
+        self.assertEqual(len(fake.requests), 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_does_not_retry_client_errors(self):
+        fake = self.fake((400, {}, {}))
+        with self.assertRaises(ApiException):
+            self.api.get_sms_status('abc')
+        self.assertEqual(len(fake.requests), 1)
+
+    def test_does_not_replay_post(self):
+        fake = self.fake((503, {}, {}))
+        with self.assertRaises(ApiException):
+            self.api.send_sms(Telstra_Messaging.SendSMSRequest(
+                to='+61412345678', body='Hello'))
+        self.assertEqual(len(fake.requests), 1)
+
+    def test_replays_post_with_idempotency_key(self):
+        self.api_client.set_default_header('Idempotency-Key', 'k1')
+        fake = self.fake((503, {}, {}), (201, {}, SENT))
+        result = self.api.send_sms(Telstra_Messaging.SendSMSRequest(
+            to='+61412345678', body='Hello'))
+        self.assertEqual(result.messages[0].message_id, 'abc')
+        self.assertEqual(len(fake.requests), 2)
+
+    def test_per_call_idempotency_key(self):
+        fake = self.fake((503, {}, {}), (201, {}, SENT), (201, {}, SENT))
+        for key in ('k1', 'k2'):
+            self.api.send_sms(Telstra_Messaging.SendSMSRequest(
+                to='+61412345678', body='Hello'),
+                _headers={'Idempotency-Key': key})
+        self.assertEqual([request.headers['Idempotency-Key']
+                          for request in fake.requests], ['k1', 'k1', 'k2'])
+        self.assertNotIn('Idempotency-Key', self.api_client.default_headers)
+        # per-call headers are not part of the cached header sets
+        self.assertEqual(len(self.api_client._header_sets), 1)
+
+    def test_replays_listed_operation_on_connection_error(self):
+        self.policy.idempotent_operations = frozenset(
+            [('POST', '/messages/sms')])
+        error = urllib3.exceptions.ProtocolError('connection reset')
+        fake = self.fake((0, {}, error), (201, {}, SENT))
+        self.api.send_sms(Telstra_Messaging.SendSMSRequest(
+            to='+61412345678', body='Hello'))
+        self.assertEqual(len(fake.requests), 2)
+
+    def test_errors_without_status_are_not_retried(self):
+        for status in (None, 0):
+            self.assertFalse(self.policy.is_retryable(
+                ApiException(status=status, reason='certificate failed')))
+        self.assertFalse(self.policy.is_retryable(
+            CircuitOpenException('GET', '/messages/sms')))
+        self.assertFalse(self.policy.is_retryable(QuotaExhaustedException()))
+        self.assertFalse(self.policy.is_retryable(ApiException(status=400)))
+
+    def test_open_circuit_is_not_retried(self):
+        breakers = CircuitBreakerRegistry(failure_threshold=1)
+        self.api_client.configuration.circuit_breakers = breakers
+        fake = self.fake((503, {}, {}))
+        with self.assertRaises(CircuitOpenException):
+            self.api.sms_health_check()
+        # the 503 opened the breaker, its replay failed fast
+        self.assertEqual(len(fake.requests), 1)
+        self.assertEqual(len(self.sleeps), 1)
+
+        del self.sleeps[:]
+        with self.assertRaises(CircuitOpenException):
+            self.api.sms_health_check()
+        self.assertEqual(self.sleeps, [])
+        self.assertEqual(len(fake.requests), 1)
+
+    def test_unprepared_request_is_not_retried(self):
+        fake = self.fake()
+        with self.assertRaises(ApiException) as ctx:
+            self.api_client.call_api('/messages/sms', 'PUT', body={'to': 1},
+                                     header_params={'Content-Type': 'text/x'})
+        self.assertEqual(ctx.exception.status, 0)
+        self.assertEqual(self.sleeps, [])
+        self.assertEqual(len(fake.requests), 0)
+
+    def test_decorrelated_jitter_is_bounded(self):
+        delay = None
+        for _ in range(50):
+            delay = self.policy.backoff(delay)
+            self.assertTrue(0.1 <= delay <= 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
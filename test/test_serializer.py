@@ -0,0 +1,85 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import datetime
+import unittest
+
+import Telstra_Messaging
+from Telstra_Messaging import compact
+from Telstra_Messaging.serializer import SerializerCache
+
+
+class Legacy(object):
+    """Model-like object without class level type information."""
+
+    def __init__(self):
+        self.openapi_types = {'value': 'str', 'missing': 'str'}
+        self.attribute_map = {'value': 'theValue', 'missing': 'missing'}
+        self.value = 'v'
+        self.missing = None
+
+
+class TestSerializerCache(unittest.TestCase):
+    """SerializerCache unit test stubs"""
+
+    def setUp(self):
+        self.serializers = SerializerCache()
+
+    def test_nested_models(self):
+        payload = Telstra_Messaging.SendSmsMultiRequest(
+            sms_multi=[Telstra_Messaging.MessageMulti(to='+61412345678',
+                                                      body='Hello',
+                                                      receipt_off=False),
+                       Telstra_Messaging.MessageMulti(to='+61487654321')],
+            notify_url='https://example.com/notify/')
+        self.assertEqual(self.serializers.serialize(payload), {
+            'smsMulti': [{'to': '+61412345678', 'body': 'Hello',
+                          'receiptOff': False},
+                         {'to': '+61487654321'}],
+            'notifyURL': 'https://example.com/notify/'})
+        self.assertIn(Telstra_Messaging.MessageMulti,
+                      self.serializers._serializers)
+
+    def test_single_attribute_model(self):
+        response = Telstra_Messaging.HealthCheckResponse()
+        self.assertEqual(self.serializers.serialize(response), {})
+        response.status = 'up'
+        self.assertEqual(self.serializers.serialize(response),
+                         {'status': 'up'})
+
+    def test_values(self):
+        self.assertIsNone(self.serializers.serialize(None))
+        self.assertEqual(self.serializers.serialize(
+            (1, u'a', datetime.date(2020, 1, 2),
+             {'when': datetime.datetime(2020, 1, 2, 3, 4, 5)})),
+            (1, u'a', '2020-01-02', {'when': '2020-01-02T03:04:05'}))
+
+    def test_compact_models(self):
+        message = compact.MessageMulti(to='+61412345678', body='Hello')
+        self.assertEqual(self.serializers.serialize([message]),
+                         [{'to': '+61412345678', 'body': 'Hello'}])
+
+    def test_reflective_fallback(self):
+        self.assertEqual(self.serializers.serialize(Legacy()),
+                         {'theValue': 'v'})
+
+    def test_api_client(self):
+        api_client = Telstra_Messaging.ApiClient()
+        self.assertEqual(api_client.sanitize_for_serialization(
+            Telstra_Messaging.MessageMulti(to='+61412345678')),
+            {'to': '+61412345678'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import datetime
+import unittest
+
+from dateutil.parser import parse
+
+import Telstra_Messaging
+from Telstra_Messaging import deserializer
+from Telstra_Messaging import timestamps
+from Telstra_Messaging.transport import InMemoryTransport
+
+
+class TestParseIso8601(unittest.TestCase):
+    """parse_iso8601 unit test stubs"""
+
+    def test_matches_dateutil(self):
+        for string in ['2017-03-17T10:05:22+10:00',
+                       '2017-03-17T10:05:22.123+10:00',
+                       '2017-03-17T10:05:22.1234567-0530',
+                       '2017-03-17T10:05:22Z',
+                       '2017-03-17 10:05:22+00:00',
+                       '2017-03-17T10:05+10',
+                       '2017-03-17T10:05:22']:
+            self.assertEqual(timestamps.parse_iso8601(string), parse(string),
+                             string)
+
+    def test_timezone_aware(self):
+        value = timestamps.parse_iso8601('2017-03-17T10:05:22+10:00')
+        self.assertEqual(value.utcoffset(), datetime.timedelta(hours=10))
+        self.assertIs(timestamps.parse_iso8601('2017-03-17T00:00:00Z').tzinfo,
+                      timestamps.UTC)
+
+    def test_fallback(self):
+        self.assertEqual(timestamps.parse_iso8601('17 March 2017 10:05'),
+                         datetime.datetime(2017, 3, 17, 10, 5))
+        with self.assertRaises(ValueError):
+            timestamps.parse_iso8601('not a timestamp')
+        with self.assertRaises(ValueError):
+            timestamps.parse_iso8601('2017-13-17T10:05:22Z')
+
+    def test_naive_without_offset(self):
+        self.assertIsNone(
+            timestamps.parse_iso8601('2017-03-17T10:05:22').tzinfo)
+
+    def test_trailing_newline(self):
+        self.assertIsNone(timestamps._ISO_8601.match('2017-03-17T10:05:22Z\n'))
+
+
+class TestTimestampCache(unittest.TestCase):
+    """TimestampCache unit test stubs"""
+
+    def test_cache(self):
+        cache = timestamps.TimestampCache(maxsize=2)
+        value = cache.parse('2017-03-17T10:05:22+10:00')
+        self.assertIs(cache.parse('2017-03-17T10:05:22+10:00'), value)
+        cache.parse('2017-03-17T10:05:23+10:00')
+        self.assertEqual(len(cache), 2)
+        cache.parse('2017-03-17T10:05:24+10:00')
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestTypedTimestamps(unittest.TestCase):
+    """Configuration.typed_timestamps unit test stubs"""
+
+    report = {'to': '+61412345678',
+              'sentTimestamp': '2017-03-17T10:05:22+10:00',
+              'receivedTimestamp': '2017-03-17T10:05:25.5+10:00',
+              'deliveryStatus': 'DELIVRD', 'messageId': 'id'}
+
+    def make_api(self, typed_timestamps, response_mode='model'):
+        transport = InMemoryTransport()
+        transport.add_response('GET', '/status', 200, [self.report])
+        configuration = Telstra_Messaging.Configuration()
+        configuration.access_token = 'token'
+        configuration.typed_timestamps = typed_timestamps
+        configuration.response_mode = response_mode
+        api_client = Telstra_Messaging.ApiClient(configuration,
+                                                 transport=transport)
+        return Telstra_Messaging.MessagingApi(api_client)
+
+    def test_disabled_by_default(self):
+        self.assertFalse(Telstra_Messaging.Configuration().typed_timestamps)
+        response = self.make_api(False).get_sms_status('id')[0]
+        self.assertEqual(response.sent_timestamp, self.report['sentTimestamp'])
+
+    def test_typed_timestamps(self):
+        for mode in deserializer.RESPONSE_MODES:
+            response = self.make_api(True, mode).get_sms_status('id')[0]
+            if mode == deserializer.DICT:
+                sent = response['sent_timestamp']
+                received = response['received_timestamp']
+            else:
+                sent = response.sent_timestamp
+                received = response.received_timestamp
+            self.assertEqual(sent, parse(self.report['sentTimestamp']), mode)
+            self.assertEqual(received - sent,
+                             datetime.timedelta(seconds=3.5), mode)
+
+    def test_invalid_timestamp(self):
+        data = dict(self.report, sentTimestamp='not a timestamp')
+        plans = deserializer.PlanCache()
+        with self.assertRaises(Telstra_Messaging.ApiException):
+            plans.decode(data, 'OutboundPollResponse', typed_timestamps=True)
+        self.assertEqual(
+            plans.decode(data, 'OutboundPollResponse').sent_timestamp,
+            'not a timestamp')
+
+    def test_fields_exist(self):
+        for name, fields in timestamps.TIMESTAMP_FIELDS.items():
+            klass = getattr(Telstra_Messaging, name)
+            for attr in fields:
+                self.assertEqual(klass.openapi_types[attr], 'str')
+
+
+if __name__ == '__main__':
+    unittest.main()
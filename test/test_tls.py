@@ -0,0 +1,120 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import os
+import ssl
+import threading
+import unittest
+
+from six.moves import BaseHTTPServer, socketserver
+
+import Telstra_Messaging
+from Telstra_Messaging.transport import SessionCachingSSLContext
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+CERT_FILE = os.path.join(FIXTURES, 'localhost.crt')
+KEY_FILE = os.path.join(FIXTURES, 'localhost.key')
+
+
+class HealthCheckHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = json.dumps({'status': 'up'}).encode('utf8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TLSServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    connections = 0
+
+    def get_request(self):
+        sock, address = BaseHTTPServer.HTTPServer.get_request(self)
+        self.connections += 1
+        return self.ssl_context.wrap_socket(sock, server_side=True), address
+
+
+@unittest.skipUnless(hasattr(ssl.SSLSocket, 'session'),
+                     "TLS sessions require Python 3.6+")
+class TestTLSSessionReuse(unittest.TestCase):
+    """TLS session reuse and warm_up unit test stubs"""
+
+    def setUp(self):
+        self.server = TLSServer(('localhost', 0), HealthCheckHandler)
+        self.server.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.server.ssl_context.load_cert_chain(CERT_FILE, KEY_FILE)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        self.configuration = Telstra_Messaging.Configuration()
+        self.configuration.host = 'https://localhost:%d/v2' % \
+            self.server.server_address[1]
+        self.configuration.ssl_ca_cert = CERT_FILE
+        self.configuration.connection_pool_maxsize = 4
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def ssl_context(self, api_client):
+        pool_manager = api_client.rest_client.pool_manager
+        return pool_manager.connection_pool_kw['ssl_context']
+
+    def test_disabled_by_default(self):
+        api_client = Telstra_Messaging.ApiClient(self.configuration)
+        pool_manager = api_client.rest_client.pool_manager
+        self.assertNotIn('ssl_context', pool_manager.connection_pool_kw)
+
+    def test_warm_up_resumes_session(self):
+        self.configuration.tls_session_reuse = True
+        api_client = Telstra_Messaging.ApiClient(self.configuration)
+        context = self.ssl_context(api_client)
+        self.assertIsInstance(context, SessionCachingSSLContext)
+
+        self.assertEqual(api_client.warm_up(), 4)
+        self.assertEqual(self.server.connections, 4)
+        self.assertEqual(context.handshakes, 4)
+        self.assertEqual(context.sessions_reused, 3)
+
+        # warm connections are used without new handshakes
+        api = Telstra_Messaging.MessagingApi(api_client)
+        self.assertEqual(api.sms_health_check().status, 'up')
+        self.assertEqual(self.server.connections, 4)
+        # the connections are already open
+        self.assertEqual(api_client.warm_up(), 0)
+
+    def test_warm_up_capped_at_pool_size(self):
+        api_client = Telstra_Messaging.ApiClient(self.configuration)
+        self.assertEqual(api_client.warm_up(10), 4)
+        self.assertEqual(self.server.connections, 4)
+
+    def test_warm_up_failed_handshake(self):
+        # the client does not trust the certificate of the server
+        self.configuration.ssl_ca_cert = None
+        self.configuration.retries = False
+        api_client = Telstra_Messaging.ApiClient(self.configuration)
+        self.assertEqual(api_client.warm_up(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import time
+import unittest
+
+import Telstra_Messaging
+from Telstra_Messaging import token_cache
+from Telstra_Messaging.oauth import Token, TokenManager
+from Telstra_Messaging.transport import InMemoryTransport
+
+from test.test_oauth import TokenServer
+
+
+@unittest.skipIf(token_cache.fcntl is None, "fcntl is not available")
+class TestFileTokenCache(unittest.TestCase):
+    """FileTokenCache unit test stubs"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'tokens.json')
+        self.cache = token_cache.FileTokenCache(self.path)
+        self.server = TokenServer()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def make_manager(self, **kwargs):
+        api_client = Telstra_Messaging.ApiClient(
+            transport=InMemoryTransport(self.server))
+        manager = TokenManager('id', 'secret', cache=self.cache, **kwargs)
+        manager.attach(api_client)
+        return manager
+
+    def test_get_or_request(self):
+        self.assertIsNone(self.cache.load('key'))
+        token = self.cache.get_or_request('key', lambda token: True,
+                                          lambda: Token('abc', 10.0))
+        self.assertEqual(token.access_token, 'abc')
+        self.assertEqual(self.cache.load('key').expires_at, 10.0)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+        token = self.cache.get_or_request('key', lambda token: True,
+                                          self.fail)
+        self.assertEqual(token.access_token, 'abc')
+        token = self.cache.get_or_request('key', lambda token: False,
+                                          lambda: Token('def', 20.0))
+        self.assertEqual(self.cache.load('key').access_token, 'def')
+
+        self.cache.clear()
+        self.assertIsNone(self.cache.load('key'))
+        self.cache.clear()
+
+    def test_corrupt_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'{"key": {"access_tok')
+        self.assertIsNone(self.cache.load('key'))
+        self.cache.get_or_request('key', lambda token: True,
+                                  lambda: Token('abc', 10.0))
+        self.assertEqual(self.cache.load('key').access_token, 'abc')
+
+    def test_malformed_entries(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'{"key": {"access_token": "abc"}, "other": "x", '
+                    b'"third": {"access_token": "def", "expires_at": null}}')
+        self.assertIsNone(self.cache.load('key'))
+        token = self.cache.get_or_request('key', lambda token: True,
+                                          lambda: Token('ghi', 10.0))
+        self.assertEqual(token.access_token, 'ghi')
+        self.assertEqual(self.cache.load('key').access_token, 'ghi')
+
+    def test_managers_share_tokens(self):
+        first = self.make_manager()
+        second = self.make_manager()
+        self.assertEqual(first.get_token().access_token, 'token-1')
+        self.assertEqual(second.get_token().access_token, 'token-1')
+        self.assertEqual(self.server.issued, 1)
+        self.assertEqual(first.token_requests + second.token_requests, 1)
+
+    def test_concurrent_managers(self):
+        self.server.delay = 0.1
+        managers = [self.make_manager() for _ in range(8)]
+        threads = [threading.Thread(target=manager.get_token)
+                   for manager in managers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.server.issued, 1)
+        self.assertEqual({manager.token.access_token
+                          for manager in managers}, {'token-1'})
+
+    def test_replaced_token(self):
+        first = self.make_manager()
+        second = self.make_manager()
+        first.get_token()
+        second.get_token()
+        # the first manager replaces the revoked token, the second one picks
+        # up its replacement when told the same token is invalid
+        self.assertEqual(first.refresh('token-1').access_token, 'token-2')
+        self.assertEqual(second.refresh('token-1').access_token, 'token-2')
+        self.assertEqual(self.server.issued, 2)
+
+    def test_expiring_token(self):
+        first = self.make_manager()
+        first.get_token()
+        second = self.make_manager()
+        second.clock = lambda: time.time() + 3600 - 100
+        self.assertEqual(second.get_token().access_token, 'token-2')
+        self.assertEqual(self.cache.load(second.cache_key).access_token,
+                         'token-2')
+
+    def test_keys(self):
+        manager = self.make_manager()
+        manager.get_token()
+        other = self.make_manager()
+        other.scope = 'OTHER'
+        self.assertEqual(other.get_token().access_token, 'token-2')
+        self.assertEqual(self.cache.load(manager.cache_key).access_token,
+                         'token-1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+# coding: utf-8
+
+"""
+    Telstra Messaging API
+
+    No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)  # noqa: E501
+
+    The version of the OpenAPI document: 2.2.10
+    Generated by: https://openapi-generator.tech
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import threading
+import unittest
+
+from six.moves import BaseHTTPServer
+
+import Telstra_Messaging
+from Telstra_Messaging.rest import ApiException
+from Telstra_Messaging import transport
+from Telstra_Messaging.transport import (InMemoryTransport, PoolRegistry,
+                                         Urllib3Transport)
+
+
+class TestInMemoryTransport(unittest.TestCase):
+    """InMemoryTransport unit test stubs"""
+
+    def setUp(self):
+        self.transport = InMemoryTransport()
+        configuration = Telstra_Messaging.Configuration()
+        configuration.access_token = 'token'
+        self.api_client = Telstra_Messaging.ApiClient(
+            configuration, transport=self.transport)
+
+    def test_default_transport(self):
+        api_client = Telstra_Messaging.ApiClient()
+        self.assertIsInstance(api_client.rest_client.transport,
+                              Urllib3Transport)
+
+    def test_json_body(self):
+        self.transport.add_response('POST', '/messages/sms', 201, {
+            'messages': [{'to': '+61412345678', 'deliveryStatus': 'Sent',
+                          'messageId': 'abc'}],
+            'messageType': 'SMS', 'numberSegments': 1})
+        api = Telstra_Messaging.MessagingApi(self.api_client)
+        result = api.send_sms(Telstra_Messaging.SendSMSRequest(
+            to='+61412345678', body='Hello'))
+        self.assertEqual(result.messages[0].message_id, 'abc')
+        request = self.transport.requests[0]
+        self.assertEqual(request.url,
+                         'https://tapi.telstra.com/v2/messages/sms')
+        self.assertIsInstance(request.body, bytes)
+        self.assertEqual(request.json(),
+                         {'to': '+61412345678', 'body': 'Hello'})
+        self.assertEqual(request.headers['Authorization'], 'Bearer token')
+
+    def test_form_body(self):
+        self.transport.add_response('POST', '/oauth/token', 200, {
+            'access_token': 'abc', 'token_type': 'Bearer',
+            'expires_in': '3599'})
+        api = Telstra_Messaging.AuthenticationApi(self.api_client)
+        result = api.auth_token('id', 'secret', 'client_credentials')
+        self.assertEqual(result.access_token, 'abc')
+        self.assertEqual(
+            self.transport.requests[0].body,
+            b'client_id=id&client_secret=secret&grant_type=client_credentials')
+
+    def test_routes_are_served_in_order(self):
+        self.transport.add_response('GET', '/messages/sms', 503)
+        self.transport.add_response('GET', '/messages/sms', 200,
+                                    {'status': 'EMPTY'})
+        api = Telstra_Messaging.MessagingApi(self.api_client)
+        with self.assertRaises(ApiException) as ctx:
+            api.retrieve_sms_replies()
+        self.assertEqual(ctx.exception.status, 503)
+        self.assertEqual(api.retrieve_sms_replies().status, 'EMPTY')
+        self.assertEqual(api.retrieve_sms_replies().status, 'EMPTY')
+
+    def test_unknown_route(self):
+        api = Telstra_Messaging.MessagingApi(self.api_client)
+        with self.assertRaises(ApiException) as ctx:
+            api.get_sms_status('abc')
+        self.assertEqual(ctx.exception.status, 404)
+
+
+class TestPoolRegistry(unittest.TestCase):
+    """PoolRegistry unit test stubs"""
+
+    def setUp(self):
+        self.registry = PoolRegistry()
+        self.now = 0.0
+        self._monotonic = transport.monotonic
+        transport.monotonic = lambda: self.now
+
+    def tearDown(self):
+        transport.monotonic = self._monotonic
+        self.registry.clear()
+
+    def configuration(self, **kwargs):
+        configuration = Telstra_Messaging.Configuration()
+        configuration.share_connection_pool = True
+        for name, value in kwargs.items():
+            setattr(configuration, name, value)
+        return configuration
+
+    def test_pool_settings(self):
+        configuration = self.configuration(connection_pool_num_pools=2,
+                                           connection_pool_maxsize=8,
+                                           connection_pool_block=True)
+        pool_manager = Urllib3Transport(configuration,
+                                        registry=self.registry).pool_manager
+        self.assertEqual(pool_manager.pools._maxsize, 2)
+        self.assertEqual(pool_manager.connection_pool_kw['maxsize'], 8)
+        self.assertTrue(pool_manager.connection_pool_kw['block'])
+
+    def test_shared_between_clients(self):
+        first = Urllib3Transport(self.configuration(), registry=self.registry)
+        second = Urllib3Transport(self.configuration(),
+                                  registry=self.registry)
+        other = Urllib3Transport(self.configuration(verify_ssl=False),
+                                 registry=self.registry)
+        self.assertIs(first.pool_manager, second.pool_manager)
+        self.assertIsNot(first.pool_manager, other.pool_manager)
+        self.assertEqual(len(self.registry), 2)
+
+    def test_not_shared_by_default(self):
+        configuration = Telstra_Messaging.Configuration()
+        first = Urllib3Transport(configuration, registry=self.registry)
+        second = Urllib3Transport(configuration, registry=self.registry)
+        self.assertIsNot(first.pool_manager, second.pool_manager)
+        self.assertEqual(len(self.registry), 0)
+
+    def test_idle_eviction(self):
+        configuration = self.configuration(connection_pool_idle_timeout=60)
+        pool_manager = Urllib3Transport(configuration,
+                                        registry=self.registry).pool_manager
+        pool = pool_manager.connection_from_url('https://tapi.telstra.com')
+        self.now = 30.0
+        self.assertEqual(self.registry.evict_idle(), 0)
+        self.assertIs(pool_manager.connection_from_url(
+            'https://tapi.telstra.com'), pool)
+        self.now = 61.0
+        self.assertEqual(self.registry.evict_idle(), 1)
+        self.assertIsNot(pool_manager.connection_from_url(
+            'https://tapi.telstra.com'), pool)
+
+
+class EchoHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = json.dumps([{'to': self.path,
+                            'deliveryStatus': 'DELIVRD'}]).encode('utf8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestUrllib3Transport(unittest.TestCase):
+    """Urllib3Transport unit test stubs"""
+
+    def setUp(self):
+        self.server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), EchoHandler)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        configuration = Telstra_Messaging.Configuration(
+            host='http://127.0.0.1:%d' % self.server.server_port)
+        self.api = Telstra_Messaging.MessagingApi(
+            Telstra_Messaging.ApiClient(configuration))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_get(self):
+        result = self.api.get_sms_status('a b', _request_timeout=(5, 5))
+        self.assertEqual(result[0].to, '/messages/sms/a%20b/status')
+
+
+if __name__ == '__main__':
+    unittest.main()